@@ -1,8 +1,9 @@
 import tkinter as tk
 import tkinter.ttk as ttk
+import tkinter.font as tkfont
 from tkinter import messagebox, filedialog, Toplevel
 from tkinter.filedialog import asksaveasfilename, askdirectory
-from PIL import Image, ImageTk, ImageOps, ImageDraw, ImageEnhance, ImageGrab, ImageFilter, ImageChops
+from PIL import Image, ImageTk, ImageOps, ImageDraw, ImageGrab
 import os
 import math
 import numpy as np
@@ -13,11 +14,20 @@ import cv2
 from copy import deepcopy
 import platform
 import json
+import re
+import zlib
 import threading
 import queue
+import gc
 import colorsys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 
 
+IS_WINDOWS = platform.system() == "Windows"
+
 # DPI awareness on Windows: prevents blurriness on high-res displays.
 try:
     from ctypes import windll
@@ -37,6 +47,20 @@ except ImportError:
     ROOT_CLASS = tk.Tk
     DND_AVAILABLE = False
 
+# Optional model quantization: INT8 on CPU needs 'onnx', FP16 on GPU needs 'onnxconverter-common'.
+# Models are used at full precision when the converter is missing. Importing the converters costs ~0.1 s
+# and they only run when a model is first converted, so startup just checks they are installed.
+INT8_AVAILABLE = find_spec("onnx") is not None and find_spec("onnxruntime.quantization") is not None
+FP16_AVAILABLE = find_spec("onnx") is not None and find_spec("onnxconverter_common") is not None
+
+# Optional physical core count for ONNX Runtime thread pools. Falls back to half the logical cores (SMT).
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 # Constants
 DEFAULT_ZOOM_FACTOR = 1.2
 MAX_ZOOM_FACTOR = 50.0
@@ -50,6 +74,9 @@ else:
 print(f"Working directory: {SCRIPT_BASE_DIR}")
 MODEL_ROOT = os.path.join(SCRIPT_BASE_DIR, "Models/")
 CONFIG_FILE = os.path.join(SCRIPT_BASE_DIR, "settings.json")
+CONFIG_SAVE_DELAY_MS = 2000  # Settings changes are batched and written at most this often
+OPTIMIZED_MODEL_DIR = os.path.join(MODEL_ROOT, "optimized")  # Serialized optimized graphs (per provider)
+QUANTIZED_MODEL_DIR = os.path.join(MODEL_ROOT, "quantized")  # INT8 / FP16 model variants
 
 # --- UI THEME PALETTE (Dark Carbon: VS Code style) ---
 COLORS = {
@@ -75,29 +102,121 @@ COLORS = {
     "dropdown_fg": "#e0e0e0"
 }
 
+THEME_NAME = "bgremover"  # ttk theme built on 'clam' in setup_theme
+
 STATUS_PROCESSING = "white"
 STATUS_NORMAL = "white"
 
+# Widget color styles, prebuilt as configure() kwargs so hover/toggle handlers skip the COLORS lookups
+_STYLE_ACTIVE = {"bg": COLORS["accent"], "fg": "white"}  # Active toggle / hovered dropdown row
+_STYLE_INACTIVE = {"bg": "#2D2D30", "fg": COLORS["fg"]}  # CPU/GPU buttons
+_STYLE_TOGGLE_OFF = {"bg": COLORS["card_bg"], "fg": COLORS["fg"]}  # Flat toggles
+_STYLE_ROW = {"bg": COLORS["dropdown_bg"], "fg": COLORS["dropdown_fg"]}  # Dropdown rows
+_STYLE_FLASH = {"bg": "#FFD700", "fg": "black"}  # Conflict warning blink
+
+# Conflict warnings: blink count, beat length, and minimum gap between two warnings
+FLASH_BLINKS = 3
+FLASH_BEAT_MS = 150
+FLASH_COOLDOWN_S = 4.0
+
+# Output folder label: visible characters, and scroll step interval for longer paths
+MARQUEE_WIDTH = 30
+MARQUEE_STEP_MS = 300
+
 # Editor defaults
 PAINT_BRUSH_DIAMETER = 18
 UNDO_STEPS = 20
 MIN_RECT_SIZE = 12
 
+# Color picker: max cached SV gradient frames (one per quantized hue)
+SV_CACHE_SIZE = 64
+_HEX = [f"{i:02x}" for i in range(256)]  # Byte -> two hex digits, for building "#rrggbb" strings
+
+# SAM: max cached image embeddings (~4 MB each), reused when switching between gallery images
+SAM_EMBEDDING_CACHE_SIZE = 8
+
+# Input canvas: max cached rendered previews (one per recent zoom/pan state)
+PREVIEW_CACHE_SIZE = 8
+# Previews: box-reduced mip levels (1/2, 1/4, ...) down to this short side
+MIP_MIN_SIZE = 256
+# Input canvas: max cached checkerboards (one per recent canvas size, e.g. maximized vs restored)
+CHECKERBOARD_CACHE_SIZE = 3
+
+# Blur: above this sigma, use cv2.stackBlur (constant cost per pixel)
+STACK_BLUR_MIN_SIGMA = 8
+# ...lower for the smart background blur: it runs on a <=512px frame that is upscaled bilinearly afterwards
+BG_BLUR_STACK_MIN_SIGMA = 3
+# Background blur: fill the subject's hole with cv2.inpaint (Telea) instead of the normalized box-blur fill.
+# The fill is blurred heavily afterwards, so the cheap fill looks the same at a fraction of the cost.
+HIGH_QUALITY_BG_BLUR = False
+
+# Import: accepted image file extensions (lowercase)
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tiff'})
+
+# Drag & drop: Tcl list of paths, {braced} when they contain spaces
+DND_PATH_RE = re.compile(r'\{([^}]*)\}|(\S+)')
+
+# Window resize: refit the canvases once the size has been stable this long
+RESIZE_DEBOUNCE_MS = 120
+# Pan/zoom: motion and wheel events are rendered at most once per frame (~60 fps)
+VIEW_FRAME_MS = 16
+# Sliders: pixel work runs once the value has been still this long (labels still update live)
+THRESHOLD_DEBOUNCE_MS = 40
+SHADOW_DEBOUNCE_MS = 120
+SOFTEN_DEBOUNCE_MS = 150
+BG_BLUR_DEBOUNCE_MS = 200
+
+# Background tasks: result poll interval while a task runs (adds at most one frame of latency)
+TASK_POLL_MS = 16
+
+# Model loading: ORT sessions built concurrently (SAM encoder + decoder + whole-image model)
+MODEL_LOAD_WORKERS = 3
+
+# Gallery: parallel thumbnail decoders (OpenCV releases the GIL while decoding/resizing)
+THUMB_WORKERS = min(8, os.cpu_count() or 1)
+# Gallery: how often finished thumbnails are moved into the strip during an import
+THUMB_POLL_MS = 100
+
 # --- ONNX Runtime Setup ---
 available_providers = ort.get_available_providers()
 ONNX_PROVIDERS = []
 
+# Execution provider options. CUDA: heuristic cuDNN conv algo selection instead of an exhaustive benchmark
+# on every new input shape (SAM/BiRefNet see many), and arenas that grow only by what is requested.
+PROVIDER_OPTIONS = {
+    'CUDAExecutionProvider': {
+        'cudnn_conv_algo_search': 'HEURISTIC',
+        'arena_extend_strategy': 'kSameAsRequested',
+        'do_copy_in_default_stream': True,
+    },
+    'DmlExecutionProvider': {'device_id': 0},
+}
+
+
+def provider_entry(name):
+    """Provider list entry for InferenceSession: (name, options) where options are tuned, else just the name."""
+    options = PROVIDER_OPTIONS.get(name)
+    return (name, options) if options else name
+
+
+def provider_name(provider):
+    """Name of a provider list entry (plain string or (name, options) tuple)."""
+    return provider if isinstance(provider, str) else provider[0]
 
 
 # Provider priority: 1. CUDA (NVIDIA), 2. DirectML (Windows), 3. CPU (Fallback)
 if 'CUDAExecutionProvider' in available_providers:
-    ONNX_PROVIDERS.append('CUDAExecutionProvider')
+    ONNX_PROVIDERS.append(provider_entry('CUDAExecutionProvider'))
 if 'DmlExecutionProvider' in available_providers:
-    ONNX_PROVIDERS.append('DmlExecutionProvider')
+    ONNX_PROVIDERS.append(provider_entry('DmlExecutionProvider'))
 
 ONNX_PROVIDERS.append('CPUExecutionProvider')
 
-print(f"Hardware Acceleration: Using {ONNX_PROVIDERS[0]}")
+print(f"Hardware Acceleration: Using {provider_name(ONNX_PROVIDERS[0])}")
+
+# Providers whose optimized graph can be serialized and reloaded. DirectML applies its own
+# fusions at load time that don't round-trip through a saved model, so it is excluded.
+OPTIMIZED_CACHE_PROVIDERS = {'CPUExecutionProvider', 'CUDAExecutionProvider'}
 
 
 def get_ort_session_options():
@@ -105,15 +224,343 @@ def get_ort_session_options():
     sess_options = ort.SessionOptions()
     sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
 
-    import multiprocessing
-    cpu_count = multiprocessing.cpu_count()
+    physical_cores = psutil.cpu_count(logical=False) if PSUTIL_AVAILABLE else None
+    if not physical_cores:
+        physical_cores = max(1, (os.cpu_count() or 2) // 2)
 
-    # Use all available CPU cores for faster CPU inference
-    sess_options.intra_op_num_threads = cpu_count
-    sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    # One thread per physical core: SMT siblings share FP units, so logical-core counts oversubscribe.
+    # Parallel mode lets independent branches overlap; no spinning keeps idle inference threads off the CPU.
+    sess_options.intra_op_num_threads = physical_cores
+    sess_options.inter_op_num_threads = max(1, physical_cores // 2)
+    sess_options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+    sess_options.add_session_config_entry('session.intra_op.allow_spinning', '0')
     return sess_options
 
 
+def get_optimized_model_path(model_path, providers):
+    """Cache file for the serialized optimized graph. Keyed by provider and ORT version (not portable across either)."""
+    provider_tag = provider_name(providers[0]).replace("ExecutionProvider", "").lower()
+    name = os.path.splitext(os.path.basename(model_path))[0]
+    return os.path.join(OPTIMIZED_MODEL_DIR, f"{name}.{provider_tag}.ort{ort.__version__}.onnx")
+
+
+def get_quantized_model_path(model_path, providers):
+    """Returns the INT8 (CPU) or FP16 (GPU) variant of a model, converting and caching it on first use.
+    Falls back to the original model if the converter is unavailable or the conversion fails."""
+    name = os.path.splitext(os.path.basename(model_path))[0]
+    lower_name = name.lower()
+    if any(tag in lower_name for tag in ("quant", "int8", "fp16")) or re.search(r'_q\d', lower_name):
+        return model_path  # Already a reduced-precision model (incl. q4/q8-style suffixes)
+
+    use_fp16 = provider_name(providers[0]) != 'CPUExecutionProvider'
+    if not (FP16_AVAILABLE if use_fp16 else INT8_AVAILABLE):
+        return model_path
+
+    quantized_path = os.path.join(QUANTIZED_MODEL_DIR, f"{name}.{'fp16' if use_fp16 else 'int8'}.onnx")
+    if os.path.exists(quantized_path) and os.path.getmtime(quantized_path) >= os.path.getmtime(model_path):
+        return quantized_path
+
+    tmp_path = quantized_path + ".tmp"
+    try:
+        os.makedirs(QUANTIZED_MODEL_DIR, exist_ok=True)
+        if use_fp16:
+            import onnx
+            from onnxconverter_common import float16
+
+            # Keep float32 I/O so the pre/post-processing code is unchanged
+            onnx.save(float16.convert_float_to_float16(onnx.load(model_path), keep_io_types=True), tmp_path)
+        else:
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+
+            # UInt8 weights: ORT's CPU ConvInteger kernel has no signed-weight variant
+            quantize_dynamic(model_path, tmp_path, weight_type=QuantType.QUInt8)
+        os.replace(tmp_path, quantized_path)  # Never leave a half-written model in the cache
+        print(f"Quantized model cached: {quantized_path}")
+        return quantized_path
+    except Exception as e:
+        print(f"Quantization failed for {model_path} ({e}). Using original model.")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return model_path
+
+
+def create_ort_session(model_path, providers, quantize=False):
+    """Creates an InferenceSession, reusing the graph optimized on a previous launch when available."""
+    if quantize:
+        quantized_path = get_quantized_model_path(model_path, providers)
+        if quantized_path != model_path:
+            try:
+                return create_ort_session(quantized_path, providers)
+            except Exception as e:
+                print(f"Quantized model failed to load ({e}). Using original model.")
+
+    if provider_name(providers[0]) not in OPTIMIZED_CACHE_PROVIDERS:
+        return ort.InferenceSession(model_path, get_ort_session_options(), providers=providers)
+
+    cached_path = get_optimized_model_path(model_path, providers)
+    if os.path.exists(cached_path) and os.path.getmtime(cached_path) >= os.path.getmtime(model_path):
+        try:
+            sess_options = get_ort_session_options()
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL  # Already optimized
+            return ort.InferenceSession(cached_path, sess_options, providers=providers)
+        except Exception as e:
+            print(f"Discarding optimized model cache {cached_path}: {e}")
+
+    # First load (or stale cache): optimize as usual and serialize the result for next time
+    try:
+        os.makedirs(OPTIMIZED_MODEL_DIR, exist_ok=True)
+        sess_options = get_ort_session_options()
+        sess_options.optimized_model_filepath = cached_path
+        return ort.InferenceSession(model_path, sess_options, providers=providers)
+    except Exception as e:
+        print(f"Could not cache optimized model ({e}). Loading without cache.")
+        return ort.InferenceSession(model_path, get_ort_session_options(), providers=providers)
+
+
+def get_ort_device_type(providers):
+    """Maps the leading execution provider to the device string used for IO binding."""
+    if providers and provider_name(providers[0]) == 'CUDAExecutionProvider':
+        return 'cuda'
+    # DirectML consumes host memory directly; CPU obviously does too.
+    return 'cpu'
+
+
+def gaussian_blur(image, sigma, stack_min_sigma=STACK_BLUR_MIN_SIGMA):
+    """Gaussian blur via OpenCV, matching ImageFilter.GaussianBlur(radius=sigma). Accepts a PIL image or
+    array and returns the same type. Radii from stack_min_sigma up use stackBlur, whose cost does not grow
+    with the radius."""
+    if sigma <= 0:
+        return image
+    is_pil = isinstance(image, Image.Image)
+    arr = np.asarray(image)
+    if sigma >= stack_min_sigma and hasattr(cv2, "stackBlur"):
+        # Stack blur's tent kernel of radius r has a standard deviation of roughly (r + 1) / sqrt(6)
+        r = max(1, int(round(sigma * math.sqrt(6))) - 1)
+        blurred = cv2.stackBlur(arr, (2 * r + 1, 2 * r + 1))
+    else:
+        blurred = cv2.GaussianBlur(arr, (0, 0), sigmaX=sigma, borderType=cv2.BORDER_REPLICATE)
+    return Image.fromarray(blurred) if is_pil else blurred
+
+
+def fill_masked(img, mask):
+    """Fills the masked (non-zero) pixels of an HxWx3 uint8 array with the mean of the nearest unmasked ones.
+    Normalized box blurs whose window doubles until every hole pixel is reached: each pass is O(N)
+    whatever the window, unlike Telea inpainting's O(N * radius^2)."""
+    hole = mask > 0
+    if not hole.any() or hole.all():
+        return img
+    valid = (~hole).astype(np.float32)
+    src = img.astype(np.float32) * valid[..., None]
+    out = img.copy()
+    k = 8
+    while hole.any():
+        weight = cv2.blur(valid, (k, k))
+        total = cv2.blur(src, (k, k))
+        ready = hole & (weight * (k * k) > 0.5)  # At least one unmasked pixel in the window
+        out[ready] = (total[ready] / weight[ready, None] + 0.5).astype(np.uint8)
+        hole &= ~ready
+        k *= 2
+    return out
+
+
+def blank_image(mode, size):
+    """Zero-filled 'L' or 'RGBA' image sharing memory with np.zeros. The zeros come from calloc (lazily zeroed
+    pages), so a full-resolution blank mask/canvas costs no memset, unlike Image.new. The image is read-only:
+    the first in-place write (paste, ImageDraw, ...) makes Pillow copy the whole buffer, so only use it for
+    blanks that are read or replaced, and Image.new for canvases that will be drawn on."""
+    w, h = size
+    shape = (h, w) if mode == "L" else (h, w, 4)
+    return Image.fromarray(np.zeros(shape, dtype=np.uint8))
+
+
+def build_mip_levels(image):
+    """[image, 1/2, 1/4, ...] built with Image.reduce (2x2 box average), stopping at MIP_MIN_SIZE.
+    Palette/bilevel images are resized with NEAREST by Pillow anyway, so they get no levels."""
+    levels = [image]
+    if image.mode not in ("L", "LA", "RGB", "RGBA"):
+        return levels
+    while min(levels[-1].size) >= 2 * MIP_MIN_SIZE:
+        levels.append(levels[-1].reduce(2))
+    return levels
+
+
+def has_image_extension(name):
+    """True for 'photo.JPG'-style names with an accepted extension (not for bare '.png' dotfiles)."""
+    stem, dot, ext = name.rpartition('.')
+    return bool(stem) and ('.' + ext.lower()) in IMAGE_EXTENSIONS
+
+
+def list_image_files(folder):
+    """Image files directly inside folder. scandir gets the file type from the directory listing (no stat per entry)."""
+    with os.scandir(folder) as entries:
+        return [e.path for e in entries if has_image_extension(e.name) and e.is_file()]
+
+
+class BoundSession:
+    """Single-input ONNX session with a persistent IO binding. Input/output buffers are allocated once
+    (on the GPU for CUDA) and reused, avoiding per-call host<->device staging allocations."""
+
+    ORT_FLOAT_TYPES = {'tensor(float)': np.float32, 'tensor(float16)': np.float16}
+
+    def __init__(self, model_path, providers, quantize=False):
+        self.model_path = model_path
+        self.session = create_ort_session(model_path, providers, quantize)
+        self.device_type = get_ort_device_type(self.session.get_providers())
+        self.io_binding = self.session.io_binding()
+
+        model_input = self.session.get_inputs()[0]
+        model_output = self.session.get_outputs()[0]
+        self.input_name = model_input.name
+        self.output_name = model_output.name
+        self.in_value = None
+        self.in_buf = None
+        self.out_buf = None
+
+        # Static output shape: preallocate once. Dynamic: let ORT allocate on the target device.
+        out_dtype = self.ORT_FLOAT_TYPES.get(model_output.type)
+        if out_dtype is not None and all(isinstance(d, int) for d in model_output.shape):
+            if self.device_type == 'cuda':
+                out_value = ort.OrtValue.ortvalue_from_shape_and_type(model_output.shape, out_dtype, 'cuda', 0)
+            else:
+                self.out_buf = np.empty(model_output.shape, dtype=out_dtype)
+                out_value = ort.OrtValue.ortvalue_from_numpy(self.out_buf)  # Shares memory with out_buf
+            self.io_binding.bind_ortvalue_output(self.output_name, out_value)
+        else:
+            self.io_binding.bind_output(self.output_name, self.device_type)
+
+    def get_inputs(self):
+        return self.session.get_inputs()
+
+    def get_outputs(self):
+        return self.session.get_outputs()
+
+    def _bind_input(self, shape, dtype):
+        """(Re)allocates the persistent input buffer when the tensor shape changes."""
+        if self.device_type == 'cuda':
+            self.in_value = ort.OrtValue.ortvalue_from_shape_and_type(shape, dtype, 'cuda', 0)
+        else:
+            self.in_buf = np.empty(shape, dtype=dtype)
+            self.in_value = ort.OrtValue.ortvalue_from_numpy(self.in_buf)
+        self.io_binding.bind_ortvalue_input(self.input_name, self.in_value)
+
+    def run(self, input_array):
+        """Copies the tensor into the bound input and runs inference.
+        Returns the first output; the array may be reused (overwritten) by the next call."""
+        if self.in_value is None or tuple(self.in_value.shape()) != input_array.shape:
+            self._bind_input(input_array.shape, input_array.dtype)
+
+        if self.device_type == 'cuda':
+            self.in_value.update_inplace(np.ascontiguousarray(input_array))  # Single host->device copy
+        else:
+            np.copyto(self.in_buf, input_array)
+
+        self.session.run_with_iobinding(self.io_binding)
+        if self.out_buf is not None:
+            return self.out_buf
+        return self.io_binding.copy_outputs_to_cpu()[0]
+
+
+class MaskHistory:
+    """Linear undo/redo timeline of 'L' masks. Snapshots are stored zlib-compressed (level 1): masks are
+    mostly long runs of 0/255, so a step costs ~1% of a full-resolution copy and decodes in a few ms."""
+
+    def __init__(self, capacity=UNDO_STEPS):
+        self.capacity = capacity
+        self.states = []  # (size, compressed bytes), oldest first
+        self.cursor = -1  # Index of the current state
+
+    def reset(self, mask):
+        """Clears the history, keeping `mask` as the only state."""
+        self.states = []
+        self.cursor = -1
+        self.push(mask)
+
+    def push(self, mask):
+        """Records a new current state, discarding any redo states."""
+        del self.states[self.cursor + 1:]
+        self.states.append((mask.size, zlib.compress(mask.tobytes(), 1)))  # One raw copy, no array round trip
+        if len(self.states) > self.capacity:
+            del self.states[0]  # Drop the oldest state
+        self.cursor = len(self.states) - 1
+
+    def can_undo(self):
+        return self.cursor > 0
+
+    def can_redo(self):
+        return self.cursor < len(self.states) - 1
+
+    def undo(self):
+        """Steps back one state and returns it as a new 'L' image."""
+        self.cursor -= 1
+        return self._current()
+
+    def redo(self):
+        """Steps forward one state and returns it as a new 'L' image."""
+        self.cursor += 1
+        return self._current()
+
+    def _current(self):
+        size, data = self.states[self.cursor]
+        # Wraps the decompressed bytes without copying them again (the image is read-only, copy-on-write)
+        return Image.frombuffer("L", size, zlib.decompress(data), "raw", "L", 0, 1)
+
+
+class InferenceWorker:
+    """Persistent inference thread fed by a small bounded queue. The UI thread only enqueues jobs and
+    applies results, so it stays responsive while the model runs. Results are delivered on the Tk thread."""
+
+    def __init__(self, root, maxsize=2):
+        self.root = root
+        self.jobs = queue.Queue(maxsize=maxsize)  # Small on purpose: backpressure for rapid input
+        self.results = queue.Queue()
+        self.pending = 0
+        self.poll_id = None
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, task, callback, error_callback=None):
+        """Queues a job. When the queue is full the oldest waiting job is dropped (newest input wins)."""
+        while True:
+            try:
+                self.jobs.put_nowait((task, callback, error_callback))
+                break
+            except queue.Full:
+                try:
+                    self.jobs.get_nowait()
+                    self.pending -= 1
+                except queue.Empty:
+                    pass
+
+        self.pending += 1
+        if self.poll_id is None:
+            self.poll_id = self.root.after(16, self._poll_results)
+
+    def _run(self):
+        """WORKER THREAD: no Tkinter access here."""
+        while True:
+            task, callback, error_callback = self.jobs.get()
+            try:
+                self.results.put((callback, task()))
+            except Exception as e:
+                self.results.put((error_callback, e))
+
+    def _poll_results(self):
+        """MAIN THREAD: applies finished results, keeps polling only while jobs are outstanding."""
+        self.poll_id = None
+        while True:
+            try:
+                callback, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if callback:
+                callback(payload)
+            elif isinstance(payload, Exception):
+                print(f"Inference Error: {payload}")
+
+        if self.pending > 0:
+            self.poll_id = self.root.after(16, self._poll_results)
+
+
 def set_window_dark_mode(window):
     """Windows-specific hack: Forces the title bar into dark mode (DWMWA_USE_IMMERSIVE_DARK_MODE)."""
     try:
@@ -133,9 +580,31 @@ def set_window_dark_mode(window):
 class ModernHelpWindow(tk.Toplevel):
     """Custom-styled modal documentation window. Replaces ugly default messagebox."""
 
+    _label_styles = None  # Shared per-role Label options (Font objects created once per app)
+
+    @classmethod
+    def _get_label_styles(cls):
+        """Builds the Label option dicts on first use. Reusing Font objects skips Tk's font-spec parsing per label."""
+        if cls._label_styles is None:
+            body = tkfont.Font(family="Segoe UI", size=10)
+            small = tkfont.Font(family="Segoe UI", size=9)
+            cls._label_styles = {
+                "chapter": dict(font=tkfont.Font(family="Segoe UI", size=14, weight="bold"), bg=COLORS["bg"], fg=COLORS["accent"]),
+                "sub_header": dict(font=tkfont.Font(family="Segoe UI", size=11, weight="bold"), bg=COLORS["bg"], fg="#e0e0e0"),
+                "text": dict(font=body, bg=COLORS["bg"], fg="#999999", justify="left"),
+                "note": dict(font=tkfont.Font(family="Segoe UI", size=9, slant="italic"), bg=COLORS["bg"], fg=COLORS["undo"]),
+                "action": dict(font=tkfont.Font(family="Segoe UI", size=10, weight="bold"), bg=COLORS["bg"], fg="white"),
+                "trigger": dict(font=tkfont.Font(family="Consolas", size=8), bg=COLORS["card_bg"], fg=COLORS["accent"]),
+                "description": dict(font=body, bg=COLORS["bg"], fg="#aaaaaa", justify="left"),
+                "key": dict(font=tkfont.Font(family="Consolas", size=9, weight="bold"), bg=COLORS["card_bg"], fg=COLORS["accent"]),
+                "key_description": dict(font=small, bg=COLORS["bg"], fg="#cccccc"),
+            }
+        return cls._label_styles
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
+        self.styles = self._get_label_styles()
         self.configure(bg=COLORS["bg"])
         self.overrideredirect(True)  # Custom title bar
 
@@ -220,7 +689,9 @@ class ModernHelpWindow(tk.Toplevel):
         footer.pack(fill="x", side="bottom")
         ttk.Button(footer, text="Close", command=self.close_win, style="TButton").pack()
 
-        self._bind_mouse_scroll(self.main_container)
+        # Every widget's bindtags include its toplevel, so one binding here covers the whole window
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._on_mousewheel)
 
         # Modal/Focus
         self.update_idletasks()
@@ -307,17 +778,17 @@ class ModernHelpWindow(tk.Toplevel):
     def add_chapter(self, text):
         f = tk.Frame(self.inner_frame, bg=COLORS["bg"], pady=10)
         f.pack(fill="x", pady=(10, 0))
-        tk.Label(f, text=text, font=("Segoe UI", 14, "bold"), bg=COLORS["bg"], fg=COLORS["accent"]).pack(anchor="w")
+        tk.Label(f, text=text, **self.styles["chapter"]).pack(anchor="w")
         ttk.Separator(self.inner_frame, orient="horizontal").pack(fill="x", pady=(0, 5))
 
     def add_sub_header(self, text):
-        tk.Label(self.inner_frame, text=text, font=("Segoe UI", 11, "bold"), bg=COLORS["bg"], fg="#e0e0e0").pack(anchor="w", pady=(8, 2))
+        tk.Label(self.inner_frame, text=text, **self.styles["sub_header"]).pack(anchor="w", pady=(8, 2))
 
     def add_text(self, text):
-        tk.Label(self.inner_frame, text=text, font=("Segoe UI", 10), bg=COLORS["bg"], fg="#999999", justify="left", wraplength=self.text_wrap_length).pack(anchor="w", pady=(0, 5))
+        tk.Label(self.inner_frame, text=text, wraplength=self.text_wrap_length, **self.styles["text"]).pack(anchor="w", pady=(0, 5))
 
     def add_note(self, text):
-        tk.Label(self.inner_frame, text=text, font=("Segoe UI", 9, "italic"), bg=COLORS["bg"], fg=COLORS["undo"]).pack(anchor="w", pady=(0, 5))
+        tk.Label(self.inner_frame, text=text, **self.styles["note"]).pack(anchor="w", pady=(0, 5))
 
     def add_instruction(self, action_name, input_trigger, description):
         row = tk.Frame(self.inner_frame, bg=COLORS["bg"], pady=4)
@@ -327,14 +798,14 @@ class ModernHelpWindow(tk.Toplevel):
         left_container = tk.Frame(row, bg=COLORS["bg"])
         left_container.grid(row=0, column=0, sticky="nw", padx=(0, 20))
 
-        tk.Label(left_container, text=action_name, font=("Segoe UI", 10, "bold"), bg=COLORS["bg"], fg="white").pack(anchor="w")
+        tk.Label(left_container, text=action_name, **self.styles["action"]).pack(anchor="w")
 
         trig_frame = tk.Frame(left_container, bg=COLORS["card_bg"], padx=4, pady=1)
         trig_frame.pack(anchor="w", pady=(2, 0))
-        tk.Label(trig_frame, text=input_trigger, font=("Consolas", 8), bg=COLORS["card_bg"], fg=COLORS["accent"]).pack()
+        tk.Label(trig_frame, text=input_trigger, **self.styles["trigger"]).pack()
 
         desc_wrap = self.text_wrap_length - 150
-        tk.Label(row, text=description, font=("Segoe UI", 10), bg=COLORS["bg"], fg="#aaaaaa", justify="left", wraplength=desc_wrap).grid(row=0, column=1, sticky="w")
+        tk.Label(row, text=description, wraplength=desc_wrap, **self.styles["description"]).grid(row=0, column=1, sticky="w")
 
     def add_shortcut_grid(self, shortcuts):
         grid_frame = tk.Frame(self.inner_frame, bg=COLORS["bg"], pady=5)
@@ -350,9 +821,9 @@ class ModernHelpWindow(tk.Toplevel):
 
             k_f = tk.Frame(item, bg=COLORS["card_bg"], highlightbackground=COLORS["border"], highlightthickness=1, padx=5, pady=2)
             k_f.pack(side="left")
-            tk.Label(k_f, text=key, font=("Consolas", 9, "bold"), bg=COLORS["card_bg"], fg=COLORS["accent"]).pack()
+            tk.Label(k_f, text=key, **self.styles["key"]).pack()
 
-            tk.Label(item, text=desc, font=("Segoe UI", 9), bg=COLORS["bg"], fg="#cccccc").pack(side="left", padx=8)
+            tk.Label(item, text=desc, **self.styles["key_description"]).pack(side="left", padx=8)
             col_idx += 1
             if col_idx > 1:
                 col_idx = 0
@@ -381,18 +852,11 @@ class ModernHelpWindow(tk.Toplevel):
     def _on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
 
-    def _bind_mouse_scroll(self, widget):
-        widget.bind("<MouseWheel>", self._on_mousewheel)
-        widget.bind("<Button-4>", self._on_mousewheel)
-        widget.bind("<Button-5>", self._on_mousewheel)
-        for child in widget.winfo_children():
-            self._bind_mouse_scroll(child)
-
     def _on_mousewheel(self, event):
         if self.canvas.yview() == (0.0, 1.0): return  # Stop if at end
 
         scroll_units = 0
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             scroll_units = int(-1 * (event.delta / 120))
         elif platform.system() == "Darwin":
             scroll_units = int(-1 * event.delta)
@@ -407,6 +871,43 @@ class ModernHelpWindow(tk.Toplevel):
         return "break"
 
 
+def hsv_to_rgb_array(h, s=1.0, v=1.0):
+    """Vectorized HSV->RGB. h, s, v are scalars or broadcastable arrays in [0, 1]; returns float32 RGB in
+    [0, 1] with a trailing channel axis. Branchless: each channel is a clipped triangle wave of the hue."""
+    h = np.asarray(h, dtype=np.float32)[..., None]
+    s = np.asarray(s, dtype=np.float32)[..., None]
+    v = np.asarray(v, dtype=np.float32)[..., None]
+    k = (h * 6.0 + np.array([5.0, 3.0, 1.0], dtype=np.float32)) % 6.0
+    return v * (1.0 - s * np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0))
+
+
+@lru_cache(maxsize=4096)
+def hsv_to_rgb8(h, s, v):
+    """HSV floats in [0, 1] -> 8-bit RGB tuple. Cached: drag events revisit the same pixel-derived values."""
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+@lru_cache(maxsize=4096)
+def rgb8_to_hsv(rgb):
+    """8-bit RGB tuple -> HSV floats in [0, 1]. Cached for preset/hex round trips."""
+    return colorsys.rgb_to_hsv(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+
+
+@lru_cache(maxsize=256)
+def contrast_text_color(hex_color):
+    """Black or white text for a '#rrggbb' background (Rec. 601 luminance, integer math). White if malformed."""
+    digits = hex_color.lstrip('#')
+    if len(digits) != 6:
+        return "#ffffff"
+    try:
+        v = int(digits, 16)
+    except ValueError:
+        return "#ffffff"
+    r, g, b = (v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff
+    return "#000000" if 299 * r + 587 * g + 114 * b > 128000 else "#ffffff"
+
+
 class ModernColorPicker(tk.Toplevel):
     """Custom HSV/RGB color picker. Avoids ugly, non-themed OS-native picker."""
 
@@ -429,6 +930,7 @@ class ModernColorPicker(tk.Toplevel):
         self.last_flash_time = 0
         self.flash_counter = 0
         self.is_flashing = False
+        self._sv_cache = OrderedDict()  # Quantized hue -> SV gradient PhotoImage
 
         self.title("Color Picker")
         self.configure(bg=COLORS["bg"])
@@ -442,6 +944,17 @@ class ModernColorPicker(tk.Toplevel):
         self.pad = int(10 * self.scale)
         self.swatch_size = int(26 * self.scale)
         self.swatch_pad = int(3 * self.scale)
+        self.sv_cursor_radius = int(6 * self.scale)
+        self.sv_cursor_items = None
+        self.hue_cursor_items = None
+        self._last_drawn_hue = None  # Hue of the SV gradient on screen
+        self._last_hue_cursor_y = None  # Pixel row of the hue cursor on screen
+
+        # S/V gradient: constant ramps plus a reused output buffer
+        self._sv_sat = np.linspace(0, 1, self.sv_size, dtype=np.float32)[None, :, None]
+        self._sv_val = np.linspace(1, 0, self.sv_size, dtype=np.float32)[:, None, None]
+        self._sv_white = 255.0 * (1 - self._sv_sat)
+        self._sv_scratch = np.empty((self.sv_size, self.sv_size, 3), dtype=np.uint8)
 
         # Predefined colors for quick selection
         self.presets = [
@@ -458,7 +971,7 @@ class ModernColorPicker(tk.Toplevel):
 
         # Init state
         self.current_rgb = self.hex_to_rgb(initial_color)
-        self.current_hsv = colorsys.rgb_to_hsv(self.current_rgb[0] / 255, self.current_rgb[1] / 255, self.current_rgb[2] / 255)
+        self.current_hsv = rgb8_to_hsv(self.current_rgb)
 
         self.setup_ui()
         self.update_visuals_from_hsv()
@@ -608,20 +1121,49 @@ class ModernColorPicker(tk.Toplevel):
         tk.Label(right_col, text="PRESETS", bg=COLORS["bg"], fg=COLORS["header"],
                  font=("Segoe UI", int(8 * self.scale), "bold"), anchor="w").pack(fill="x", pady=(0, int(8 * self.scale)))
 
-        grid_frame = tk.Frame(right_col, bg=COLORS["bg"])
-        grid_frame.pack(fill="both", expand=True)
-
+        # All swatches live on one canvas (one widget instead of one Frame per preset)
         cols = 4
+        rows = math.ceil(len(self.presets) / cols)
+        cell = self.swatch_size + 2 * self.swatch_pad
+        self.swatch_canvas = tk.Canvas(right_col, width=cols * cell, height=rows * cell,
+                                       bg=COLORS["bg"], highlightthickness=0, cursor="hand2")
+        self.swatch_canvas.pack(anchor="nw")
+
+        self.swatch_colors = {}  # Canvas item ID -> hex color
         for i, color_hex in enumerate(self.presets):
-            r = i // cols
-            c = i % cols
-            f = tk.Frame(grid_frame, bg=color_hex, width=self.swatch_size, height=self.swatch_size,
-                         cursor="hand2", highlightthickness=1, highlightbackground=COLORS["border"])
-            f.grid(row=r, column=c, padx=self.swatch_pad, pady=self.swatch_pad)
-            f.bind("<Button-1>", lambda e, h=color_hex: self.load_preset(h))
-            # Hover effect
-            f.bind("<Enter>", lambda e, w=f: w.config(highlightbackground="white"))
-            f.bind("<Leave>", lambda e, w=f: w.config(highlightbackground=COLORS["border"]))
+            x = (i % cols) * cell + self.swatch_pad
+            y = (i // cols) * cell + self.swatch_pad
+            item = self.swatch_canvas.create_rectangle(x, y, x + self.swatch_size, y + self.swatch_size,
+                                                       fill=color_hex, outline=COLORS["border"], width=1)
+            self.swatch_colors[item] = color_hex
+
+        self.hovered_swatch = None
+        self.swatch_canvas.bind("<Button-1>", self.on_swatch_click)
+        self.swatch_canvas.bind("<Motion>", self.on_swatch_hover)
+        self.swatch_canvas.bind("<Leave>", lambda e: self.on_swatch_hover(None))
+
+    def _swatch_at(self, event):
+        # Returns the swatch item under the pointer (None over the padding gaps)
+        for item in self.swatch_canvas.find_overlapping(event.x, event.y, event.x, event.y):
+            if item in self.swatch_colors:
+                return item
+        return None
+
+    def on_swatch_click(self, event):
+        item = self._swatch_at(event)
+        if item is not None:
+            self.load_preset(self.swatch_colors[item])
+
+    def on_swatch_hover(self, event):
+        # Hover effect: highlight outline of the swatch under the cursor
+        item = self._swatch_at(event) if event else None
+        if item == self.hovered_swatch:
+            return
+        if self.hovered_swatch is not None:
+            self.swatch_canvas.itemconfig(self.hovered_swatch, outline=COLORS["border"])
+        if item is not None:
+            self.swatch_canvas.itemconfig(item, outline="white")
+        self.hovered_swatch = item
 
     def on_paste(self, event):
         # Delay hex validation to allow paste buffer update
@@ -630,64 +1172,85 @@ class ModernColorPicker(tk.Toplevel):
     def load_preset(self, hex_code):
         # Load color preset from hex
         self.current_rgb = self.hex_to_rgb(hex_code)
-        self.current_hsv = colorsys.rgb_to_hsv(self.current_rgb[0] / 255, self.current_rgb[1] / 255, self.current_rgb[2] / 255)
+        self.current_hsv = rgb8_to_hsv(self.current_rgb)
         self.update_visuals_from_hsv()
         self.focus_set()
 
     def draw_hue_gradient(self):
-        # Renders the vertical hue strip
-        for y in range(self.sv_size):
-            hue = y / self.sv_size
-            r, g, b = colorsys.hsv_to_rgb(hue, 1, 1)
-            color = "#%02x%02x%02x" % (int(r * 255), int(g * 255), int(b * 255))
-            self.hue_canvas.create_line(0, y, self.hue_width, y, fill=color)
+        # Renders the vertical hue strip as a single image (vectorized HSV->RGB at S=V=1)
+        column = (hsv_to_rgb_array(np.arange(self.sv_size) / self.sv_size) * 255).astype(np.uint8)
+        strip = np.ascontiguousarray(np.broadcast_to(column[:, None, :], (self.sv_size, self.hue_width, 3)))
+
+        self.tk_hue_image = ImageTk.PhotoImage(Image.fromarray(strip, "RGB"))  # Keep reference (GC)
+        self.hue_canvas.create_image(0, 0, anchor="nw", image=self.tk_hue_image)
 
     def redraw_sv_gradient(self):
-        """Renders the Saturation/Value square based on current Hue (using PIL/ImageOps for speed)."""
+        """Renders the Saturation/Value square based on current Hue (single NumPy broadcast at full size)."""
         hue = self.current_hsv[0]
-        r, g, b = colorsys.hsv_to_rgb(hue, 1, 1)
-        base_color = (int(r * 255), int(g * 255), int(b * 255))
-
-        # Create color gradient (Hue + Saturation mask)
-        img = Image.new("RGB", (64, 64), base_color)
-        white = Image.new("RGB", (64, 64), (255, 255, 255))
-        mask_s = Image.linear_gradient("L").rotate(90).resize((64, 64))
-        img = Image.composite(img, white, mask_s)
-
-        # Apply Value mask (Black fade)
-        black = Image.new("RGB", (64, 64), (0, 0, 0))
-        mask_v = Image.linear_gradient("L").resize((64, 64))
-        img = Image.composite(black, img, mask_v)
-
-        self.sv_image = img.resize((self.sv_size, self.sv_size), Image.Resampling.BICUBIC)
-        self.tk_sv_image = ImageTk.PhotoImage(self.sv_image)
-        self.sv_canvas.create_image(0, 0, anchor="nw", image=self.tk_sv_image)
+
+        # Hue drags fire on every motion event: reuse frames per quantized hue bucket
+        key = int(hue * 255)
+        if key in self._sv_cache:
+            self._sv_cache.move_to_end(key)
+            self.tk_sv_image = self._sv_cache[key]
+        else:
+            base_color = np.floor(hsv_to_rgb_array(hue) * 255)
+
+            # Saturation mixes white -> hue along X (one row), Value fades to black along Y.
+            # The product is written straight into a reused uint8 scratch buffer (no zero-fill/temporaries).
+            row = base_color * self._sv_sat + self._sv_white
+            np.multiply(row, self._sv_val, out=self._sv_scratch, casting="unsafe")
+
+            self.tk_sv_image = ImageTk.PhotoImage(Image.fromarray(self._sv_scratch))  # Tk copies the pixels
+            self._sv_cache[key] = self.tk_sv_image
+            if len(self._sv_cache) > SV_CACHE_SIZE:
+                self._sv_cache.popitem(last=False)  # Evict least recently used
+
+        if getattr(self, "sv_image_item", None) is None:
+            self.sv_image_item = self.sv_canvas.create_image(0, 0, anchor="nw", image=self.tk_sv_image)
+        else:
+            self.sv_canvas.itemconfig(self.sv_image_item, image=self.tk_sv_image)  # Reuse item, no stacking
         self.draw_sv_cursor()
 
     def draw_sv_cursor(self):
-        # Draws the cursor on the S/V canvas
-        self.sv_canvas.delete("cursor")
+        # Positions the cursor on the S/V canvas (items are created once, then just moved)
         s, v = self.current_hsv[1], self.current_hsv[2]
         x = s * self.sv_size
         y = (1 - v) * self.sv_size
-        r = int(6 * self.scale)
-        # Double circle for max visibility
-        self.sv_canvas.create_oval(x - r, y - r, x + r, y + r, outline="white", width=2, tags="cursor")
-        self.sv_canvas.create_oval(x - r + 1, y - r + 1, x + r - 1, y + r - 1, outline="black", width=1, tags="cursor")
+        r = self.sv_cursor_radius
+        if not self.sv_cursor_items:
+            # Double circle for max visibility
+            self.sv_cursor_items = (
+                self.sv_canvas.create_oval(0, 0, 0, 0, outline="white", width=2, tags="cursor"),
+                self.sv_canvas.create_oval(0, 0, 0, 0, outline="black", width=1, tags="cursor"))
+        outer, inner = self.sv_cursor_items
+        self.sv_canvas.coords(outer, x - r, y - r, x + r, y + r)
+        self.sv_canvas.coords(inner, x - r + 1, y - r + 1, x + r - 1, y + r - 1)
+        self.sv_canvas.tag_raise("cursor")
 
     def draw_hue_cursor(self):
-        # Draws the cursor on the Hue strip
-        self.hue_canvas.delete("cursor")
-        y = self.current_hsv[0] * self.sv_size
-        self.hue_canvas.create_line(0, y, self.hue_width, y, fill="black", width=3, tags="cursor")
-        self.hue_canvas.create_line(0, y, self.hue_width, y, fill="white", width=1, tags="cursor")
+        # Positions the cursor on the Hue strip (skipped when it would land on the same pixel row)
+        y = round(self.current_hsv[0] * self.sv_size)
+        if y == self._last_hue_cursor_y:
+            return
+        self._last_hue_cursor_y = y
+        if not self.hue_cursor_items:
+            self.hue_cursor_items = (
+                self.hue_canvas.create_line(0, 0, 0, 0, fill="black", width=3, tags="cursor"),
+                self.hue_canvas.create_line(0, 0, 0, 0, fill="white", width=1, tags="cursor"))
+        for item in self.hue_cursor_items:
+            self.hue_canvas.coords(item, 0, y, self.hue_width, y)
+        self.hue_canvas.tag_raise("cursor")
 
     def update_visuals_from_hsv(self):
-        # Recalculate visuals from HSV state
-        self.redraw_sv_gradient()
-        self.draw_hue_cursor()
-        r, g, b = colorsys.hsv_to_rgb(self.current_hsv[0], self.current_hsv[1], self.current_hsv[2])
-        self.current_rgb = (int(r * 255), int(g * 255), int(b * 255))
+        # Recalculate visuals from HSV state. S/V drags keep the hue, so only the S/V cursor needs to move.
+        if self.current_hsv[0] != self._last_drawn_hue:
+            self._last_drawn_hue = self.current_hsv[0]
+            self.redraw_sv_gradient()
+            self.draw_hue_cursor()
+        else:
+            self.draw_sv_cursor()
+        self.current_rgb = hsv_to_rgb8(*self.current_hsv)
         hex_code = self.rgb_to_hex(self.current_rgb)
         self.preview_frame.config(bg=hex_code)
 
@@ -725,7 +1288,7 @@ class ModernColorPicker(tk.Toplevel):
             try:
                 rgb = self.hex_to_rgb(h)
                 self.current_rgb = rgb
-                self.current_hsv = colorsys.rgb_to_hsv(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+                self.current_hsv = rgb8_to_hsv(rgb)
                 self.hex_var.set(h)
                 self.update_visuals_from_hsv()
                 self.focus_set()
@@ -742,21 +1305,27 @@ class ModernColorPicker(tk.Toplevel):
         self.destroy()
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def hex_to_rgb(hex_val):
-        h = hex_val.lstrip('#')
-        return tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(hex_val.lstrip('#')))
 
     @staticmethod
     def rgb_to_hex(rgb):
-        return "#%02x%02x%02x" % rgb
+        return "#" + _HEX[rgb[0]] + _HEX[rgb[1]] + _HEX[rgb[2]]
 
 
 class LoadingOverlay(tk.Frame):
-    """'Glass' overlay to block input during heavy AI processing. Faux-transparency hack via ImageGrab."""
+    """'Glass' overlay to block input during heavy AI processing. Faux-transparency hack via ImageGrab.
+    Built once and reused: show() refreshes the backdrop and text, hide() just unplaces it."""
+
+    FRAME_MS = 33  # ~30 fps is plenty for a marquee and halves redraws vs 60 fps
+    SIN_LUT = [(math.sin(2 * math.pi * i / 38) + 1) / 2 for i in range(38)]  # One bounce cycle ~1.25 s
 
     def __init__(self, master, text="Processing..."):
         super().__init__(master)
-        self.running = True
+        self.master_window = master
+        self.running = False
+        self.anim_job = None
 
         # Input blocking
         self.bind("<Button-1>", lambda e: "break")
@@ -764,32 +1333,13 @@ class LoadingOverlay(tk.Frame):
         self.bind("<Button-3>", lambda e: "break")
         self.bind("<MouseWheel>", lambda e: "break")
 
-        # Faux-Transparency Hack: grab screenshot, darken, and blur.
-        self.update_idletasks()
-
-        x = master.winfo_rootx()
-        y = master.winfo_rooty()
-        w = master.winfo_width()
-        h = master.winfo_height()
         self.bg_photo = None
+        self.bg_key = None  # (x, y, w, h, thumbnail crc) of the screenshot behind bg_photo
 
-        try:
-            shot = ImageGrab.grab(bbox=(x, y, x + w, y + h))
-            enhancer = ImageEnhance.Brightness(shot)
-            darkened = enhancer.enhance(0.4)  # Dim to 40%
-            blurred = darkened.filter(ImageFilter.GaussianBlur(radius=3))
-            self.bg_photo = ImageTk.PhotoImage(blurred)
-        except Exception:
-            pass  # Fallback if screenshot fails
-
-        # Main Canvas
+        # Main Canvas (backdrop image set in refresh_background)
         self.canvas = tk.Canvas(self, highlightthickness=0, bg="#1e1e1e")
         self.canvas.pack(fill="both", expand=True)
-
-        if self.bg_photo:
-            self.canvas.create_image(0, 0, image=self.bg_photo, anchor="nw")
-        else:
-            self.canvas.configure(bg="#151515")  # Plain dark fallback
+        self.bg_item = self.canvas.create_image(0, 0, anchor="nw")
 
         # Central Loading Bar UI
         self.text = text
@@ -805,11 +1355,74 @@ class LoadingOverlay(tk.Frame):
         self.thumb_id = self.canvas.create_line(0, 0, 0, 0, fill=COLORS["accent"], width=self.bar_h, capstyle=tk.ROUND)
 
         self.anim_step = 0
+        self.last_thumb_x = None
         self.bind("<Configure>", self._on_resize)
 
+    def show(self, text):
+        """Refreshes backdrop and text, then covers the master window. No-op refresh if already shown."""
+        self.set_text(text)
+        if self.running:
+            return
+        self.refresh_background()  # Overlay is unplaced here, so the screenshot doesn't capture itself
+        self.place(x=0, y=0, relwidth=1, relheight=1)
         self.lift()
+        self.running = True
         self._animate_bar()
 
+    def hide(self):
+        self.running = False
+        if self.anim_job is not None:
+            self.after_cancel(self.anim_job)
+            self.anim_job = None
+        self.place_forget()
+
+    def refresh_background(self):
+        """Re-grabs the window behind the overlay and swaps the backdrop image in place."""
+        self.master_window.update_idletasks()
+        try:
+            rect, shot = self._grab_window(self.master_window)
+            # Back-to-back tasks usually see the same window: skip the blur if a 32x32 thumbnail is unchanged
+            key = rect + (zlib.crc32(cv2.resize(shot, (32, 32), interpolation=cv2.INTER_AREA).tobytes()),)
+            if key != self.bg_key or self.bg_photo is None:
+                self.bg_photo = ImageTk.PhotoImage(self._process_background(shot))
+                self.bg_key = key
+            self.canvas.itemconfig(self.bg_item, image=self.bg_photo)
+        except Exception:
+            # Fallback if screenshot fails: plain dark background
+            self.bg_photo = None
+            self.bg_key = None
+            self.canvas.itemconfig(self.bg_item, image="")
+            self.canvas.configure(bg="#151515")
+
+    @staticmethod
+    def _grab_window(master):
+        """Screenshot of the master window as an RGB array, with its (x, y, w, h) screen rect."""
+        x = master.winfo_rootx()
+        y = master.winfo_rooty()
+        w = master.winfo_width()
+        h = master.winfo_height()
+
+        shot = ImageGrab.grab(bbox=(x, y, x + w, y + h))
+        if shot.mode != "RGB":
+            shot = shot.convert("RGB")
+        return (x, y, w, h), np.asarray(shot)
+
+    @staticmethod
+    def _process_background(arr):
+        """Dims and blurs the screenshot. Large windows are processed at 1/4 size:
+        the blur is low-pass anyway, so upscaling the result looks the same at 1/16 of the cost."""
+        full_h, full_w = arr.shape[:2]
+        factor = 4 if full_w * full_h > 1_000_000 else 1
+        if factor > 1:
+            arr = cv2.resize(arr, (max(1, full_w // factor), max(1, full_h // factor)), interpolation=cv2.INTER_AREA)
+
+        # Blur and dim (to 40%) on one array: no intermediate PIL images
+        arr = gaussian_blur(arr, 3 / factor)
+        cv2.convertScaleAbs(arr, dst=arr, alpha=0.4)
+        if factor > 1:
+            arr = cv2.resize(arr, (full_w, full_h), interpolation=cv2.INTER_LINEAR)
+        return Image.fromarray(arr)
+
     def _on_resize(self, event):
         """Re-centers the loading bar elements on window resize."""
         w = event.width
@@ -825,24 +1438,27 @@ class LoadingOverlay(tk.Frame):
         self.bar_x = (w - self.bar_w) // 2
         self.bar_y = cy + 25
         self.canvas.coords(self.track_id, self.bar_x, self.bar_y, self.bar_x + self.bar_w, self.bar_y)
+        self.last_thumb_x = None  # Thumb must be repositioned on the next frame
 
     def _animate_bar(self):
-        """Bouncing animation logic (like a marquee)."""
+        """Bouncing animation logic (like a marquee). ~30 fps from a precomputed sine table."""
+        self.anim_job = None
         if not self.running or not self.winfo_exists():
             return
 
-        self.anim_step += 0.08
-        norm_pos = (math.sin(self.anim_step) + 1) / 2  # Sine wave for bounce
+        self.anim_step = (self.anim_step + 1) % len(self.SIN_LUT)
+        norm_pos = self.SIN_LUT[self.anim_step]  # Sine wave for bounce
 
         thumb_len = 80
         travel_area = self.bar_w - thumb_len
 
         if hasattr(self, 'bar_x'):
-            start_x = self.bar_x + (travel_area * norm_pos)
-            end_x = start_x + thumb_len
-            self.canvas.coords(self.thumb_id, start_x, self.bar_y, end_x, self.bar_y)
+            start_x = int(self.bar_x + (travel_area * norm_pos))
+            if start_x != self.last_thumb_x:  # Only touch the canvas when the thumb actually moved
+                self.last_thumb_x = start_x
+                self.canvas.coords(self.thumb_id, start_x, self.bar_y, start_x + thumb_len, self.bar_y)
 
-        self.after(16, self._animate_bar)
+        self.anim_job = self.after(self.FRAME_MS, self._animate_bar)
 
     def set_text(self, text):
         self.canvas.itemconfig(self.text_id, text=text)
@@ -857,6 +1473,12 @@ class LoadingOverlay(tk.Frame):
 class SleekSlider(tk.Canvas):
     """Custom-drawn canvas slider. Much better look/feel than default ttk.Scale."""
 
+    # Shared look: every slider draws the same three canvas items from these
+    PAD_X = 10
+    THUMB_R = 7
+    TRACK_COLOR = "#3e3e42"
+    THUMB_COLOR = "#ffffff"
+
     def __init__(self, master, width=200, height=30, min_val=0, max_val=100, init_val=50, command=None, bg_color="#1e1e1e", accent_color="#007acc"):
         super().__init__(master, width=width, height=height, bg=bg_color, highlightthickness=0)
         self.min_val = min_val
@@ -864,12 +1486,17 @@ class SleekSlider(tk.Canvas):
         self.value = init_val
         self.command = command
         self.accent = accent_color
-        self.track_color = "#3e3e42"
         self.width = width
         self.height = height
-        self.pad_x = 10
         self.track_y = height // 2
-        self.track_width = width - (self.pad_x * 2)
+        self.track_width = width - (self.PAD_X * 2)
+
+        self._pending_cb = None
+
+        # Items are created once; draw() only moves them
+        self.track_item = self.create_line(0, 0, 0, 0, fill=self.TRACK_COLOR, width=4, capstyle=tk.ROUND)
+        self.active_item = self.create_line(0, 0, 0, 0, fill=self.accent, width=4, capstyle=tk.ROUND)
+        self.thumb_item = self.create_oval(0, 0, 0, 0, fill=self.THUMB_COLOR, outline=self.TRACK_COLOR, width=1)
 
         self.bind("<Configure>", self._on_resize)
         self.bind("<Button-1>", self._on_click)
@@ -878,25 +1505,30 @@ class SleekSlider(tk.Canvas):
 
     def _on_resize(self, event):
         self.width = event.width
-        self.track_width = self.width - (self.pad_x * 2)
+        self.track_width = self.width - (self.PAD_X * 2)
         self.draw()
 
     def val_to_pixel(self, val):
-        if self.max_val == self.min_val: return self.pad_x
+        if self.max_val == self.min_val: return self.PAD_X
         percent = (val - self.min_val) / (self.max_val - self.min_val)
-        return self.pad_x + (percent * self.track_width)
+        return self.PAD_X + (percent * self.track_width)
 
     def pixel_to_val(self, x):
         # Clamps the pixel position and converts to a value
-        x = max(self.pad_x, min(x, self.width - self.pad_x))
-        percent = (x - self.pad_x) / self.track_width
+        x = max(self.PAD_X, min(x, self.width - self.PAD_X))
+        percent = (x - self.PAD_X) / self.track_width
         return self.min_val + (percent * (self.max_val - self.min_val))
 
     def set_value(self, val):
         self.value = max(self.min_val, min(val, self.max_val))
-        self.draw()
-        if self.command:
-            self.command(self.value)
+        self.draw()  # Cheap: stays synchronous
+        # Coalesce bursts of motion events: the command runs once per idle tick with the latest value
+        if self.command and self._pending_cb is None:
+            self._pending_cb = self.after_idle(self._flush_command)
+
+    def _flush_command(self):
+        self._pending_cb = None
+        self.command(self.value)
 
     def get(self):
         return self.value
@@ -905,26 +1537,37 @@ class SleekSlider(tk.Canvas):
         self.set_value(self.pixel_to_val(event.x))
 
     def _on_drag(self, event):
-        self.set_value(self.pixel_to_val(event.x))
+        new_val = self.pixel_to_val(event.x)
+        # Sub-pixel jitter: skip the (potentially expensive) command for negligible changes
+        if abs(new_val - self.value) < (self.max_val - self.min_val) / 1000:
+            return
+        self.set_value(new_val)
 
     def draw(self):
-        self.delete("all")
-        x_start = self.pad_x
-        x_end = self.width - self.pad_x
+        x_start = self.PAD_X
+        x_end = self.width - self.PAD_X
         x_curr = self.val_to_pixel(self.value)
+        ty = self.track_y
+        r = self.THUMB_R
 
         # Track base
-        self.create_line(x_start, self.track_y, x_end, self.track_y, fill=self.track_color, width=4, capstyle=tk.ROUND)
-        # Active part
+        self.coords(self.track_item, x_start, ty, x_end, ty)
+        # Active part (hidden at the minimum)
         if x_curr > x_start:
-            self.create_line(x_start, self.track_y, x_curr, self.track_y, fill=self.accent, width=4, capstyle=tk.ROUND)
+            self.coords(self.active_item, x_start, ty, x_curr, ty)
+            self.itemconfigure(self.active_item, state="normal")
+        else:
+            self.itemconfigure(self.active_item, state="hidden")
         # Thumb
-        r = 7
-        self.create_oval(x_curr - r, self.track_y - r, x_curr + r, self.track_y + r, fill="#ffffff", outline=self.track_color, width=1)
+        self.coords(self.thumb_item, x_curr - r, ty - r, x_curr + r, ty + r)
 
 
 class ModernComboGroup(tk.Frame):
-    """Custom dropdown menu using Toplevel/Canvas. Avoids unstylable ttk.Combobox on Windows."""
+    """Custom dropdown menu using a reusable Toplevel. Avoids unstylable ttk.Combobox on Windows."""
+
+    ROW_HEIGHT = 42
+    SPACING = 5
+    MAX_HEIGHT = 300
 
     def __init__(self, parent, label_text, values=None):
         super().__init__(parent, bg=COLORS["card_bg"], highlightthickness=1, highlightbackground=COLORS["border"])
@@ -935,6 +1578,12 @@ class ModernComboGroup(tk.Frame):
         self.last_close_time = 0
         self.scroll_bind_ids = []
 
+        # Virtualized list: a pool of rows sized to the viewport, relabelled on scroll
+        self._row_pool = []  # (item_frame, label), reused across opens
+        self._first_row = 0  # Index into values shown by the first row
+        self._visible_rows = 0  # Pooled rows currently packed
+        self._page_rows = 1  # Rows fully visible in the viewport
+
         self.columnconfigure(1, weight=1)
 
         # Label on the left
@@ -962,7 +1611,8 @@ class ModernComboGroup(tk.Frame):
         # Dropdown arrow
         self.arrow_canvas = tk.Canvas(self.click_frame, width=16, height=16, bg=COLORS["card_bg"], highlightthickness=0)
         self.arrow_canvas.pack(side="right", padx=5)
-        self.draw_arrow("down")
+        self.arrow_down = self.arrow_canvas.create_polygon(4, 6, 12, 6, 8, 11, fill=COLORS["fg"], outline="")
+        self.arrow_up = self.arrow_canvas.create_polygon(4, 10, 12, 10, 8, 5, fill=COLORS["fg"], outline="", state="hidden")
 
         # Bindings
         for w in [self.click_frame, self.display_lbl, self.arrow_canvas, self.lbl]:
@@ -971,12 +1621,10 @@ class ModernComboGroup(tk.Frame):
             w.bind("<Leave>", self.on_leave)
 
     def draw_arrow(self, direction):
-        self.arrow_canvas.delete("all")
-        color = COLORS["fg"]
-        if direction == "down":
-            self.arrow_canvas.create_polygon(4, 6, 12, 6, 8, 11, fill=color, outline="")
-        else:
-            self.arrow_canvas.create_polygon(4, 10, 12, 10, 8, 5, fill=color, outline="")
+        # Both arrows exist from construction; just swap which one is visible
+        down = direction == "down"
+        self.arrow_canvas.itemconfigure(self.arrow_down, state="normal" if down else "hidden")
+        self.arrow_canvas.itemconfigure(self.arrow_up, state="hidden" if down else "normal")
 
     def on_hover(self, e):
         self.configure(highlightbackground=COLORS["accent"])
@@ -995,6 +1643,38 @@ class ModernComboGroup(tk.Frame):
         else:
             self.open_dropdown()
 
+    def _build_dropdown(self):
+        """Creates the dropdown Toplevel once. Closing withdraws it, so its rows survive between opens."""
+        self.dropdown_window = Toplevel(self)
+        self.dropdown_window.wm_overrideredirect(True)
+        self.dropdown_window.configure(bg=COLORS["border"])
+
+        self.rows_frame = tk.Frame(self.dropdown_window, bg=COLORS["dropdown_bg"])
+        self.rows_frame.pack(side="left", fill="both", expand=True, padx=1, pady=1)
+        self.scrollbar = ttk.Scrollbar(self.dropdown_window, orient="vertical", command=self._on_scrollbar, style="NoArrow.Vertical.TScrollbar")
+
+        # Close on outside click or Escape
+        self.dropdown_window.bind("<FocusOut>", self.check_focus_loss)
+        self.dropdown_window.bind("<Escape>", lambda e: self.close_dropdown())
+
+        # Wheel over the list scrolls it (rows inherit the Toplevel binding tag)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.dropdown_window.bind(seq, self._on_dropdown_wheel)
+
+    def _make_row(self, slot):
+        """One pooled list row. The click handler resolves the value from the current scroll offset."""
+        item_frame = tk.Frame(self.rows_frame, bg=COLORS["dropdown_bg"], height=self.ROW_HEIGHT, highlightthickness=1, highlightbackground="#444444")
+        item_frame.pack_propagate(False)
+
+        lbl = tk.Label(item_frame, anchor="w", font=("Segoe UI", 9), cursor="hand2", **_STYLE_ROW)
+        lbl.pack(fill="both", expand=True)
+
+        lbl.bind("<Button-1>", lambda e, i=slot: self._on_row_click(i))
+        # Item hover effect
+        lbl.bind("<Enter>", lambda e, l=lbl: l.configure(**_STYLE_ACTIVE))
+        lbl.bind("<Leave>", lambda e, l=lbl: l.configure(**_STYLE_ROW))
+        return item_frame, lbl
+
     def open_dropdown(self):
         if not self.values: return
         self.is_open = True
@@ -1002,62 +1682,68 @@ class ModernComboGroup(tk.Frame):
         self.configure(highlightbackground=COLORS["accent"])
 
         # Calculate position for the floating Toplevel window
-        ROW_HEIGHT = 42
-        SPACING = 5
+        step = self.ROW_HEIGHT + self.SPACING
         x = self.winfo_rootx()
         y = self.winfo_rooty() + self.winfo_height()
         w = self.winfo_width()
-        total_content_height = len(self.values) * (ROW_HEIGHT + SPACING)
-        window_height = min(300, total_content_height)
+        total_content_height = len(self.values) * step
+        window_height = min(self.MAX_HEIGHT, total_content_height)
 
-        # Toplevel setup
-        self.dropdown_window = Toplevel(self)
-        self.dropdown_window.wm_overrideredirect(True)
+        if self.dropdown_window is None:
+            self._build_dropdown()
         self.dropdown_window.geometry(f"{w}x{window_height}+{x}+{y}")
-        self.dropdown_window.configure(bg=COLORS["border"])
-
-        # Scrollable content using Canvas/Frame trick
-        canvas_container = tk.Canvas(self.dropdown_window, bg=COLORS["dropdown_bg"], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.dropdown_window, orient="vertical", command=canvas_container.yview, style="NoArrow.Vertical.TScrollbar")
-        scrollable_frame = tk.Frame(canvas_container, bg=COLORS["dropdown_bg"])
-
-        scrollable_frame.bind("<Configure>", lambda e: canvas_container.configure(scrollregion=canvas_container.bbox("all")))
-
-        canvas_container.create_window((0, 0), window=scrollable_frame, anchor="nw", width=w)
-        canvas_container.configure(yscrollcommand=scrollbar.set)
-        canvas_container.pack(side="left", fill="both", expand=True, padx=1, pady=1)
-
-        if total_content_height > 300:
-            scrollbar.pack(side="right", fill="y", pady=1)
-
-        # Populate list items
-        for val in self.values:
-            item_frame = tk.Frame(scrollable_frame, bg=COLORS["dropdown_bg"], height=ROW_HEIGHT, highlightthickness=1, highlightbackground="#444444")
-            item_frame.pack_propagate(False)
-            item_frame.pack(fill="x", pady=SPACING // 2, padx=4)
 
-            lbl = tk.Label(item_frame, text=f"  {val}", anchor="w",
-                           bg=COLORS["dropdown_bg"], fg=COLORS["dropdown_fg"],
-                           font=("Segoe UI", 9), cursor="hand2")
-            lbl.pack(fill="both", expand=True)
+        # Only as many rows as the viewport can show (plus a partial one); grown on demand, never destroyed
+        self._visible_rows = min(len(self.values), window_height // step + 1)
+        while len(self._row_pool) < self._visible_rows:
+            self._row_pool.append(self._make_row(len(self._row_pool)))
+        for i, (item_frame, _) in enumerate(self._row_pool):
+            if i < self._visible_rows:
+                item_frame.pack(fill="x", pady=self.SPACING // 2, padx=4)
+            else:
+                item_frame.pack_forget()
 
-            lbl.bind("<Button-1>", lambda e, v=val: self.on_select_val(v))
-            # Item hover effect
-            lbl.bind("<Enter>", lambda e, l=lbl: l.configure(bg=COLORS["accent"], fg="white"))
-            lbl.bind("<Leave>", lambda e, l=lbl: l.configure(bg=COLORS["dropdown_bg"], fg=COLORS["dropdown_fg"]))
+        self._page_rows = max(1, window_height // step)
+        if total_content_height > self.MAX_HEIGHT:
+            self.scrollbar.pack(side="right", fill="y", pady=1)
+        else:
+            self.scrollbar.pack_forget()
+        self._scroll_to(0)
 
+        self.dropdown_window.deiconify()
+        self.dropdown_window.lift()
         self.dropdown_window.focus_set()
 
-        # Close on outside click or Escape
-        self.dropdown_window.bind("<FocusOut>", self.check_focus_loss)
-        self.dropdown_window.bind("<Escape>", lambda e: self.close_dropdown())
-
         # Forward scrolling from the main window to the dropdown
         top_lvl = self.winfo_toplevel()
-        # Note: bind IDs stored for cleanup
-        self.scroll_bind_ids.append(top_lvl.bind("<MouseWheel>", self.handle_global_scroll, add="+"))
-        self.scroll_bind_ids.append(top_lvl.bind("<Button-4>", self.handle_global_scroll, add="+"))
-        self.scroll_bind_ids.append(top_lvl.bind("<Button-5>", self.handle_global_scroll, add="+"))
+        # Note: (event, bind ID) pairs stored for cleanup
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.scroll_bind_ids.append((seq, top_lvl.bind(seq, self.handle_global_scroll, add="+")))
+
+    def _scroll_to(self, first):
+        """Shows values[first:] in the pooled rows and syncs the scrollbar."""
+        n = len(self.values)
+        self._first_row = first = max(0, min(first, n - self._page_rows))
+        for i, (_, lbl) in enumerate(self._row_pool[:self._visible_rows]):
+            idx = first + i
+            lbl.configure(text=f"  {self.values[idx]}" if idx < n else "")
+        self.scrollbar.set(first / n, min(1.0, (first + self._page_rows) / n))
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.values)))
+        elif args[0] == "scroll":
+            amount = int(args[1]) * (self._page_rows if args[2] == "pages" else 1)
+            self._scroll_to(self._first_row + amount)
+
+    def _on_dropdown_wheel(self, event):
+        self._scroll_to(self._first_row + (-1 if (event.num == 4 or event.delta > 0) else 1))
+        return "break"
+
+    def _on_row_click(self, slot):
+        idx = self._first_row + slot
+        if idx < len(self.values):
+            self.on_select_val(self.values[idx])
 
     def handle_global_scroll(self, event):
         # If user scrolls but mouse is not over the dropdown, close it.
@@ -1074,7 +1760,7 @@ class ModernComboGroup(tk.Frame):
 
     def check_focus_loss(self, event):
         # Checks if focus loss was due to a click outside the app, or click on a widget inside.
-        if self.dropdown_window:
+        if self.is_open and self.dropdown_window:
             x, y = self.winfo_pointerxy()
             widget_under_mouse = self.dropdown_window.winfo_containing(x, y)
             try:
@@ -1088,18 +1774,12 @@ class ModernComboGroup(tk.Frame):
     def close_dropdown(self):
         # Remove global scroll bindings
         top_lvl = self.winfo_toplevel()
-        for bind_id in self.scroll_bind_ids:
-            try:
-                top_lvl.unbind("<MouseWheel>", bind_id)
-                top_lvl.unbind("<Button-4>", bind_id)
-                top_lvl.unbind("<Button-5>", bind_id)
-            except:
-                pass
+        for seq, bind_id in self.scroll_bind_ids:
+            top_lvl.unbind(seq, bind_id)
         self.scroll_bind_ids = []
 
         if self.dropdown_window:
-            self.dropdown_window.destroy()
-            self.dropdown_window = None
+            self.dropdown_window.withdraw()  # Kept for the next open
 
         self.is_open = False
         self.last_close_time = timer()  # Reset debounce timer
@@ -1141,6 +1821,12 @@ class BackgroundRemoverGUI:
         self.cached_blurred_shadow = None
         self._last_shadow_radius = None
         self.config = self.load_config()
+        self._config_dirty = False
+        self._config_save_job = None
+        self._saved_config_text = None  # JSON last written by save_config
+        self._debounce_jobs = {}  # Key -> pending after() id, see _debounce
+        self._preview_job = None  # Pending after_idle output re-render, see _request_preview
+        self._sidebar_scroll_job = None  # Pending after_idle scroll-region refresh, see refresh_sidebar_scroll
 
         # --- Gallery State ---
         self.gallery_files = []  # Stores {'path', 'name', 'thumb'}
@@ -1149,14 +1835,17 @@ class BackgroundRemoverGUI:
 
         # --- Export State ---
         self.export_format = self.config.get("save_file_type", "png")
-        self._flash_trans_step = 0  # For transparent/JPG conflict feedback
+        self._error_x_window = None  # Floating red 'X', built on the first invalid action
+        self._error_x_hide_job = None
+        self.last_trans_flash_time = 0  # Cooldowns for the conflict warning blinks
+        self.last_alpha_flash_time = 0
 
         # Title: shows HW mode and image count
         self.file_count = ""
         if len(self.image_paths) >= 1:
             self.file_count = f' - Image {self.current_image_index + 1} of {len(self.image_paths)}' if len(self.image_paths) > 1 else ' - Image 1 of 1'
 
-        hw_mode = "GPU" if "CPU" not in ONNX_PROVIDERS[0] else "CPU"
+        hw_mode = "GPU" if "CPU" not in provider_name(ONNX_PROVIDERS[0]) else "CPU"
         self.root.title(f"Background Remover Pro [{hw_mode}]" + self.file_count)
 
         self.setup_theme()
@@ -1195,6 +1884,9 @@ class BackgroundRemoverGUI:
         self.bg_mode = "transparent"
         self.bg_custom_color = "#0000FF"
         self.cached_blur_image = None
+        self._inpaint_cache = None  # (image, downscaled RGB, mask, inpainted background) for _compute_smart_blur
+        self._blur_inputs = None  # (image, mask, radius) cached_blur_image was made from
+        self._blur_pending = None  # Same, for the request queued on blur_worker
         self.current_blur_radius = 20
         self.loading_overlay = None
 
@@ -1203,13 +1895,16 @@ class BackgroundRemoverGUI:
 
         # GPU Priority Logic: CUDA -> DirectML -> Fallback
         if 'CUDAExecutionProvider' in available:
-            self.gpu_providers.append('CUDAExecutionProvider')
+            self.gpu_providers.append(provider_entry('CUDAExecutionProvider'))
         if 'DmlExecutionProvider' in available:
-            self.gpu_providers.append('DmlExecutionProvider')
+            self.gpu_providers.append(provider_entry('DmlExecutionProvider'))
 
         # Always add CPU as the final fallback for the GPU list
         self.gpu_providers.append('CPUExecutionProvider')
 
+        # Reduced-precision models (INT8 on CPU, FP16 on GPU). Plain bool: read from loader threads.
+        self.quantize_models = self.config.get("quantize_models", True)
+
         # Set default (GPU if available, otherwise CPU)
         if len(self.gpu_providers) > 1:
             self.active_providers = self.gpu_providers
@@ -1217,14 +1912,18 @@ class BackgroundRemoverGUI:
         else:
             self.active_providers = ['CPUExecutionProvider']
             self.current_hw_mode = "CPU"
+        self._last_hw_visual = None  # Mode the CPU/GPU buttons currently show
 
 
         # Image Loading/Placeholder
+        self.original_image_path = None
+        self._loaded_mtime = None  # Modification time of original_image_path when it was decoded
         if self.image_paths:
             self.load_image_path(self.image_paths[self.current_image_index])
         else:
             # Default empty canvas
             self.original_image = Image.new("RGBA", (800, 600), (200, 200, 200, 255))
+            self.original_image_path = None
             self.image_exif = None
 
         # Config Params (sync with loaded)
@@ -1235,11 +1934,19 @@ class BackgroundRemoverGUI:
         # Zoom / View State
         self.after_id = None
         self.zoom_delay = 0.2
+        self._view_frame_job = None  # Pending fast (NEAREST) pan/zoom render
+        self._view_frame_clear = False  # ...which also clears the SAM/paint overlay afterwards (zoom)
         self.canvas_w = 200
         self.canvas_h = 200
         self.init_width = 200
         self.init_height = 200
+        self._resize_job = None
 
+        self.mask_history = MaskHistory()  # Undo/Redo history (compressed snapshots)
+        self.preview_cache = OrderedDict()  # View state -> rendered input preview (LRU)
+        self._mip_cache = {}  # Preview source ("input", "output", "mask", "blur") -> (image, mip levels)
+        self._cb_cache = OrderedDict()  # (width, height, square_size) -> checkerboard image (LRU)
+        self._checkerboard_dims = None  # Key of the checkerboard currently in use
         self.setup_image_display()
         self.root.bind("<Configure>", self.on_resize)
 
@@ -1248,7 +1955,7 @@ class BackgroundRemoverGUI:
 
         # Smart Window Positioning
         if self.config.get("window_zoomed", True):
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 self.root.state('zoomed')
             else:
                 self.root.attributes('-zoomed', True)
@@ -1268,10 +1975,27 @@ class BackgroundRemoverGUI:
 
         # AI State (Models)
         self.model_output_mask = None  # Mask preview (blue overlay)
+        self._overlay_base = None  # (image, crop box, canvas size, blue-tinted view) for generate_coloured_overlay
         self.raw_model_mask = None  # Raw mask output (from whole image model)
+        self._raw_model_np = None  # (raw_model_mask, its pixels as an array), for the threshold slider
         self.raw_sam_logits = None  # Raw logits (from SAM)
         self.sam_active = False
         self.last_flash_time = 0
+        self.inference_worker = InferenceWorker(self.root)  # Interactive (SAM click) inference
+        self.blur_worker = InferenceWorker(self.root, maxsize=1)  # Background blur, newest request wins
+        self.model_load_pool = ThreadPoolExecutor(max_workers=MODEL_LOAD_WORKERS)  # Parallel ORT session builds
+        self.thumb_pool = ThreadPoolExecutor(max_workers=THUMB_WORKERS)  # Gallery thumbnail decoders
+        self._sessions = {}  # Loaded ORT sessions: whole-image model name / "sam_encoder" / "sam_decoder"
+        self.sam_embedding_cache = OrderedDict()  # (SAM model key, image path) -> encoder output
+        self.sam_input_source = None  # Image the SAM encoder input buffer was last filled from
+        self.sam_input_buffer = None
+        self.sam_warp_buffer = None
+        self.sam_encoder_binding = None  # (encoder session, IO binding over sam_input_buffer)
+        self._sam_encode_lock = threading.Lock()  # The encoder buffers/binding are shared by the SAM task threads
+        self._sam_load_lock = threading.Lock()  # Serialises the SAM session check-then-load across worker threads
+        self.encoder_output = None  # (image, SAM model key, embedding) last handed back to the Tk thread
+        self._models_epoch = 0  # Bumped by unload_all_models; results from tasks started before are not kept
+        self._sam_job_id = 0
 
         self.update_input_image_preview()
         self.set_keybindings()
@@ -1281,45 +2005,48 @@ class BackgroundRemoverGUI:
         self._magic_hovering = False
         self._magic_cycle_id = None
         self._magic_colors = ["#00E5FF", "#69F0AE", "#FFFF00", "#FFAB40", "#FF4081", "#EA80FC"]
-        self._magic_idx = 0
-        self._magic_step = 0
         self._magic_steps_total = 25
+        # Whole gradient cycle precomputed once: each tick is a list index instead of a color interpolation
+        n = len(self._magic_colors)
+        self._magic_lut = [self._interpolate_color(c, self._magic_colors[(i + 1) % n], step / self._magic_steps_total)
+                           for i, c in enumerate(self._magic_colors) for step in range(self._magic_steps_total + 1)]
+        self._magic_frame = 0
 
     # --- THREADING & OVERLAY HELPERS ---
 
     def show_loading(self, message="Processing AI..."):
-        """Shows the glass overlay to block UI interaction during heavy tasks."""
-        self.loading_overlay = LoadingOverlay(self.root, text=message)
-        self.loading_overlay.place(x=0, y=0, relwidth=1, relheight=1)
+        """Shows the glass overlay to block UI interaction during heavy tasks (built once, then reused)."""
+        if self.loading_overlay is None or not self.loading_overlay.winfo_exists():
+            self.loading_overlay = LoadingOverlay(self.root, text=message)
+        self.loading_overlay.show(message)
         self.root.update()
 
     def hide_loading(self):
-        """Destroys the overlay."""
-        if hasattr(self, 'loading_overlay') and self.loading_overlay:
-            self.loading_overlay.destroy()
-            self.loading_overlay = None
+        """Hides the overlay (kept alive for the next task)."""
+        if self.loading_overlay is not None and self.loading_overlay.winfo_exists():
+            self.loading_overlay.hide()
 
     def start_threaded_task(self, target_func, callback_func, error_callback=None):
         """Generic thread runner. Executes task and uses polling for result in main thread."""
-        self.result_queue = queue.Queue()
+        result_queue = queue.Queue()  # Per task, so overlapping tasks can't consume each other's results
 
         def worker():
             try:
                 result = target_func()
-                self.result_queue.put(("success", result))
+                result_queue.put(("success", result))
             except Exception as e:
-                self.result_queue.put(("error", e))
+                result_queue.put(("error", e))
 
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
 
         # Start polling in the main loop
-        self.root.after(100, lambda: self._monitor_thread(callback_func, error_callback))
+        self.root.after(TASK_POLL_MS, lambda: self._monitor_thread(result_queue, callback_func, error_callback))
 
-    def _monitor_thread(self, callback_func, error_callback):
-        """Checks the result queue every 100ms."""
+    def _monitor_thread(self, result_queue, callback_func, error_callback):
+        """Checks the result queue once per frame while the task runs (no polling once it finishes)."""
         try:
-            status, payload = self.result_queue.get_nowait()
+            status, payload = result_queue.get_nowait()
 
             # Thread finished
             self.hide_loading()
@@ -1335,7 +2062,7 @@ class BackgroundRemoverGUI:
 
         except queue.Empty:
             # Not ready, keep polling
-            self.root.after(100, lambda: self._monitor_thread(callback_func, error_callback))
+            self.root.after(TASK_POLL_MS, lambda: self._monitor_thread(result_queue, callback_func, error_callback))
 
     # --- HEADLESS / THREAD SAFE METHODS (No GUI access here!) ---
 
@@ -1357,43 +2084,45 @@ class BackgroundRemoverGUI:
         # Update UI
         self.update_hardware_buttons_visual()
 
-        # Update window title
-        title_parts = self.root.title().split("[")
-        base_title = title_parts[0].strip()
+        # Reset loaded models to force use of the new provider on next execution
+        self.unload_all_models()
+
+        # Title and status are applied together once the switch is done (one idle flush, no mid-setup redraws)
+        self.root.after_idle(self._show_hardware_mode, mode)
+
+    def _show_hardware_mode(self, mode):
+        """Updates window title and status bar after a hardware switch."""
+        base_title = self.root.title().split("[")[0].strip()
         self.root.title(f"{base_title} [{mode}]" + self.file_count)
+        self.status_label.configure(text=f"Hardware switched to {mode}. Models unloaded.", fg="white")
 
-        # Reset loaded models to force use of the new provider on next execution
+    def toggle_quantize_models(self):
+        """Switches between quantized and full-precision models. Unloads sessions so the next run reloads."""
+        self.quantize_models = self.quantize_var.get()
         self.unload_all_models()
-        self.status_label.config(text=f"Hardware switched to {mode}. Models unloaded.", fg="white")
+        state = "enabled" if self.quantize_models else "disabled"
+        self.status_label.config(text=f"Model quantization {state}. Models unloaded.", fg="white")
 
     def update_hardware_buttons_visual(self):
         """Manages the requested Toggle appearance with dark gray color."""
-        active_bg = COLORS["accent"]  # Blue (or current accent color)
-        active_fg = "white"
+        if self._last_hw_visual == self.current_hw_mode:
+            return  # Already showing this mode
+        self._last_hw_visual = self.current_hw_mode
 
-        inactive_bg = "#2D2D30"  # THE REQUESTED COLOR
-        inactive_fg = COLORS["fg"]  # Standard text color (light gray)
-
-        if self.current_hw_mode == "CPU":
-            # CPU Active
-            self.btn_run_cpu.config(bg=active_bg, fg=active_fg)
-            self.btn_run_gpu.config(bg=inactive_bg, fg=inactive_fg)
-        else:
-            # GPU Active
-            self.btn_run_cpu.config(bg=inactive_bg, fg=inactive_fg)
-            self.btn_run_gpu.config(bg=active_bg, fg=active_fg)
+        cpu_active = self.current_hw_mode == "CPU"
+        self.btn_run_cpu.configure(**(_STYLE_ACTIVE if cpu_active else _STYLE_INACTIVE))
+        self.btn_run_gpu.configure(**(_STYLE_INACTIVE if cpu_active else _STYLE_ACTIVE))
 
     def unload_all_models(self):
         """Removes ONNX sessions from memory to allow provider change."""
-        # Remove Whole Image sessions
-        attrs = list(self.__dict__.keys())
-        for attr in attrs:
-            if attr.endswith("_session") or attr in ["sam_encoder", "sam_decoder"]:
-                delattr(self, attr)
+        # Drop every session, then collect so CUDA/DML buffers go back to the driver before the next load
+        self.sam_encoder_binding = None  # References the encoder session
+        self._sessions.clear()
+        gc.collect()
 
         # Reset SAM embeddings if present
-        if hasattr(self, "encoder_output"):
-            delattr(self, "encoder_output")
+        self.encoder_output = None
+        self._models_epoch += 1
 
         # Reset button state
         self.load_models_btn.configure(state="normal", text='Pre Load Models')
@@ -1401,117 +2130,205 @@ class BackgroundRemoverGUI:
 
     def thread_safe_load_model(self, model_name):
         """Loads or retrieves a cached ONNX session using CURRENT HW providers."""
-        if not hasattr(self, f"{model_name}_session"):
+        if model_name not in self._sessions:
             path = f'{MODEL_ROOT}{model_name}.onnx'
-            sess_opts = get_ort_session_options()
-            sess = ort.InferenceSession(path, sess_opts, providers=self.active_providers)
-            setattr(self, f"{model_name}_session", sess)
-        return getattr(self, f"{model_name}_session")
-
-    def _initialise_sam_model_headless(self):
-        """Loads SAM Encoder/Decoder using CURRENT HW providers."""
-        if not hasattr(self, "sam_encoder") or self.sam_model != MODEL_ROOT + self.sam_combo.get():
-            if self.sam_combo.get() == "No Models Found":
-                raise Exception("No SAM models found.")
-
-            self.sam_model = MODEL_ROOT + self.sam_combo.get()
-            sess_opts = get_ort_session_options()
-
-            # MODIFICATION HERE: Use self.active_providers
-            self.sam_encoder = ort.InferenceSession(self.sam_model + ".encoder.onnx", sess_opts, providers=self.active_providers)
-            self.sam_decoder = ort.InferenceSession(self.sam_model + ".decoder.onnx", sess_opts, providers=self.active_providers)
-
-            if hasattr(self, "encoder_output"): delattr(self, "encoder_output")
-
-    def calculate_sam_embedding_headless(self):
-        """Calculates the static image embedding (the heaviest part of SAM)."""
-        target_size = 1024
+            self._sessions[model_name] = BoundSession(path, self.active_providers, self.quantize_models)
+        return self._sessions[model_name]
+
+    def _initialise_sam_model_headless(self, model_name=None):
+        """Loads SAM Encoder/Decoder using CURRENT HW providers and returns (encoder, decoder).
+        Workers pass model_name (the combo selection, read on the Tk thread) instead of reading the widget.
+        Callers use the returned sessions: the Tk thread may unload self._sessions in the meantime."""
+        model_name = model_name or self.sam_combo.get()
+        with self._sam_load_lock:
+            encoder = self._sessions.get("sam_encoder")
+            decoder = self._sessions.get("sam_decoder")
+            if encoder is None or decoder is None or self.sam_model != MODEL_ROOT + model_name:
+                if model_name == "No Models Found":
+                    raise Exception("No SAM models found.")
+
+                sam_model = MODEL_ROOT + model_name
+
+                # Build encoder and decoder concurrently (file IO + graph optimization overlap)
+                encoder_future = self.model_load_pool.submit(create_ort_session, sam_model + ".encoder.onnx", self.active_providers, self.quantize_models)
+                decoder_future = self.model_load_pool.submit(create_ort_session, sam_model + ".decoder.onnx", self.active_providers, self.quantize_models)
+                encoder = self._sessions["sam_encoder"] = encoder_future.result()
+                decoder = self._sessions["sam_decoder"] = decoder_future.result()
+                # Only advertise the new model once its sessions are in place
+                self.sam_model = sam_model
+        return encoder, decoder
+
+    def calculate_sam_embedding_headless(self, image, image_path, model_key, encoder):
+        """Calculates the static image embedding (the heaviest part of SAM) and returns it.
+        Only uses its arguments (captured on the Tk thread), never the current image/session attributes, so a
+        task that was overtaken by an image or model switch still embeds the picture it was submitted for.
+        Cached per (model key, image file); see _sam_model_key."""
+        cache_key = (model_key, image_path) if image_path else None
+        cached = self.sam_embedding_cache.pop(cache_key, None)  # pop + re-insert: LRU bump without a check-then-act race
+        if cached is not None:
+            self.sam_embedding_cache[cache_key] = cached
+            return cached
+
+        with self._sam_encode_lock:
+            return self._encode_sam_image(image, encoder, cache_key)
+
+    def _encode_sam_image(self, image, encoder, cache_key):
+        """Runs the SAM encoder on image through the shared input buffers (caller holds _sam_encode_lock)."""
         input_size = (684, 1024)  # Internal fixed size for SAM
-        encoder_input_name = self.sam_encoder.get_inputs()[0].name
-        img = self.original_image.convert("RGB")
-        cv_image = np.array(img)
-
-        # SAM's pre-processing transforms the image to a fixed size
-        scale_x = input_size[1] / cv_image.shape[1]
-        scale_y = input_size[0] / cv_image.shape[0]
-        scale = min(scale_x, scale_y)
-        transform_matrix = np.array([[scale, 0, 0], [0, scale, 0], [0, 0, 1]])
-        cv_image = cv2.warpAffine(cv_image, transform_matrix[:2], (input_size[1], input_size[0]), flags=cv2.INTER_LINEAR)
-
-        encoder_inputs = {encoder_input_name: cv_image.astype(np.float32)}
-        self.encoder_output = self.sam_encoder.run(None, encoder_inputs)
+        encoder_input_name = encoder.get_inputs()[0].name
+
+        # Preprocessing only depends on the image: reuse the tensor when just the model changed.
+        # Both buffers are allocated once and refilled in place for each new image.
+        if self.sam_input_source is not image:
+            if self.sam_input_buffer is None:
+                self.sam_warp_buffer = np.empty((input_size[0], input_size[1], 3), dtype=np.uint8)
+                self.sam_input_buffer = np.empty((input_size[0], input_size[1], 3), dtype=np.float32)
+
+            # RGB view of the source without a PIL round trip where possible
+            if image.mode == "RGBA":
+                cv_image = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2RGB)
+            elif image.mode == "RGB":
+                cv_image = np.asarray(image)
+            else:
+                cv_image = np.asarray(image.convert("RGB"))
+
+            # SAM's pre-processing scales the longest side to the fixed input size (top-left aligned, zero padded).
+            # Same scale as the decoder's coordinate transform; INTER_AREA when shrinking avoids aliasing.
+            scale_x = input_size[1] / cv_image.shape[1]
+            scale_y = input_size[0] / cv_image.shape[0]
+            scale = min(scale_x, scale_y)
+            new_w = min(input_size[1], max(1, int(cv_image.shape[1] * scale + 0.5)))
+            new_h = min(input_size[0], max(1, int(cv_image.shape[0] * scale + 0.5)))
+            interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+
+            self.sam_warp_buffer.fill(0)
+            roi = self.sam_warp_buffer[:new_h, :new_w]
+            cv2.resize(cv_image, (new_w, new_h), dst=roi, interpolation=interpolation)
+            np.copyto(self.sam_input_buffer, self.sam_warp_buffer, casting="unsafe")
+            self.sam_input_source = image
+
+        # Persistent IO binding: the input OrtValue shares memory with sam_input_buffer, so refilling the buffer
+        # in place is all a new image needs. Outputs are freshly allocated per run (the embedding cache keeps them).
+        # Read once: unload_all_models may reset the attribute from the Tk thread.
+        bound = self.sam_encoder_binding
+        if bound is None or bound[0] is not encoder:
+            binding = encoder.io_binding()
+            binding.bind_ortvalue_input(encoder_input_name, ort.OrtValue.ortvalue_from_numpy(self.sam_input_buffer))
+            for output in encoder.get_outputs():
+                binding.bind_output(output.name)
+            bound = self.sam_encoder_binding = (encoder, binding)
+        binding = bound[1]
+
+        encoder.run_with_iobinding(binding)
+        encoder_output = binding.copy_outputs_to_cpu()
+
+        if cache_key is not None:
+            self.sam_embedding_cache[cache_key] = encoder_output
+            if len(self.sam_embedding_cache) > SAM_EMBEDDING_CACHE_SIZE:
+                self.sam_embedding_cache.popitem(last=False)  # Evict least recently used
+        return encoder_output
+
+    def _sam_model_key(self, model_name):
+        """Identifies the encoder an embedding comes from: model file, providers and quantization. The INT8/CPU
+        and FP16/GPU variants of one model give different embeddings, so they must not share cache entries."""
+        return MODEL_ROOT + model_name, tuple(self.active_providers), self.quantize_models
+
+    def _sam_embedding_for(self, image, model_key):
+        """Embedding last handed back for this image and SAM model key, or None (Tk thread only)."""
+        current = self.encoder_output
+        if current is not None and current[0] is image and current[1] == model_key:
+            return current[2]
+        return None
 
     # -----------------------------------------------
 
     def setup_theme(self):
-        """Configures all custom ttk styles."""
+        """Configures all custom ttk styles. The styles are collected in one settings dict and sent to Tcl
+        as a single theme script (a ttk theme derived from 'clam') rather than one call per configure/map."""
         self.style = ttk.Style()
-        self.style.theme_use('clam')
 
         # File Management Buttons (specific hover effects)
         FILE_BTN_BG = "#2D2D30"
 
-        self.style.configure("Use.File.TButton", background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG)
-        self.style.map("Use.File.TButton", background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', COLORS["add"]), ('pressed', COLORS["add"])])
-
-        self.style.configure("Delete.File.TButton", background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG)
-        self.style.map("Delete.File.TButton", background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', "#D29922"), ('pressed', "#D29922")])
-
-        self.style.configure("Clean.File.TButton", background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG)
-        self.style.map("Clean.File.TButton", background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', COLORS["remove"]), ('pressed', COLORS["remove"])])
-
         # Copy In->Out button
         COPY_TEXT_HOVER = "#112A46"
         COPY_BG_HOVER = "#ACC8E5"
-        self.style.configure("Copy.TButton", padding=6, relief="flat", background=COLORS["card_bg"], foreground=COLORS["fg"], borderwidth=0, focusthickness=0, focuscolor=COLORS["card_bg"])
-        self.style.map("Copy.TButton", background=[('active', COPY_BG_HOVER), ('pressed', COPY_BG_HOVER)], foreground=[('active', COPY_TEXT_HOVER), ('pressed', COPY_TEXT_HOVER)],
-                       focuscolor=[('active', COPY_BG_HOVER), ('!active', COLORS["card_bg"])])
-
-        # Magic Button (for gradient animation)
-        self.style.configure("Magic.TButton", font=("Segoe UI", 10, "bold"), background="#6200EA", foreground="#FFFFFF", borderwidth=0, focusthickness=0)
-        self.style.map("Magic.TButton", foreground=[('active', '#101010'), ('pressed', '#101010')], background=[('pressed', '#EA80FC')])
 
         # General Styles
-        default_font = ("Segoe UI", 10) if platform.system() == "Windows" else ("Helvetica", 10)
-        bold_font = ("Segoe UI", 10, "bold") if platform.system() == "Windows" else ("Helvetica", 10, "bold")
-
-        self.style.configure(".", background=COLORS["bg"], foreground=COLORS["fg"], fieldbackground=COLORS["panel_bg"], font=default_font)
-        self.style.configure("TButton", padding=6, relief="flat", background=COLORS["card_bg"], foreground=COLORS["fg"], borderwidth=0, focusthickness=0, focuscolor=COLORS["card_bg"])
-        self.style.map("TButton", background=[('active', COLORS["accent"]), ('pressed', COLORS["accent_hover"])], foreground=[('active', 'white')],
-                       focuscolor=[('active', COLORS["accent"]), ('!active', COLORS["card_bg"])])
-
-        self.style.configure("Accent.TButton", background=COLORS["accent"], foreground="white", font=bold_font, focuscolor=COLORS["accent"])
-        self.style.map("Accent.TButton", background=[('active', COLORS["accent_hover"])], focuscolor=[('active', COLORS["accent_hover"])])
-        self.style.configure("Success.TButton", background=COLORS["card_bg"], foreground=COLORS["add"], bordercolor=COLORS["card_bg"], focuscolor=COLORS["card_bg"])
-        self.style.map("Success.TButton", background=[('active', COLORS["add"]), ('pressed', COLORS["add_hover"])], foreground=[('active', COLORS["text_dark"])],
-                       focuscolor=[('active', COLORS["add"]), ('!active', COLORS["card_bg"])])
-        self.style.configure("Danger.TButton", background=COLORS["card_bg"], foreground=COLORS["remove"], focuscolor=COLORS["card_bg"])
-        self.style.map("Danger.TButton", background=[('active', COLORS["remove"]), ('pressed', COLORS["remove_hover"])], foreground=[('active', COLORS["text_dark"])],
-                       focuscolor=[('active', COLORS["remove"]), ('!active', COLORS["card_bg"])])
-        self.style.configure("Warning.TButton", background=COLORS["card_bg"], foreground=COLORS["undo"], focuscolor=COLORS["card_bg"])
-        self.style.map("Warning.TButton", background=[('active', COLORS["undo"]), ('pressed', COLORS["undo_hover"])], foreground=[('active', COLORS["text_dark"])],
-                       focuscolor=[('active', COLORS["undo"]), ('!active', COLORS["card_bg"])])
-        self.style.configure("Flash.TButton", background="#FFD700", foreground="#000000", font=("Segoe UI", 10, "bold"))
-        self.style.configure("Export.TButton", background=COLORS["export"], foreground="white", font=bold_font, focuscolor=COLORS["export"])
-        self.style.map("Export.TButton", background=[('active', COLORS["export_hover"]), ('pressed', "#5830a8")], foreground=[('active', 'white')], focuscolor=[('active', COLORS["export_hover"])])
-        self.style.configure("Clear.TButton", background="#2D2D30", foreground="#DEA1CD", bordercolor="#2D2D30", focuscolor="#2D2D30")
-        self.style.map("Clear.TButton", background=[('active', "#DEA1CD"), ('pressed', "#c58ebf")], foreground=[('active', "#101027"), ('pressed', "#101027")],
-                       focuscolor=[('active', "#DEA1CD"), ('!active', "#2D2D30")])
-        self.style.configure("Reset.TButton", background=COLORS["card_bg"], foreground=COLORS["fg"], focuscolor=COLORS["card_bg"])
-        self.style.map("Reset.TButton", background=[('active', '#141414'), ('pressed', '#141414')], foreground=[('active', '#FF4242'), ('pressed', '#FF4242')])
-
-        self.style.configure("Processing.TButton", foreground=COLORS["undo"])
-        self.style.configure("TFrame", background=COLORS["bg"])
-        self.style.configure("Card.TFrame", background=COLORS["panel_bg"], relief="flat")
-        self.style.configure("TLabel", background=COLORS["bg"], foreground=COLORS["fg"])
-        self.style.configure("Header.TLabel", font=("Segoe UI", 11, "bold"), foreground=COLORS["header"], background=COLORS["panel_bg"])
-        self.style.configure("Sub.TLabel", font=("Segoe UI", 9), foreground="#999999", background=COLORS["panel_bg"])
-
-        self.style.configure("TCombobox", fieldbackground=COLORS["card_bg"], background=COLORS["bg"], foreground=COLORS["fg"], arrowcolor=COLORS["fg"], borderwidth=0)
-        self.style.map('TCombobox', fieldbackground=[('readonly', COLORS["card_bg"])], selectbackground=[('readonly', COLORS["accent"])])
-
-        self.style.configure("Horizontal.TScale", background=COLORS["panel_bg"], troughcolor=COLORS["bg"], borderwidth=0)
-        self.style.configure("TSeparator", background=COLORS["border"])
+        default_font = ("Segoe UI", 10) if IS_WINDOWS else ("Helvetica", 10)
+        bold_font = ("Segoe UI", 10, "bold") if IS_WINDOWS else ("Helvetica", 10, "bold")
+
+        settings = {
+            "Use.File.TButton": {
+                "configure": dict(background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG),
+                "map": dict(background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', COLORS["add"]), ('pressed', COLORS["add"])])},
+            "Delete.File.TButton": {
+                "configure": dict(background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG),
+                "map": dict(background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', "#D29922"), ('pressed', "#D29922")])},
+            "Clean.File.TButton": {
+                "configure": dict(background=FILE_BTN_BG, foreground="white", borderwidth=0, focuscolor=FILE_BTN_BG),
+                "map": dict(background=[('active', FILE_BTN_BG), ('pressed', FILE_BTN_BG)], foreground=[('active', COLORS["remove"]), ('pressed', COLORS["remove"])])},
+            "Copy.TButton": {
+                "configure": dict(padding=6, relief="flat", background=COLORS["card_bg"], foreground=COLORS["fg"], borderwidth=0, focusthickness=0, focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', COPY_BG_HOVER), ('pressed', COPY_BG_HOVER)], foreground=[('active', COPY_TEXT_HOVER), ('pressed', COPY_TEXT_HOVER)],
+                            focuscolor=[('active', COPY_BG_HOVER), ('!active', COLORS["card_bg"])])},
+            # Magic Button (for gradient animation)
+            "Magic.TButton": {
+                "configure": dict(font=("Segoe UI", 10, "bold"), background="#6200EA", foreground="#FFFFFF", borderwidth=0, focusthickness=0),
+                "map": dict(foreground=[('active', '#101010'), ('pressed', '#101010')], background=[('pressed', '#EA80FC')])},
+
+            ".": {"configure": dict(background=COLORS["bg"], foreground=COLORS["fg"], fieldbackground=COLORS["panel_bg"], font=default_font)},
+            "TButton": {
+                "configure": dict(padding=6, relief="flat", background=COLORS["card_bg"], foreground=COLORS["fg"], borderwidth=0, focusthickness=0, focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', COLORS["accent"]), ('pressed', COLORS["accent_hover"])], foreground=[('active', 'white')],
+                            focuscolor=[('active', COLORS["accent"]), ('!active', COLORS["card_bg"])])},
+            "Accent.TButton": {
+                "configure": dict(background=COLORS["accent"], foreground="white", font=bold_font, focuscolor=COLORS["accent"]),
+                "map": dict(background=[('active', COLORS["accent_hover"])], focuscolor=[('active', COLORS["accent_hover"])])},
+            "Success.TButton": {
+                "configure": dict(background=COLORS["card_bg"], foreground=COLORS["add"], bordercolor=COLORS["card_bg"], focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', COLORS["add"]), ('pressed', COLORS["add_hover"])], foreground=[('active', COLORS["text_dark"])],
+                            focuscolor=[('active', COLORS["add"]), ('!active', COLORS["card_bg"])])},
+            "Danger.TButton": {
+                "configure": dict(background=COLORS["card_bg"], foreground=COLORS["remove"], focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', COLORS["remove"]), ('pressed', COLORS["remove_hover"])], foreground=[('active', COLORS["text_dark"])],
+                            focuscolor=[('active', COLORS["remove"]), ('!active', COLORS["card_bg"])])},
+            "Warning.TButton": {
+                "configure": dict(background=COLORS["card_bg"], foreground=COLORS["undo"], focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', COLORS["undo"]), ('pressed', COLORS["undo_hover"])], foreground=[('active', COLORS["text_dark"])],
+                            focuscolor=[('active', COLORS["undo"]), ('!active', COLORS["card_bg"])])},
+            "Flash.TButton": {"configure": dict(background="#FFD700", foreground="#000000", font=("Segoe UI", 10, "bold"))},
+            "Export.TButton": {
+                "configure": dict(background=COLORS["export"], foreground="white", font=bold_font, focuscolor=COLORS["export"]),
+                "map": dict(background=[('active', COLORS["export_hover"]), ('pressed', "#5830a8")], foreground=[('active', 'white')], focuscolor=[('active', COLORS["export_hover"])])},
+            "Clear.TButton": {
+                "configure": dict(background="#2D2D30", foreground="#DEA1CD", bordercolor="#2D2D30", focuscolor="#2D2D30"),
+                "map": dict(background=[('active', "#DEA1CD"), ('pressed', "#c58ebf")], foreground=[('active', "#101027"), ('pressed', "#101027")],
+                            focuscolor=[('active', "#DEA1CD"), ('!active', "#2D2D30")])},
+            "Reset.TButton": {
+                "configure": dict(background=COLORS["card_bg"], foreground=COLORS["fg"], focuscolor=COLORS["card_bg"]),
+                "map": dict(background=[('active', '#141414'), ('pressed', '#141414')], foreground=[('active', '#FF4242'), ('pressed', '#FF4242')])},
+
+            "Processing.TButton": {"configure": dict(foreground=COLORS["undo"])},
+            "TFrame": {"configure": dict(background=COLORS["bg"])},
+            "Card.TFrame": {"configure": dict(background=COLORS["panel_bg"], relief="flat")},
+            "TLabel": {"configure": dict(background=COLORS["bg"], foreground=COLORS["fg"])},
+            "Header.TLabel": {"configure": dict(font=("Segoe UI", 11, "bold"), foreground=COLORS["header"], background=COLORS["panel_bg"])},
+            "Sub.TLabel": {"configure": dict(font=("Segoe UI", 9), foreground="#999999", background=COLORS["panel_bg"])},
+
+            "TCombobox": {
+                "configure": dict(fieldbackground=COLORS["card_bg"], background=COLORS["bg"], foreground=COLORS["fg"], arrowcolor=COLORS["fg"], borderwidth=0),
+                "map": dict(fieldbackground=[('readonly', COLORS["card_bg"])], selectbackground=[('readonly', COLORS["accent"])])},
+
+            "Horizontal.TScale": {"configure": dict(background=COLORS["panel_bg"], troughcolor=COLORS["bg"], borderwidth=0)},
+            "TSeparator": {"configure": dict(background=COLORS["border"])},
+        }
+
+        if THEME_NAME in self.style.theme_names():
+            self.style.theme_settings(THEME_NAME, settings)
+        else:
+            self.style.theme_create(THEME_NAME, parent="clam", settings=settings)
+        self.style.theme_use(THEME_NAME)
 
         # Scrollbar: remove standard arrows/grips (Dark mode aesthetic)
         try:
@@ -1530,23 +2347,14 @@ class BackgroundRemoverGUI:
 
     def _interpolate_color(self, color1, color2, t):
         # Utility for smooth color transitions (used for the 'Magic' button)
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
-        r = int(r1 + (r2 - r1) * t)
-        g = int(g1 + (g2 - g1) * t)
-        b = int(b1 + (b2 - b1) * t)
-        return f"#{r:02x}{g:02x}{b:02x}"
+        rgb1 = ModernColorPicker.hex_to_rgb(color1)  # Cached parse
+        rgb2 = ModernColorPicker.hex_to_rgb(color2)
+        return ModernColorPicker.rgb_to_hex([int(c1 + (c2 - c1) * t) for c1, c2 in zip(rgb1, rgb2)])
 
     def _get_contrast_text_color(self, hex_color):
         """Returns white or black text color based on background brightness (luminance check)."""
         if not hex_color: return "#ffffff"
-        h = hex_color.lstrip('#')
-        try:
-            r, g, b = tuple(int(h[i:i + 2], 16) for i in (0, 2, 4))
-            luminance = (0.299 * r + 0.587 * g + 0.114 * b)
-            return "#000000" if luminance > 128 else "#ffffff"
-        except Exception:
-            return "#ffffff"
+        return contrast_text_color(hex_color)
 
     def load_config(self):
         """Loads or creates default configuration from settings.json."""
@@ -1556,7 +2364,8 @@ class BackgroundRemoverGUI:
             "shadow_opacity": 0.5, "shadow_radius": 10, "shadow_x": 50, "shadow_y": 50,
             "soften_radius": 0, "last_sam_model": "No Models Found", "last_whole_model": "No Models Found",
             "window_zoomed": True,
-            "picker_geometry": None
+            "picker_geometry": None,
+            "quantize_models": True
         }
         if os.path.exists(CONFIG_FILE):
             try:
@@ -1573,58 +2382,70 @@ class BackgroundRemoverGUI:
         self.config["bg_mode"] = self.bg_mode
         self.config["bg_custom_color"] = self.bg_custom_color
         self.config["enable_shadow"] = self.enable_shadow_var.get()
-        self.config["shadow_opacity"] = self.shadow_opacity_slider.get()
-        self.config["shadow_radius"] = self.shadow_radius_slider.get()
-        self.config["shadow_x"] = self.shadow_x_slider.get()
-        self.config["shadow_y"] = self.shadow_y_slider.get()
+        if self.shadow_opacity_slider is not None:  # Unbuilt sliders still hold the loaded values
+            self.config["shadow_opacity"] = self.shadow_opacity_slider.get()
+            self.config["shadow_radius"] = self.shadow_radius_slider.get()
+            self.config["shadow_x"] = self.shadow_x_slider.get()
+            self.config["shadow_y"] = self.shadow_y_slider.get()
         self.config["soften_radius"] = self.blur_radius_var.get()
         self.config["last_sam_model"] = self.sam_combo.get()
         self.config["last_whole_model"] = self.whole_image_combo.get()
         self.config["save_file_type"] = self.export_format
+        self.config["quantize_models"] = self.quantize_models
 
         # Save window state/geometry
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             self.config["window_zoomed"] = (self.root.state() == 'zoomed')
         if not self.config["window_zoomed"]:
             self.config["window_width"] = self.root.winfo_width()
             self.config["window_height"] = self.root.winfo_height()
 
+        # Nothing changed since the last write: skip the disk IO
+        text = json.dumps(self.config, indent=4)
+        if text == self._saved_config_text:
+            self._config_dirty = False
+            return
+
+        # Write to a temp file and swap it in, so a crash mid-write can't leave a truncated settings.json
+        tmp_path = CONFIG_FILE + ".tmp"
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            with open(tmp_path, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, CONFIG_FILE)
+            self._config_dirty = False
+            self._saved_config_text = text
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    def schedule_config_save(self):
+        """Marks settings dirty and writes them once after CONFIG_SAVE_DELAY_MS (coalesces rapid changes)."""
+        self._config_dirty = True
+        if self._config_save_job is None:
+            self._config_save_job = self.root.after(CONFIG_SAVE_DELAY_MS, self._flush_config)
+
+    def _flush_config(self):
+        self._config_save_job = None
+        if self._config_dirty:
+            self.save_config()
+
     # --- DRAG AND DROP HANDLING ---
 
     def parse_tkdnd_paths(self, data):
         """Parses the DND string format into a list of file paths."""
-        import re
-        # Pattern matches content inside curly braces OR text without spaces
-        pattern = re.compile(r'\{.*?\}|\S+')
-        paths = []
-        for match in pattern.findall(data):
-            path = match.strip('{}')  # Remove the curly braces if present
-            if path:
-                paths.append(path)
-        return paths
+        return [braced or bare for braced, bare in DND_PATH_RE.findall(data) if braced or bare]
 
     def on_drop(self, event):
         """Handles drop event, distinguishing files/folders and single/multiple drops."""
         raw_paths = self.parse_tkdnd_paths(event.data)
 
-        valid_exts = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tiff'}
         import_paths = []
 
         # Recursively scan folders or add files
         for path in raw_paths:
             if os.path.isdir(path):
-                for f in os.listdir(path):
-                    if os.path.splitext(f)[1].lower() in valid_exts:
-                        import_paths.append(os.path.join(path, f))
-            elif os.path.isfile(path):
-                if os.path.splitext(path)[1].lower() in valid_exts:
-                    import_paths.append(path)
+                import_paths.extend(list_image_files(path))
+            elif has_image_extension(os.path.basename(path)) and os.path.isfile(path):
+                import_paths.append(path)
 
         if not import_paths:
             return
@@ -1650,37 +2471,59 @@ class BackgroundRemoverGUI:
             self.status_label.config(text=f"Loaded & Added: {os.path.basename(single_path)}")
 
     def load_image_path(self, path):
-        """Loads image, handles EXIF rotation, and stores metadata."""
+        """Loads image, handles EXIF rotation, and stores metadata. Skips the decode if the same,
+        unmodified file is already loaded (re-drops, gallery re-clicks)."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        if mtime is not None and path == self.original_image_path and mtime == self._loaded_mtime:
+            return
+
         print(f"Image Loaded: {path}")
+        self.original_image_path = path
         self.original_image = Image.open(path)
-        self.original_image = ImageOps.exif_transpose(self.original_image)  # Correct rotation
+        # Correct rotation. exif_transpose copies the whole image even for orientation 1, so only call it when needed
+        if self.original_image.getexif().get(0x0112, 1) != 1:
+            self.original_image = ImageOps.exif_transpose(self.original_image)
+        else:
+            self.original_image.load()  # Decode now (as exif_transpose did), which also releases the file handle
         self.image_exif = self.original_image.info.get('exif')  # Preserve EXIF for saving
+        self._loaded_mtime = mtime
 
     def on_resize(self, event):
-        """Handles responsive resizing. Recalculates zoom factor based on new canvas size."""
+        """Handles responsive resizing. Tk fires <Configure> continuously while dragging a window edge,
+        so the refit is debounced: it runs once the size has been stable for RESIZE_DEBOUNCE_MS."""
         if event.widget == self.root:
             if not self.root.winfo_height() == self.init_height or not self.root.winfo_width() == self.init_width:
-                # Reset heavy objects if size changes (e.g., SAM embeddings)
-                if hasattr(self, "encoder_output"):
-                    delattr(self, "encoder_output")
+                if self._resize_job is not None:
+                    self.root.after_cancel(self._resize_job)
+                self._resize_job = self.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        """Recalculates zoom factor based on new canvas size."""
+        self._resize_job = None
+
+        # Reset heavy objects if size changes (e.g., SAM embeddings)
+        self.encoder_output = None
 
-                self.init_width = self.root.winfo_width()
-                self.init_height = self.root.winfo_height()
-                self.root.update()
+        self.init_width = self.root.winfo_width()
+        self.init_height = self.root.winfo_height()
+        self.root.update_idletasks()  # Settle geometry before reading canvas size
 
-                self.canvas_w = self.canvas.winfo_width()
-                self.canvas_h = self.canvas.winfo_height()
+        self.canvas_w = self.canvas.winfo_width()
+        self.canvas_h = self.canvas.winfo_height()
 
-                # Calculate new minimum zoom to fit the image
-                self.lowest_zoom_factor = min(self.canvas_w / self.original_image.width, self.canvas_h / self.original_image.height)
-                self.zoom_factor = self.lowest_zoom_factor
-                self.view_x = 0
-                self.view_y = 0
-                self.min_zoom = True
-                self.checkerboard = self.create_checkerboard(self.canvas_w * 2, self.canvas_h * 2, square_size=10)
+        # Calculate new minimum zoom to fit the image
+        self.lowest_zoom_factor = min(self.canvas_w / self.original_image.width, self.canvas_h / self.original_image.height)
+        self.zoom_factor = self.lowest_zoom_factor
+        self.view_x = 0
+        self.view_y = 0
+        self.min_zoom = True
+        self.update_checkerboard()
 
-                self.update_input_image_preview(Image.BOX)
-                self.update_zoom_label()
+        self.update_input_image_preview(Image.BOX)
+        self.update_zoom_label()
 
     def update_zoom_label(self):
         effective_zoom = int(self.zoom_factor * 100)
@@ -1689,41 +2532,69 @@ class BackgroundRemoverGUI:
     def setup_image_display(self):
         """Initializes workspace state when a new image is loaded."""
         self.lowest_zoom_factor = min(self.canvas_w / self.original_image.width, self.canvas_h / self.original_image.height)
-        self.working_image = Image.new("RGBA", self.original_image.size, (0, 0, 0, 0))  # Final cut-out
-        self.working_mask = Image.new("L", self.original_image.size, 0)  # Grayscale mask (L for Luminance)
+        self.working_image = blank_image("RGBA", self.original_image.size)  # Final cut-out
+        self.working_mask = blank_image("L", self.original_image.size)  # Grayscale mask (L for Luminance)
 
-        # Undo/Redo Stacks
-        self.undo_history_mask = []
-        self.undo_history_mask.append(self.working_mask.copy())
-        self.redo_history_mask = []
+        # Undo/Redo History
+        self.mask_history.reset(self.working_mask)
 
         self.zoom_factor = self.lowest_zoom_factor
         self.view_x = 0
         self.view_y = 0
         self.min_zoom = True
-        self.checkerboard = self.create_checkerboard(self.canvas_w * 2, self.canvas_h * 2, square_size=10)
+        self.update_checkerboard()
         if hasattr(self, 'zoom_label'):
             self.update_zoom_label()
 
     def create_checkerboard(self, width, height, square_size):
-        """Generates a tiled background image for transparency visualization."""
-        num_squares_x = width // square_size
-        num_squares_y = height // square_size
-        img = Image.new('RGBA', (width, height), 'white')
-        draw = ImageDraw.Draw(img)
-        colors = [(40, 40, 40), (60, 60, 60)]  # Dark gray shades
-        for row in range(num_squares_y):
-            for col in range(num_squares_x):
-                color = colors[(row + col) % 2]
-                draw.rectangle([(col * square_size, row * square_size), ((col + 1) * square_size, (row + 1) * square_size)], fill=color)
+        """Generates a tiled background image for transparency visualization. Cached per size."""
+        key = (width, height, square_size)
+        if key in self._cb_cache:
+            self._cb_cache.move_to_end(key)
+            return self._cb_cache[key]
+
+        # One 2x2-square tile (dark gray shades), repeated with np.tile and cropped to size.
+        # RGB: the board is opaque, so an alpha channel would only add bytes to every composite
+        s = square_size
+        tile = np.empty((2 * s, 2 * s, 3), dtype=np.uint8)
+        tile[:s, :s] = tile[s:, s:] = 40
+        tile[:s, s:] = tile[s:, :s] = 60
+        reps = (-(-height // (2 * s)), -(-width // (2 * s)), 1)
+        board = np.ascontiguousarray(np.tile(tile, reps)[:height, :width])
+
+        img = Image.fromarray(board, "RGB")
+        self._cb_cache[key] = img
+        if len(self._cb_cache) > CHECKERBOARD_CACHE_SIZE:
+            self._cb_cache.popitem(last=False)  # Evict least recently used
         return img
 
+    def _over_checkerboard(self, image):
+        """Returns the RGBA preview composited over the checkerboard, as RGB. The board crop is the only new
+        image: the preview is pasted in place through its own alpha, which over an opaque board is exactly
+        alpha compositing, at 3 bytes per pixel instead of 4."""
+        background = self.checkerboard.crop((0, 0) + image.size)
+        background.paste(image, (0, 0), image)
+        return background
+
+    def update_checkerboard(self):
+        """Sizes the checkerboard to the canvas. No-op while the canvas dimensions are unchanged.
+        Previews are cropped to the viewport first and only overshoot it by the ceil'd partial source pixel,
+        i.e. by less than the zoom factor, so a MAX_ZOOM_FACTOR margin is enough (no need for a 2x board)."""
+        margin = int(MAX_ZOOM_FACTOR) + 1
+        dims = (self.canvas_w + margin, self.canvas_h + margin, 10)
+        if dims == self._checkerboard_dims:
+            return
+        self.checkerboard = self.create_checkerboard(*dims)
+        self._checkerboard_dims = dims
+
     def update_button_visual(self, btn, variable):
         """Helper to style toggle buttons based on their state."""
-        if variable.get():
-            btn.configure(bg=COLORS["accent"], fg="white")
-        else:
-            btn.configure(bg=COLORS["card_bg"], fg=COLORS["fg"])
+        self.style_toggle_button(btn, variable.get())
+
+    @staticmethod
+    def style_toggle_button(btn, enabled):
+        """Styles a toggle button from a plain bool (for modes not backed by a tk variable)."""
+        btn.configure(**(_STYLE_ACTIVE if enabled else _STYLE_TOGGLE_OFF))
 
     def create_flat_toggle(self, parent, text, variable, command=None):
         """Creates a custom flat toggle button (manual styling)."""
@@ -1740,11 +2611,8 @@ class BackgroundRemoverGUI:
 
     def build_gui(self):
         """Constructs the main application window and layout."""
-        try:
-            current_dpi = self.root.winfo_fpixels('1i')
-            scale_factor = current_dpi / 96.0
-        except Exception:
-            scale_factor = 1.0
+        # Reuse the DPI scale measured at startup instead of querying Tk again
+        scale_factor = self.dpi_scale
 
         # Responsive Min-Size calculation
         screen_w = self.root.winfo_screenwidth()
@@ -1770,6 +2638,8 @@ class BackgroundRemoverGUI:
         ttk.Label(self.input_header, text='INPUT SOURCE', style="Header.TLabel", background=COLORS["bg"]).pack(side="left")
         self.canvas = tk.Canvas(self.input_frame, name="canvas", bg="#101010", highlightthickness=1, highlightbackground=COLORS["border"], borderwidth=0)
         self.canvas.pack(expand=True, fill="both", side="top", padx=10, pady=5)
+        # One persistent preview item per canvas: renders swap its image instead of recreating it
+        self.canvas_image_item = self.canvas.create_image(0, 0, anchor=tk.NW, tags="preview")
         self.input_frame.pack(expand=True, fill="both", side="left")
 
         # Separator
@@ -1783,6 +2653,7 @@ class BackgroundRemoverGUI:
         ttk.Label(self.output_header, text='RESULT COMPOSITE', style="Header.TLabel", background=COLORS["bg"]).pack(side="left")
         self.canvas2 = tk.Canvas(self.output_frame, name="canvas2", bg="#101010", highlightthickness=1, highlightbackground=COLORS["border"], borderwidth=0)
         self.canvas2.pack(expand=True, fill="both", side="top", padx=10, pady=5)
+        self.canvas2_image_item = self.canvas2.create_image(0, 0, anchor=tk.NW, tags="preview")
         self.output_frame.pack(expand=True, fill="both", side="left")
 
         # Right Column: Sidebar (Fixed/responsive width)
@@ -1824,6 +2695,11 @@ class BackgroundRemoverGUI:
                                      borderwidth=0, command=lambda: self.set_hardware_mode("GPU"))
         self.btn_run_gpu.pack(side="left", fill="x", expand=True, padx=(1, 0), ipady=4)
 
+        # Quantization toggle (INT8 on CPU / FP16 on GPU)
+        self.quantize_var = tk.BooleanVar(value=self.quantize_models)
+        self.btn_quantize = self.create_flat_toggle(self.ModelSelection, "Quantized Models (INT8 / FP16)", self.quantize_var, self.toggle_quantize_models)
+        self.btn_quantize.pack(fill="x", pady=(0, 12), ipady=4)
+
         # SAM Model Dropdown (Custom widget)
         self.sam_combo = ModernComboGroup(self.ModelSelection, label_text="SAM MODEL")
         self.sam_combo.pack(fill="x", pady=(0, 8))
@@ -1926,7 +2802,8 @@ class BackgroundRemoverGUI:
 
         def slider_callback(val):
             self.unified_var.set(val)
-            self.on_unified_slider_change(val)
+            self.slider_val_label.config(text=f"{int(float(val))}%")
+            self._debounce("threshold", THRESHOLD_DEBOUNCE_MS, lambda: self.on_unified_slider_change(self.unified_var.get()))
 
         self.custom_slider = SleekSlider(slider_row, height=20, min_val=0, max_val=100, init_val=50,
                                          bg_color=COLORS["panel_bg"],
@@ -1967,17 +2844,14 @@ class BackgroundRemoverGUI:
         self.btn_bg_blur = tk.Button(self.bg_btn_row, text="Blur", relief="flat", bg=COLORS["card_bg"], fg=COLORS["fg"], borderwidth=0, command=lambda: self.set_bg_mode("blur"))
         self.btn_bg_blur.pack(side="left", fill="x", expand=True, padx=(1, 0), ipady=3)
         self.bg_btn_row.pack(fill="x", pady=(0, 5))
+        self._bg_mode_buttons = {"transparent": self.btn_bg_trans, "color": self.btn_bg_color, "blur": self.btn_bg_blur}
 
         # Background Color/Blur Options (Dynamically packed)
         self.bg_extra_frame = tk.Frame(self.BgSel, bg=COLORS["panel_bg"])
-        self.bg_extra_frame.pack(fill="x")
         self.btn_pick_color = tk.Button(self.bg_extra_frame, text="Color Picker", bg=self.bg_custom_color, fg="white", relief="flat", command=self.pick_bg_color)
 
-        self.blur_slider_frame = tk.Frame(self.bg_extra_frame, bg=COLORS["panel_bg"])
-        tk.Label(self.blur_slider_frame, text="Intensity:", bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Arial", 8)).pack(side="left")
-        self.bg_blur_slider = SleekSlider(self.blur_slider_frame, width=150, height=20, min_val=5, max_val=100, init_val=20, command=self.on_blur_slider_change, bg_color=COLORS["panel_bg"],
-                                          accent_color=COLORS["accent"])
-        self.bg_blur_slider.pack(side="left", fill="x", expand=True, padx=5)
+        self.blur_slider_frame = tk.Frame(self.bg_extra_frame, bg=COLORS["panel_bg"])  # Filled by _build_bg_blur_options
+        self.bg_blur_slider = None
         self.BgSel.pack(fill="x", pady=(15, 15))
 
         # Paint Mode Toggle
@@ -1986,18 +2860,9 @@ class BackgroundRemoverGUI:
         self.btn_paint.pack(fill="x", pady=(0, 1), ipady=5)
 
         # Brush Size Slider (Dynamically packed)
-        self.brush_options_frame = tk.Frame(self.StackFrame, bg=COLORS["panel_bg"])
+        self.brush_options_frame = tk.Frame(self.StackFrame, bg=COLORS["panel_bg"])  # Filled by _build_brush_options
+        self.brush_slider = None
         self.brush_size_var = tk.IntVar(value=PAINT_BRUSH_DIAMETER)
-        f_brush = tk.Frame(self.brush_options_frame, bg=COLORS["panel_bg"])
-        tk.Label(f_brush, text="Size:", width=6, bg=COLORS["panel_bg"], fg=COLORS["fg"]).pack(side="left")
-
-        def update_brush_var(v):
-            self.brush_size_var.set(int(v))
-
-        self.brush_slider = SleekSlider(f_brush, width=150, height=20, min_val=1, max_val=100, init_val=self.brush_size_var.get(), command=update_brush_var, bg_color=COLORS["panel_bg"],
-                                        accent_color=COLORS["accent"])
-        self.brush_slider.pack(side="left", fill="x", expand=True, padx=5)
-        f_brush.pack(fill="x", padx=10, pady=5)
 
         # Alpha Channel Toggle
         self.show_mask_var = tk.BooleanVar(value=False)
@@ -2009,50 +2874,17 @@ class BackgroundRemoverGUI:
         self.btn_soften = self.create_flat_toggle(self.StackFrame, "Soften Edges", self.soften_mask_var, self.toggle_soften_options)
         self.btn_soften.pack(fill="x", pady=(0, 1), ipady=5)
 
-        # Soften Options (Slider, dynamically packed)
+        # Soften Options (Slider, dynamically packed; filled by _build_soften_options)
         self.soften_options_frame = tk.Frame(self.StackFrame, bg=COLORS["panel_bg"])
-        f_soften_inner = tk.Frame(self.soften_options_frame, bg=COLORS["panel_bg"])
-        f_soften_inner.pack(fill="x", padx=10, pady=5)
-        loaded_soften = self.config.get("soften_radius", 0)
-        self.blur_radius_var = tk.IntVar(value=loaded_soften)
-        tk.Label(f_soften_inner, text="Blur:", bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Segoe UI", 8)).pack(side="left")
-        self.lbl_soften_val = tk.Label(f_soften_inner, text=str(loaded_soften), width=4, bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Segoe UI", 8, "bold"))
-        self.lbl_soften_val.pack(side="right")
-
-        def update_soften_label(val):
-            int_val = int(float(val))
-            self.blur_radius_var.set(int_val)
-            self.lbl_soften_val.config(text=str(int_val))
-            if hasattr(self, 'working_mask'):
-                self.add_drop_shadow()
-
-        self.soften_slider = SleekSlider(f_soften_inner, width=150, height=20, min_val=0, max_val=100, init_val=loaded_soften, command=update_soften_label, bg_color=COLORS["panel_bg"],
-                                         accent_color=COLORS["accent"])
-        self.soften_slider.pack(side="left", fill="x", expand=True, padx=5)
+        self.soften_slider = None
+        self.blur_radius_var = tk.IntVar(value=self.config.get("soften_radius", 0))
 
         # Drop Shadow Toggle
         self.enable_shadow_var = tk.BooleanVar(value=False)
         self.btn_shadow = self.create_flat_toggle(self.StackFrame, "Drop Shadow", self.enable_shadow_var, self.toggle_shadow_options)
         self.btn_shadow.pack(fill="x", pady=0, ipady=5)
-        self.shadow_options_frame = tk.Frame(self.Options, bg=COLORS["panel_bg"])
-
-        # Helper to create shadow sliders
-        def make_shadow_slider(parent, txt, vmin, vmax, attr, init_val):
-            f = tk.Frame(parent, bg=COLORS["panel_bg"])
-            tk.Label(f, text=txt, width=6, bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Arial", 8)).pack(side="left")
-
-            def cb(val): self.add_drop_shadow()
-
-            s = SleekSlider(f, width=150, height=20, min_val=vmin, max_val=vmax, init_val=init_val, command=cb, bg_color=COLORS["panel_bg"], accent_color=COLORS["accent"])
-            s.pack(side="left", fill="x", expand=True, padx=5)
-            f.pack(fill="x", pady=2)
-            setattr(self, attr, s)
-
-        # Shadow Options Sliders
-        make_shadow_slider(self.shadow_options_frame, "Opac:", 0, 1, "shadow_opacity_slider", self.config.get("shadow_opacity", 0.5))
-        make_shadow_slider(self.shadow_options_frame, "Blur:", 1, 50, "shadow_radius_slider", self.config.get("shadow_radius", 10))
-        make_shadow_slider(self.shadow_options_frame, "X:", -100, 100, "shadow_x_slider", self.config.get("shadow_x", 50))
-        make_shadow_slider(self.shadow_options_frame, "Y:", -100, 100, "shadow_y_slider", self.config.get("shadow_y", 50))
+        self.shadow_options_frame = tk.Frame(self.Options, bg=COLORS["panel_bg"])  # Filled by _build_shadow_options
+        self.shadow_opacity_slider = self.shadow_radius_slider = self.shadow_x_slider = self.shadow_y_slider = None
 
         self.Options.pack(fill="x", pady=(0, 15), side="top")
 
@@ -2069,6 +2901,10 @@ class BackgroundRemoverGUI:
         self.btn_fmt_webp = tk.Button(self.fmt_btn_row, text="WEBP", relief="flat", bg=COLORS["card_bg"], fg=COLORS["fg"], borderwidth=0, command=lambda: self.set_export_format("webp"))
         self.btn_fmt_webp.pack(side="left", fill="x", expand=True, padx=(1, 0), ipady=3)
         self.fmt_btn_row.pack(fill="x", pady=(0, 8))
+        self._format_buttons = {"png": self.btn_fmt_png, "jpg": self.btn_fmt_jpg, "webp": self.btn_fmt_webp}
+        if self.export_format not in self._format_buttons:  # Old or hand-edited settings.json
+            self.export_format = self.config["save_file_type"] = "png"
+        self._format_buttons[self.export_format].config(**_STYLE_ACTIVE)  # Format restored from config
 
         # Output Folder path/selection
         self.out_folder_btn = ttk.Button(self.SaveFrame, text='Set Output Folder', command=self.set_output_folder)
@@ -2112,80 +2948,81 @@ class BackgroundRemoverGUI:
             self.gallery_canvas.dnd_bind('<<Drop>>', self.on_drop)
             self.root.dnd_bind('<<Drop>>', self.on_drop)
 
-        # Restore Background/Export state from config
+        # Restore Background state from config (the export format button is highlighted when created)
         self.set_bg_mode(self.config.get("bg_mode", "transparent"))
-        self.set_export_format(self.export_format)
         if self.config["bg_custom_color"]:
             self.btn_pick_color.config(bg=self.bg_custom_color, fg=self._get_contrast_text_color(self.bg_custom_color))
 
         self.enable_shadow_var.set(False)  # Toggle state is handled by toggle_shadow_options below
-        self.shadow_opacity_slider.set_value(self.config["shadow_opacity"])
-        self.shadow_radius_slider.set_value(self.config["shadow_radius"])
-        self.shadow_x_slider.set_value(self.config["shadow_x"])
-        self.shadow_y_slider.set_value(self.config["shadow_y"])
         self.toggle_shadow_options()  # Apply initial shadow state
 
         self.update_folder_marquee()
         self.populate_models()
-        self._bind_mouse_scroll(self.scrollable_inner)  # Sidebar scroll bind
+        self._bind_mouse_scroll()  # Sidebar scroll bind
 
     def set_export_format(self, fmt):
         """Switches the export format visual state and updates config."""
+        if fmt == self.export_format:
+            return
+
+        # Only the previously active and the new button change look
+        self._format_buttons[self.export_format].config(**_STYLE_TOGGLE_OFF)
+        self._format_buttons[fmt].config(**_STYLE_ACTIVE)
         self.export_format = fmt
         self.config["save_file_type"] = fmt
 
-        # Reset all buttons
-        base_bg = COLORS["card_bg"];
-        base_fg = COLORS["fg"]
-        active_bg = COLORS["accent"];
-        active_fg = "white"
+        self.schedule_config_save()
 
-        self.btn_fmt_png.config(bg=base_bg, fg=base_fg)
-        self.btn_fmt_jpg.config(bg=base_bg, fg=base_fg)
-        self.btn_fmt_webp.config(bg=base_bg, fg=base_fg)
+    def _build_error_x_window(self):
+        """Borderless topmost window holding the red 'X'. Built once, then only moved and shown/withdrawn."""
+        size = 20
+        line_width = 3
 
-        # Highlight active button
-        if fmt == "png":
-            self.btn_fmt_png.config(bg=active_bg, fg=active_fg)
-        elif fmt == "jpg":
-            self.btn_fmt_jpg.config(bg=active_bg, fg=active_fg)
-        elif fmt == "webp":
-            self.btn_fmt_webp.config(bg=active_bg, fg=active_fg)
+        top = Toplevel(self.root)
+        top.withdraw()
+        top.overrideredirect(True)
+        top.attributes('-topmost', True)
 
-        self.save_config()
+        # Windows transparency hack
+        bg_col = "#000001"
+        if IS_WINDOWS:
+            try:
+                top.attributes('-transparentcolor', bg_col)
+            except:
+                pass
+
+        cv = tk.Canvas(top, width=size, height=size, bg=bg_col, highlightthickness=0)
+        cv.pack(fill="both", expand=True)
+
+        pad = 2
+        cv.create_line(pad, pad, size - pad, size - pad, fill="#FF0000", width=line_width, capstyle=tk.ROUND)
+        cv.create_line(pad, size - pad, size - pad, pad, fill="#FF0000", width=line_width, capstyle=tk.ROUND)
+        return top
 
     def show_floating_error_x(self):
         """Displays a temporary red 'X' under the cursor for invalid actions (e.g., JPG + Transp)."""
         try:
+            if self._error_x_window is None:
+                self._error_x_window = self._build_error_x_window()
             x, y = self.root.winfo_pointerxy()
-            size = 20;
-            line_width = 3
-
-            top = Toplevel(self.root)
-            top.overrideredirect(True)
-            top.attributes('-topmost', True)
+            size = 20
+            top = self._error_x_window
             top.geometry(f"{size}x{size}+{x - size // 2}+{y - size // 2}")
+            top.deiconify()
+            top.lift()
 
-            # Windows transparency hack
-            bg_col = "#000001"
-            if platform.system() == "Windows":
-                try:
-                    top.attributes('-transparentcolor', bg_col)
-                except:
-                    pass
-
-            cv = tk.Canvas(top, bg=bg_col, highlightthickness=0)
-            cv.pack(fill="both", expand=True)
-
-            pad = 2
-            cv.create_line(pad, pad, size - pad, size - pad, fill="#FF0000", width=line_width, capstyle=tk.ROUND)
-            cv.create_line(pad, size - pad, size - pad, pad, fill="#FF0000", width=line_width, capstyle=tk.ROUND)
-
-            self.root.after(800, top.destroy)
+            # A repeat error restarts the timer instead of stacking another window
+            if self._error_x_hide_job is not None:
+                self.root.after_cancel(self._error_x_hide_job)
+            self._error_x_hide_job = self.root.after(800, self._hide_error_x)
 
         except Exception as e:
             print(f"Error showing floating X: {e}")
 
+    def _hide_error_x(self):
+        self._error_x_hide_job = None
+        self._error_x_window.withdraw()
+
     def validate_export_config(self, triggering_widget=None, event=None):
         """Checks for the 'JPG + Transparent Background' conflict."""
         if self.export_format == "jpg" and self.bg_mode == "transparent":
@@ -2194,44 +3031,26 @@ class BackgroundRemoverGUI:
 
             # Flash relevant buttons for user feedback (with cooldown)
             now = timer()
-            if not hasattr(self, 'last_trans_flash_time'): self.last_trans_flash_time = 0
-
-            if now - self.last_trans_flash_time > 4.0:
+            if now - self.last_trans_flash_time > FLASH_COOLDOWN_S:
                 self.last_trans_flash_time = now
-                if hasattr(self, 'btn_bg_trans'):
-                    self._flash_trans_step = 0
-                    self.animate_transparent_flash()
+                self._flash_widgets((self.btn_bg_trans, self.btn_fmt_jpg), self._restore_transparent_jpg)
             return False
         return True
 
-    def animate_transparent_flash(self):
-        """Flashes 'Transparent' and 'JPG' buttons yellow to indicate conflict."""
-        if not hasattr(self, 'btn_bg_trans') or not self.btn_bg_trans.winfo_exists(): return
-        if not hasattr(self, 'btn_fmt_jpg') or not self.btn_fmt_jpg.winfo_exists(): return
-
-        # FIX: Determine correct color based on current selection
-        is_jpg_selected = (self.export_format == "jpg")
-        
-        jpg_rest_bg = COLORS["accent"] if is_jpg_selected else COLORS["card_bg"]
-        jpg_rest_fg = "white" if is_jpg_selected else COLORS["fg"]
-
-        if self._flash_trans_step >= 6:
-            # End of animation: Restore original state
-            self.btn_bg_trans.config(bg=COLORS["accent"], fg="white")
-            self.btn_fmt_jpg.config(bg=jpg_rest_bg, fg=jpg_rest_fg) 
-            return
+    def _restore_transparent_jpg(self):
+        """Resting look of the 'Transparent' and 'JPG' buttons (either may have been deselected meanwhile)."""
+        self.btn_bg_trans.config(**(_STYLE_ACTIVE if self.bg_mode == "transparent" else _STYLE_TOGGLE_OFF))
+        self.btn_fmt_jpg.config(**(_STYLE_ACTIVE if self.export_format == "jpg" else _STYLE_TOGGLE_OFF))
 
-        is_yellow = (self._flash_trans_step % 2 == 0)
-        if is_yellow:
-            self.btn_bg_trans.config(bg="#FFD700", fg="black")
-            self.btn_fmt_jpg.config(bg="#FFD700", fg="black")
-        else:
-            # Animation off-cycle: Restore original state
-            self.btn_bg_trans.config(bg=COLORS["accent"], fg="white")
-            self.btn_fmt_jpg.config(bg=jpg_rest_bg, fg=jpg_rest_fg)
+    def _flash_widgets(self, widgets, restore):
+        """Blinks widgets yellow FLASH_BLINKS times, calling restore() on the off beats and at the end.
+        The whole schedule is queued up front rather than each beat re-arming the next one."""
+        def highlight():
+            for w in widgets:
+                w.config(**_STYLE_FLASH)
 
-        self._flash_trans_step += 1
-        self.root.after(150, self.animate_transparent_flash)
+        for beat in range(2 * FLASH_BLINKS + 1):
+            self.root.after(beat * FLASH_BEAT_MS, highlight if beat % 2 == 0 and beat < 2 * FLASH_BLINKS else restore)
 
     def trigger_alpha_conflict_warning(self):
         """Triggers visual feedback when attempting effects while Alpha Channel is active."""
@@ -2240,64 +3059,37 @@ class BackgroundRemoverGUI:
 
         # Cooldown check
         now = timer()
-        if not hasattr(self, 'last_alpha_flash_time'): self.last_alpha_flash_time = 0
-
-        if now - self.last_alpha_flash_time > 4.0:
+        if now - self.last_alpha_flash_time > FLASH_COOLDOWN_S:
             self.last_alpha_flash_time = now
-            self._alpha_flash_step = 0
-            self._animate_alpha_flash_loop()
-
-    def _animate_alpha_flash_loop(self):
-        """Flashes the Alpha Channel button yellow 3 times."""
-        if not hasattr(self, 'btn_mask') or not self.btn_mask.winfo_exists(): return
-
-        if self._alpha_flash_step >= 6:
-            # Restore original visual state (logically ON, but showing the variable state)
-            self.update_button_visual(self.btn_mask, self.show_mask_var)
-            return
-
-        is_yellow = (self._alpha_flash_step % 2 == 0)
-
-        if is_yellow:
-            self.btn_mask.configure(bg="#FFD700", fg="black")
-        else:
-            # Restore the 'ON' state look temporarily
-            self.btn_mask.configure(bg=COLORS["accent"], fg="white")
-
-        self._alpha_flash_step += 1
-        self.root.after(150, self._animate_alpha_flash_loop)
+            # Off beats show the variable state (logically ON)
+            self._flash_widgets((self.btn_mask,), lambda: self.update_button_visual(self.btn_mask, self.show_mask_var))
 
     def set_bg_mode(self, mode):
         """Switches the background compositing mode (Transparent/Color/Blur)."""
-        self.bg_mode = mode
+        if mode == self.bg_mode:
+            return
 
-        # Reset button visuals
-        self.btn_bg_trans.config(bg=COLORS["card_bg"], fg=COLORS["fg"])
-        self.btn_bg_color.config(bg=COLORS["card_bg"], fg=COLORS["fg"])
-        self.btn_bg_blur.config(bg=COLORS["card_bg"], fg=COLORS["fg"])
+        # Only the previously active and the new button change look
+        self._bg_mode_buttons[self.bg_mode].config(**_STYLE_TOGGLE_OFF)
+        self._bg_mode_buttons[mode].config(**_STYLE_ACTIVE)
+        self.bg_mode = mode
 
         # Hide all extra options
         self.bg_extra_frame.pack_forget()
         self.btn_pick_color.pack_forget()
         self.blur_slider_frame.pack_forget()
 
-        if mode == "transparent":
-            self.btn_bg_trans.config(bg=COLORS["accent"], fg="white")
-
-        elif mode == "color":
-            self.btn_bg_color.config(bg=COLORS["accent"], fg="white")
+        if mode == "color":
             self.bg_extra_frame.pack(fill="x")
             self.btn_pick_color.pack(fill="x", padx=10, pady=2)
 
         elif mode == "blur":
-            self.btn_bg_blur.config(bg=COLORS["accent"], fg="white")
             self.bg_extra_frame.pack(fill="x")
+            self._build_bg_blur_options()
             self.blur_slider_frame.pack(fill="x", padx=10, pady=2)
-            if self.cached_blur_image is None:
-                self.regenerate_smart_blur()  # Pre-generate blur if needed
+            self.request_smart_blur()  # Pre-generate blur if needed
 
-        self.update_output_image_preview()
-        self.scrollable_inner.update_idletasks()
+        self._request_preview()
         self.refresh_sidebar_scroll()  # Update scroll region
 
     def pick_bg_color(self):
@@ -2308,10 +3100,12 @@ class BackgroundRemoverGUI:
             return
 
         def on_picker_update(hex_color):
+            if hex_color == self.bg_custom_color:
+                return  # e.g. Apply without moving: nothing to reconfigure or re-composite
             self.bg_custom_color = hex_color
             text_color = self._get_contrast_text_color(self.bg_custom_color)
             self.btn_pick_color.config(bg=self.bg_custom_color, fg=text_color)
-            self.update_output_image_preview()
+            self._request_preview()
 
         def on_picker_close(geo):
             self.config["picker_geometry"] = geo
@@ -2327,42 +3121,104 @@ class BackgroundRemoverGUI:
 
     def on_blur_slider_change(self, val):
         self.current_blur_radius = float(val)
-        self.regenerate_smart_blur()
-        self.update_output_image_preview()
+        self._debounce("bgblur", BG_BLUR_DEBOUNCE_MS, self._apply_bg_blur)
+
+    def _apply_bg_blur(self):
+        self.request_smart_blur()  # Refreshes the preview when done
 
     def regenerate_smart_blur(self):
-        """Creates an Inpainted + Blurred version of the background. Expensive, so it's cached."""
+        """Creates an Inpainted + Blurred version of the background now, on the calling thread."""
         if not hasattr(self, "original_image"): return
+        inputs = (self.original_image, self.working_mask, self.current_blur_radius)
+        self._store_smart_blur(inputs, self._compute_smart_blur(*inputs))
 
-        # Downscale for performance during computationally heavy inpainting
-        max_dim = 512
-        scale = min(max_dim / self.original_image.width, max_dim / self.original_image.height)
-        new_w = int(self.original_image.width * scale)
-        new_h = int(self.original_image.height * scale)
+    def request_smart_blur(self):
+        """Recomputes the background blur on the blur worker and refreshes the preview when it lands.
+        Only the newest request waits in the queue, so a burst of mask edits costs one extra run at most."""
+        if not hasattr(self, "original_image"): return
+        inputs = (self.original_image, self.working_mask, self.current_blur_radius)
+        if self._blur_is_for(self._blur_pending, inputs) or (
+                self.cached_blur_image is not None and self._blur_is_for(self._blur_inputs, inputs)):
+            return  # Already queued or done
+
+        def on_done(result):
+            if self._blur_pending is inputs:
+                self._blur_pending = None
+            if inputs[0] is self.original_image:  # Drop results for an image that was replaced meanwhile
+                self._store_smart_blur(inputs, result)
+                self._request_preview()
 
-        small_img = self.original_image.resize((new_w, new_h), Image.BILINEAR).convert("RGB")
-        small_mask = self.working_mask.resize((new_w, new_h), Image.NEAREST)
+        def on_fail(err):
+            if self._blur_pending is inputs:
+                self._blur_pending = None
+            print(f"Background blur failed: {err}")
 
-        cv_img = np.array(small_img)
-        mask_arr = np.array(small_mask)
+        self._blur_pending = inputs
+        self.blur_worker.submit(lambda: self._compute_smart_blur(*inputs), on_done, on_fail)
 
-        # Inpainting fills the area occupied by the subject
-        try:
-            inpainted = cv2.inpaint(cv_img, mask_arr, 3, cv2.INPAINT_TELEA)
-        except:
-            inpainted = cv_img  # Fallback if cv2 fails
+    @staticmethod
+    def _blur_is_for(blur_inputs, inputs):
+        """True when a blur made from blur_inputs matches inputs (image and mask by identity, radius by value)."""
+        return (blur_inputs is not None and blur_inputs[0] is inputs[0] and blur_inputs[1] is inputs[1]
+                and blur_inputs[2] == inputs[2])
+
+    def _store_smart_blur(self, inputs, result):
+        self.cached_blur_image, inpaint_cache = result
+        self._blur_inputs = inputs
+        if inpaint_cache[0] is self.original_image:
+            self._inpaint_cache = inpaint_cache
+
+    def _compute_smart_blur(self, image, mask, blur_radius):
+        """Inpaints the subject's area and blurs the result. Thread safe: reads self._inpaint_cache but only
+        returns (blur image, new inpaint cache); the caller stores both on the Tk thread."""
+        # Downscale for performance during computationally heavy inpainting
+        max_dim = 512
+        scale = min(max_dim / image.width, max_dim / image.height)
+        new_w = int(image.width * scale)
+        new_h = int(image.height * scale)
+
+        # The downscaled source only depends on the image, the inpaint on the image and mask (both replaced,
+        # never edited in place): mask edits skip the full-res downscale, blur slider moves skip both
+        cache = self._inpaint_cache
+        if cache is not None and cache[0] is image and cache[2] is mask:
+            inpainted = cache[3]
+        else:
+            if cache is not None and cache[0] is image:
+                cv_img = cache[1]
+            else:
+                # reducing_gap: Pillow box-reduces by an integer factor first, then resamples the small remainder
+                cv_img = np.array(image.resize((new_w, new_h), Image.BILINEAR, reducing_gap=2.0).convert("RGB"))
+            mask_arr = np.array(mask.resize((new_w, new_h), Image.NEAREST))
 
-        # Apply Gaussian Blur (Radius scaled by downsample factor)
-        radius = int(self.current_blur_radius * scale)
+            # Fill the area occupied by the subject so it doesn't bleed into the blur
+            if HIGH_QUALITY_BG_BLUR:
+                try:
+                    inpainted = cv2.inpaint(cv_img, mask_arr, 3, cv2.INPAINT_TELEA)
+                except:
+                    inpainted = cv_img  # Fallback if cv2 fails
+            else:
+                inpainted = fill_masked(cv_img, mask_arr)
+            cache = (image, cv_img, mask, inpainted)
+
+        # Apply Gaussian Blur (Radius scaled by downsample factor). The radius is treated as a kernel size;
+        # convert it to the sigma OpenCV would derive for that kernel so the blur strength is unchanged.
+        radius = int(blur_radius * scale)
         if radius % 2 == 0: radius += 1  # Radius must be odd
-        blurred = cv2.GaussianBlur(inpainted, (radius, radius), 0)
+        sigma = 0.3 * ((radius - 1) * 0.5 - 1) + 0.8
+        blurred = gaussian_blur(inpainted, sigma, BG_BLUR_STACK_MIN_SIGMA)
 
         # Upscale back to original image size
-        final_blur = Image.fromarray(blurred).resize(self.original_image.size, Image.BILINEAR)
-        self.cached_blur_image = final_blur
+        return Image.fromarray(blurred).resize(image.size, Image.BILINEAR), cache
 
     def refresh_sidebar_scroll(self):
-        """Forces the scrollbar to recalculate its visible area after packing/forgetting a widget."""
+        """Schedules a scroll-region refresh after packing/forgetting a widget. Runs once per idle tick, so
+        handlers that repack several panels settle the layout once instead of once per call."""
+        if self._sidebar_scroll_job is None:
+            self._sidebar_scroll_job = self.root.after_idle(self._apply_sidebar_scroll)
+
+    def _apply_sidebar_scroll(self):
+        """Forces the scrollbar to recalculate its visible area."""
+        self._sidebar_scroll_job = None
         self.scrollable_inner.update_idletasks()
         req_height = self.scrollable_inner.winfo_reqheight()
         canvas_height = self.ctrl_canvas.winfo_height()
@@ -2377,32 +3233,36 @@ class BackgroundRemoverGUI:
         new_height = max(event.height, req_height)
         self.ctrl_canvas.itemconfig(self.canvas_window_id, height=new_height)
 
-    def _bind_mouse_scroll(self, widget):
-        """Recursively binds mouse scroll to all child widgets in the sidebar for smooth scrolling."""
-        widget.bind("<MouseWheel>", self._on_ctrl_mousewheel)
-        widget.bind("<Button-4>", self._on_ctrl_mousewheel)
-        widget.bind("<Button-5>", self._on_ctrl_mousewheel)
-        for child in widget.winfo_children():
-            self._bind_mouse_scroll(child)
+    def _bind_mouse_scroll(self):
+        """Binds sidebar scrolling once on the 'all' tag instead of on every sidebar widget. The handler filters
+        by widget path, which also covers option panels built later. (Not on the root's tag: the dropdowns'
+        unbind(seq, funcid) clears the whole sequence there on older Pythons.)"""
+        self._sidebar_path = str(self.ctrl_canvas)
+        self._sidebar_prefix = self._sidebar_path + "."
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(seq, self._on_ctrl_mousewheel)
 
     def _on_ctrl_mousewheel(self, event):
         """Handles scrolling the sidebar's canvas."""
-        # Close any open dropdowns on scroll
-        if hasattr(self, "sam_combo") and self.sam_combo.is_open: self.sam_combo.close_dropdown()
-        if hasattr(self, "whole_image_combo") and self.whole_image_combo.is_open: self.whole_image_combo.close_dropdown()
+        path = str(event.widget)
+        if path != self._sidebar_path and not path.startswith(self._sidebar_prefix):
+            return  # Wheel over some other widget (image canvases zoom with their own binding)
+
+        # Close any open dropdowns on scroll (both exist once the sidebar does)
+        if self.sam_combo.is_open: self.sam_combo.close_dropdown()
+        if self.whole_image_combo.is_open: self.whole_image_combo.close_dropdown()
 
         if self.ctrl_canvas.yview() == (0.0, 1.0): return  # At end
 
-        scroll_units = 0
-        if event.num == '??':
-            if platform.system() == "Windows":
-                scroll_units = int(-1 * (event.delta / 120))
-            else:
-                scroll_units = int(-1 * event.delta)
-        elif event.num == 4:
+        # X11 reports wheel notches as buttons 4/5; Windows/macOS as <MouseWheel> deltas (num is '??')
+        if event.num == 4:
             scroll_units = -1
         elif event.num == 5:
             scroll_units = 1
+        elif IS_WINDOWS:
+            scroll_units = int(-event.delta / 120)
+        else:
+            scroll_units = -event.delta
 
         if scroll_units != 0:
             self.ctrl_canvas.yview_scroll(scroll_units, "units")
@@ -2418,19 +3278,18 @@ class BackgroundRemoverGUI:
         if not path: path = "(Input Folder)"
 
         self.marquee_text = f" {path} "  # Add padding for wrapping effect
+        if len(self.marquee_text) <= MARQUEE_WIDTH:
+            self.folder_path_var.set(path)  # Fits: static text, no timer
+            return
         self.marquee_index = 0
         self.marquee_direction = 1
         self.animate_marquee()
 
     def animate_marquee(self):
-        """Marquee animation loop."""
-        window_len = 30
+        """Marquee animation loop (only started for paths longer than MARQUEE_WIDTH)."""
+        window_len = MARQUEE_WIDTH
         text_len = len(self.marquee_text)
 
-        if text_len <= window_len:
-            self.folder_path_var.set(self.marquee_text.strip())
-            return
-
         start = self.marquee_index
         end = start + window_len
         display_text = self.marquee_text[start:end]
@@ -2450,15 +3309,15 @@ class BackgroundRemoverGUI:
                 self.marquee_direction = 1
                 self.marquee_index += 1
 
-        self.marquee_after_id = self.root.after(300, self.animate_marquee)
+        self.marquee_after_id = self.root.after(MARQUEE_STEP_MS, self.animate_marquee)
 
     def toggle_area_mode(self):
         self.area_enabled = not self.area_enabled
-        self.update_button_visual(self.btn_get_area, tk.BooleanVar(value=self.area_enabled))
+        self.style_toggle_button(self.btn_get_area, self.area_enabled)
 
     def toggle_move_mode(self):
         self.move_enabled = not self.move_enabled
-        self.update_button_visual(self.btn_move, tk.BooleanVar(value=self.move_enabled))
+        self.style_toggle_button(self.btn_move, self.move_enabled)
 
     def load_selected_models(self):
         """Starts background model loading to avoid UI freeze."""
@@ -2466,14 +3325,17 @@ class BackgroundRemoverGUI:
         self.show_loading("Pre-loading Models")
 
         def heavy_load():
-            # Load SAM parts
-            self._initialise_sam_model_headless()
-
-            # Load Whole Image Model
+            # Load Whole Image Model in the background while the SAM parts load
             whole_model_name = self.whole_image_combo.get()
+            whole_future = None
             if whole_model_name and whole_model_name != "No Models Found":
-                self.thread_safe_load_model(whole_model_name)
+                whole_future = self.model_load_pool.submit(self.thread_safe_load_model, whole_model_name)
+
+            # Load SAM parts
+            self._initialise_sam_model_headless()
 
+            if whole_future is not None:
+                whole_future.result()  # Re-raises load errors
             return "Done"
 
         def on_complete(res):
@@ -2489,16 +3351,16 @@ class BackgroundRemoverGUI:
 
     def populate_models(self):
         """Scans Models/ directory and populates dropdown lists."""
+        filenames = os.listdir(MODEL_ROOT) if os.path.isdir(MODEL_ROOT) else []  # One scan for both lists
 
         # 1. SAM Models: find both encoder and decoder parts
         sam_matches = []
         for partial_name in ["mobile_sam", "sam_vit_b", "sam_vit_h", "sam_vit_l"]:
-            if os.path.exists(MODEL_ROOT):
-                for filename in os.listdir(MODEL_ROOT):
-                    # Check for either part and extract the common name
-                    if partial_name in filename and (".encoder.onnx" in filename or ".decoder.onnx" in filename):
-                        cln = filename.replace(".encoder.onnx", "").replace(".decoder.onnx", "")
-                        sam_matches.append(cln)
+            for filename in filenames:
+                # Check for either part and extract the common name
+                if partial_name in filename and (".encoder.onnx" in filename or ".decoder.onnx" in filename):
+                    cln = filename.replace(".encoder.onnx", "").replace(".decoder.onnx", "")
+                    sam_matches.append(cln)
 
         if sam_matches:
             models = list(dict.fromkeys(sam_matches))  # Remove duplicates
@@ -2515,10 +3377,9 @@ class BackgroundRemoverGUI:
         # 2. Whole Image Models: find single ONNX files
         whole_matches = []
         for partial_name in ["rmbg", "isnet", "u2net", "BiRefNet"]:
-            if os.path.exists(MODEL_ROOT):
-                for filename in os.listdir(MODEL_ROOT):
-                    if partial_name in filename and ".onnx" in filename:
-                        whole_matches.append(filename.replace(".onnx", ""))
+            for filename in filenames:
+                if partial_name in filename and ".onnx" in filename:
+                    whole_matches.append(filename.replace(".onnx", ""))
 
         if whole_matches:
             models = list(dict.fromkeys(whole_matches))
@@ -2592,7 +3453,7 @@ class BackgroundRemoverGUI:
         """Updates the viewport coordinates and clamps them to image bounds."""
         self.view_x = max(0, min(self.view_x + dx, self.original_image.width - self.canvas_w / self.zoom_factor))
         self.view_y = max(0, min(self.view_y + dy, self.original_image.height - self.canvas_h / self.zoom_factor))
-        self.update_input_image_preview(Image.NEAREST)
+        self.request_view_frame()
         self.schedule_preview_update()
 
     def start_pan_mouse(self, event):
@@ -2620,7 +3481,7 @@ class BackgroundRemoverGUI:
                 self.pan_start_y = event.y
                 self.clear_coord_overlay()  # Clear SAM/Box if panning
                 self.model_output_mask = None
-                self.update_input_image_preview(Image.NEAREST)  # Use fast nearest neighbor resampling
+                self.request_view_frame()  # Fast nearest neighbor render, once per frame
 
     def end_pan_mouse(self, event):
         was_panning = self.panning
@@ -2634,7 +3495,10 @@ class BackgroundRemoverGUI:
             if self.sam_active:
                 self.generate_sam_mask(event)
         elif was_panning:
-            # Re-render zoomed image using quality resampling (Box filter)
+            # Re-render zoomed image using quality resampling (Box filter); a pending fast frame is now stale
+            if self._view_frame_job is not None:
+                self.root.after_cancel(self._view_frame_job)
+                self._view_frame_job = None
             self.update_input_image_preview(Image.BOX)
 
     def zoom(self, event):
@@ -2665,123 +3529,220 @@ class BackgroundRemoverGUI:
 
         # Fast update using NEAREST filter while zooming, defer quality update
         if self.min_zoom == False:
-            self.update_input_image_preview(resampling_filter=Image.NEAREST)
-            self.clear_coord_overlay()
+            self.request_view_frame(clear_overlay=True)
         if self.lowest_zoom_factor == self.zoom_factor: self.min_zoom = True
         self.schedule_preview_update()
 
+    def request_view_frame(self, clear_overlay=False):
+        """Schedules a fast NEAREST render of the current view. Tk delivers motion and wheel events faster than
+        the canvases can redraw, so events within one VIEW_FRAME_MS frame share a single render of the latest
+        view. Frames only redraw the input canvas: the output composite (background, shadow) costs several times
+        more, so it follows once with the quality BOX render via schedule_preview_update / end_pan_mouse."""
+        self._view_frame_clear |= clear_overlay
+        if self._view_frame_job is None:
+            self._view_frame_job = self.root.after(VIEW_FRAME_MS, self._render_view_frame)
+
+    def _render_view_frame(self):
+        self._view_frame_job = None
+        self.update_input_image_preview(resampling_filter=Image.NEAREST, update_output=False)
+        if self._view_frame_clear:
+            # After the render, so the cleared preview mask matches the new crop size
+            self._view_frame_clear = False
+            self.clear_coord_overlay()
+
     def schedule_preview_update(self):
         """Debounces quality re-rendering after fast operations (zoom/pan)."""
         if self.after_id: self.root.after_cancel(self.after_id)
         self.after_id = self.root.after(int(self.zoom_delay * 1000), self.update_preview_delayed)
 
+    def _debounce(self, key, delay_ms, fn):
+        """Runs fn once no call with the same key has arrived for delay_ms (restarts the timer per call)."""
+        job = self._debounce_jobs.get(key)
+        if job is not None:
+            self.root.after_cancel(job)
+
+        def fire():
+            del self._debounce_jobs[key]
+            fn()
+
+        self._debounce_jobs[key] = self.root.after(delay_ms, fire)
+
     def update_preview_delayed(self):
         """Performs the quality re-render with the slower but better BOX filter."""
         self.update_input_image_preview(resampling_filter=Image.BOX)
         self.after_id = None
 
-    def _calculate_preview_image(self, image, resampling_filter):
-        """Crops and resizes an image based on current zoom/pan state."""
+    def _preview_crop_box(self, image):
+        """Crop box of the image region visible at the current zoom/pan state."""
         view_width = self.canvas_w / self.zoom_factor
         view_height = self.canvas_h / self.zoom_factor
 
-        # Crop box coordinates
         left = int(self.view_x)
         top = int(self.view_y)
         right = int(self.view_x + min(math.ceil(view_width), image.width))
         bottom = int(self.view_y + min(math.ceil(view_height), image.height))
-        image_to_display = image.crop((left, top, right, bottom))
+        return left, top, right, bottom
+
+    def _mip_levels(self, image, slot):
+        """Mip levels of the image currently shown in slot. Images are replaced, never edited in place, so the
+        levels are rebuilt only when the slot's image object changes (mask edits, undo/redo, new image)."""
+        entry = self._mip_cache.get(slot)
+        if entry is not None and entry[0] is image:
+            return entry[1]
+        levels = build_mip_levels(image)
+        self._mip_cache[slot] = (image, levels)  # Replacing the entry releases the previous image's levels
+        return levels
+
+    def _calculate_preview_image(self, image, resampling_filter, mip_slot=None):
+        """Crops and resizes an image based on current zoom/pan state. With a mip_slot, zoomed-out views are
+        resampled from the smallest mip level that still has a pixel per screen pixel, not from full resolution."""
+        left, top, right, bottom = self._preview_crop_box(image)
 
         # Scaled canvas size
-        image_preview_w = int(image_to_display.width * self.zoom_factor)
-        image_preview_h = int(image_to_display.height * self.zoom_factor)
+        image_preview_w = int((right - left) * self.zoom_factor)
+        image_preview_h = int((bottom - top) * self.zoom_factor)
 
         # Calculate padding to center the image on the canvas
         self.pad_x = max(0, (self.canvas_w - image_preview_w) // 2)
         self.pad_y = max(0, (self.canvas_h - image_preview_h) // 2)
 
-        # Resize to canvas dimensions
-        displayed_image = image_to_display.resize((image_preview_w, image_preview_h), resampling_filter)
-        return displayed_image, image_to_display
+        source = image
+        if mip_slot is not None and self.zoom_factor <= 0.5:
+            for level in self._mip_levels(image, mip_slot)[1:]:
+                if level.width < image.width * self.zoom_factor:
+                    break
+                source = level
+
+        if source is image:
+            # Resize to canvas dimensions. resize(box=...) reads the region in place (no intermediate crop), except
+            # that it rejects boxes past the edge and premultiplies the *whole* RGBA/LA image before filtering
+            box = (left, top, right, bottom)
+            if right <= image.width and bottom <= image.height and (
+                    resampling_filter == Image.NEAREST or image.mode not in ("RGBA", "LA")):
+                return image.resize((image_preview_w, image_preview_h), resampling_filter, box=box)
+            return image.crop(box).resize((image_preview_w, image_preview_h), resampling_filter)
+
+        # The visible region has fractional edges on a level: crop the covering pixels, then let the resize box
+        # pick the exact sub-rectangle (cropping first keeps resize's RGBA premultiply off the rest of the level)
+        sx = source.width / image.width
+        sy = source.height / image.height
+        right = min(right * sx, source.width)
+        bottom = min(bottom * sy, source.height)
+        left, top = left * sx, top * sy
+        x0, y0 = int(left), int(top)
+        region = source.crop((x0, y0, math.ceil(right), math.ceil(bottom)))
+        return region.resize((image_preview_w, image_preview_h), resampling_filter,
+                             box=(left - x0, top - y0, right - x0, bottom - y0))
+
+    def update_input_image_preview(self, resampling_filter=Image.BOX, update_output=True):
+        """Renders the Input Canvas (image + checkerboard + SAM overlay), then the Output Canvas unless
+        update_output is False (fast pan/zoom frames; the settle render catches the output up)."""
+        # Recent view states (e.g. panning back) reuse their PhotoImage instead of re-resizing/re-uploading.
+        # Entries all belong to the current image; drop them on image change so old images can be freed.
+        if self.preview_cache and next(reversed(self.preview_cache.values()))[0] is not self.original_image:
+            self.preview_cache.clear()
+        key = (id(self.original_image), id(self.checkerboard), self.zoom_factor, self.view_x, self.view_y,
+               self.canvas_w, self.canvas_h, resampling_filter)
+        cached = self.preview_cache.get(key)
+        if cached is not None and cached[0] is self.original_image:
+            self.preview_cache.move_to_end(key)
+            _, self.tk_image, self.input_displayed, crop_box, self.pad_x, self.pad_y = cached
+        else:
+            displayed_image = self._calculate_preview_image(self.original_image, resampling_filter, "input")
+            crop_box = self._preview_crop_box(self.original_image)
+
+            if displayed_image.mode == "RGBA":
+                # Composite with checkerboard for transparency preview
+                displayed_image = self._over_checkerboard(displayed_image)
 
-    def update_input_image_preview(self, resampling_filter=Image.BOX):
-        """Renders the Input Canvas (image + checkerboard + SAM overlay)."""
-        displayed_image, self.orig_image_crop = self._calculate_preview_image(self.original_image, resampling_filter)
+            self.input_displayed = displayed_image
+            self.tk_image = ImageTk.PhotoImage(self.input_displayed, master=self.root)
 
-        if displayed_image.mode == "RGBA":
-            # Composite with checkerboard for transparency preview
-            image_preview_w, image_preview_h = displayed_image.size
-            checkerboard = self.checkerboard.crop((0, 0, image_preview_w, image_preview_h))
-            displayed_image = Image.alpha_composite(checkerboard, displayed_image)
+            # Keep the crop box rather than the (potentially full-resolution) crop itself
+            self.preview_cache[key] = (self.original_image, self.tk_image, self.input_displayed,
+                                       crop_box, self.pad_x, self.pad_y)
+            if len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+                self.preview_cache.popitem(last=False)  # Evict least recently used
 
-        self.input_displayed = displayed_image
-        self.tk_image = ImageTk.PhotoImage(self.input_displayed, master=self.root)
+        # The visible source region, as a box: its pixels are only cropped out where needed (overlay, model run)
+        self.orig_image_crop_box = crop_box
+        self.orig_image_crop_size = (crop_box[2] - crop_box[0], crop_box[3] - crop_box[1])
 
-        # Draw on canvas
-        self.canvas.delete("all")
-        self.canvas.create_image(self.pad_x, self.pad_y, anchor=tk.NW, image=self.tk_image)
+        # Draw on canvas: drop everything but the preview item (points, overlay, strokes), then swap its image
+        self.canvas.delete("!preview")
+        self.canvas.itemconfigure(self.canvas_image_item, image=self.tk_image)
+        self.canvas.coords(self.canvas_image_item, self.pad_x, self.pad_y)
 
         # Re-draw SAM/Paint overlays if present
         self.generate_coloured_overlay()
 
         # Update Output canvas as well (they are linked in pan/zoom)
-        self.update_output_image_preview(resampling_filter=resampling_filter)
+        if update_output:
+            self.update_output_image_preview(resampling_filter=resampling_filter)
+
+    def _request_preview(self):
+        """Schedules an output re-render for the next idle tick. Several changes in one event-loop iteration
+        (e.g. a toggle that also re-cuts the shadow) then composite the output once instead of per change."""
+        if self._preview_job is None:
+            self._preview_job = self.root.after_idle(self._flush_preview)
+
+    def _flush_preview(self):
+        self._preview_job = None
+        self.update_output_image_preview()
 
     def update_output_image_preview(self, resampling_filter=Image.BOX, event=None):
         """Renders the Output Canvas (final composite + background + shadow)."""
+        if self._preview_job is not None:  # This render supersedes a pending request
+            self.root.after_cancel(self._preview_job)
+            self._preview_job = None
         show_mask = self.show_mask_var.get() if hasattr(self, 'show_mask_var') else False
 
-        # Determine which image to display
+        # Crop and scale for current view first: the background is then composited at screen size
         if show_mask == False:
-            displayed_image = self.working_image  # Actual cut-out
+            displayed_image = self._calculate_preview_image(self.working_image, resampling_filter, "output")  # Actual cut-out
         else:
-            displayed_image = self.working_mask.convert("RGBA")  # Alpha channel visualization
+            # Alpha channel visualization
+            displayed_image = self._calculate_preview_image(self.working_mask, resampling_filter, "mask").convert("RGBA")
 
         # Apply background (color/blur/none)
-        displayed_image = self.apply_background_color(displayed_image)
-
-        # Crop and scale for current view
-        displayed_image, _ = self._calculate_preview_image(displayed_image, resampling_filter)
+        displayed_image = self._apply_preview_background(displayed_image, resampling_filter)
 
         # Apply checkerboard *if* the mode is transparent (PNG export default)
         if self.bg_mode == "transparent":
-            image_preview_w, image_preview_h = displayed_image.size
-            checkerboard = self.checkerboard.crop((0, 0, image_preview_w, image_preview_h))
-            displayed_image = Image.alpha_composite(checkerboard, displayed_image)
+            displayed_image = self._over_checkerboard(displayed_image)
 
         self.output_displayed = displayed_image
         self.outputpreviewtk = ImageTk.PhotoImage(self.output_displayed, master=self.root)
 
         # Draw on canvas
-        self.canvas2.delete("all")
-        self.canvas2.create_image(self.pad_x, self.pad_y, anchor=tk.NW, image=self.outputpreviewtk)
+        self.canvas2.delete("!preview")
+        self.canvas2.itemconfigure(self.canvas2_image_item, image=self.outputpreviewtk)
+        self.canvas2.coords(self.canvas2_image_item, self.pad_x, self.pad_y)
         self.root.update_idletasks()
 
     # --- Mask Management / History ---
 
     def add_undo_step(self):
         """Saves a copy of the current mask to the undo stack."""
-        self.undo_history_mask.append(self.working_mask.copy())
-        if len(self.undo_history_mask) > UNDO_STEPS:
-            self.undo_history_mask.pop(0)  # Keep history manageable
-        self.redo_history_mask = []
+        self.mask_history.push(self.working_mask)  # Oldest step is dropped past UNDO_STEPS
 
     def clear_working_image(self):
         """Resets the output mask/image to completely transparent (empty)."""
         self.canvas2.delete(self.outputpreviewtk)
-        self.working_image = Image.new(mode="RGBA", size=self.original_image.size)
-        self.working_mask = Image.new(mode="L", size=self.original_image.size, color=0)
+        self.working_image = blank_image("RGBA", self.original_image.size)
+        self.working_mask = blank_image("L", self.original_image.size)
         self.add_undo_step()
 
         # Reset caches for blur/shadow
         if hasattr(self, "cached_blurred_shadow"): delattr(self, "cached_blurred_shadow")
         self.cached_blur_image = None
 
-        self.update_output_image_preview()
+        self._request_preview()
 
     def reset_source_image(self):
         """Resets the input source to the default grey placeholder image."""
         self.original_image = Image.new("RGBA", (800, 600), (200, 200, 200, 255))
+        self.original_image_path = None
         self.image_exif = None
         self.image_paths = []
         self.current_image_index = 0
@@ -2809,11 +3770,10 @@ class BackgroundRemoverGUI:
 
         # Reset images and history
         self.reset_source_image()
-        self.canvas2.delete("all")
-        self.working_image = Image.new(mode="RGBA", size=self.original_image.size)
-        self.working_mask = Image.new(mode="L", size=self.original_image.size, color=0)
-        self.undo_history_mask = [self.working_mask.copy()]
-        self.redo_history_mask = []
+        self.canvas2.delete("!preview")  # Strokes/box; the preview item is re-rendered below
+        self.working_image = blank_image("RGBA", self.original_image.size)
+        self.working_mask = blank_image("L", self.original_image.size)
+        self.mask_history.reset(self.working_mask)
 
         # Reset buttons/models
         if self.load_models_btn['text'] != 'Models Loaded':
@@ -2829,25 +3789,21 @@ class BackgroundRemoverGUI:
 
     def undo(self):
         """Reverts the working mask to the previous state in the history."""
-        if len(self.undo_history_mask) > 1:
-            current_state = self.undo_history_mask.pop()
-            self.redo_history_mask.append(current_state)
-            self.working_mask = self.undo_history_mask[-1].copy()
+        if self.mask_history.can_undo():
+            self.working_mask = self.mask_history.undo()
 
             # Recalculate dependent elements
-            if self.bg_mode == "blur": self.regenerate_smart_blur()
+            if self.bg_mode == "blur": self.request_smart_blur()
             self.add_drop_shadow()  # Triggers preview update
             self.status_label.config(text="Undo performed", fg="white")
 
     def redo(self):
         """Re-applies the next mask state from the redo stack."""
-        if self.redo_history_mask:
-            next_state = self.redo_history_mask.pop()
-            self.undo_history_mask.append(next_state)
-            self.working_mask = next_state.copy()
+        if self.mask_history.can_redo():
+            self.working_mask = self.mask_history.redo()
 
             # Recalculate dependent elements
-            if self.bg_mode == "blur": self.regenerate_smart_blur()
+            if self.bg_mode == "blur": self.request_smart_blur()
             self.add_drop_shadow()
             self.status_label.config(text="Redo performed", fg="white")
         else:
@@ -2861,19 +3817,26 @@ class BackgroundRemoverGUI:
 
     def cutout_working_image(self):
         """Applies the working mask to the original image to create the RGBA cut-out (working_image)."""
-        empty = Image.new("RGBA", self.original_image.size, 0)
         mask_to_use = self.working_mask
 
         # Apply mask softening if enabled
         if hasattr(self, 'soften_mask_var') and self.soften_mask_var.get():
             radius = self.blur_radius_var.get()
             if radius > 0:
-                mask_to_use = self.working_mask.filter(ImageFilter.GaussianBlur(radius=radius))
-
-        self.working_image = Image.composite(self.original_image, empty, mask_to_use)
+                mask_to_use = gaussian_blur(self.working_mask, radius)
+
+        # Same as Image.composite over an empty image (which pastes onto a copy of it), but pasted in place onto
+        # a writable blank and only inside the mask's bounding box. An empty mask needs no writes at all.
+        bbox = mask_to_use.getbbox()
+        if bbox:
+            cutout = Image.new("RGBA", self.original_image.size)
+            cutout.paste(self.original_image.crop(bbox), bbox, mask_to_use.crop(bbox))
+        else:
+            cutout = blank_image("RGBA", self.original_image.size)
+        self.working_image = cutout
 
     def _apply_mask_modification(self, operation):
-        """Generic method to Add (ImageChops.add) or Subtract (ImageChops.subtract) a preview mask."""
+        """Generic method to Add (cv2.add) or Subtract (cv2.subtract) a preview mask."""
         if self.paint_mode.get():
             mask = self.generate_paint_mode_mask()
         else:
@@ -2883,22 +3846,25 @@ class BackgroundRemoverGUI:
             self.status_label.config(text="Warning: No mask generated to add/subtract. Run a model first.", fg="white")
             return
 
-        # Calculate the paste box (the cropped area currently visible in the canvas)
-        paste_box = (int(self.view_x), int(self.view_y),
-                     int(self.view_x + self.orig_image_crop.width),
-                     int(self.view_y + self.orig_image_crop.height))
-
-        # Create a full-size mask to contain the cropped mask operation
-        temp_fullsize_mask = Image.new("L", self.working_mask.size, 0)
+        # The visible (cropped) area of the canvas, clipped to the image
+        working = np.array(self.working_mask)
+        mask_arr = np.asarray(mask if mask.mode == "L" else mask.convert("L"))
+        x0, y0 = int(self.view_x), int(self.view_y)
+        left, top = max(0, -x0), max(0, -y0)
+        right = min(mask_arr.shape[1], working.shape[1] - x0)
+        bottom = min(mask_arr.shape[0], working.shape[0] - y0)
 
         try:
-            temp_fullsize_mask.paste(mask, paste_box)
-            self.working_mask = operation(self.working_mask, temp_fullsize_mask)  # Apply operation
+            if right > left and bottom > top:
+                # Saturating add/subtract in place on the visible region only (no full-size temp mask)
+                roi = working[y0 + top:y0 + bottom, x0 + left:x0 + right]
+                operation(roi, mask_arr[top:bottom, left:right], dst=roi)
+            self.working_mask = Image.fromarray(working)  # Apply operation
             self.add_undo_step()
 
             # Reset caches
             if hasattr(self, "cached_blurred_shadow"): delattr(self, "cached_blurred_shadow")
-            if self.bg_mode == "blur": self.regenerate_smart_blur()
+            if self.bg_mode == "blur": self.request_smart_blur()
 
             self.add_drop_shadow()
             self.status_label.config(text="Mask applied.", fg="white")
@@ -2906,16 +3872,16 @@ class BackgroundRemoverGUI:
             self.status_label.config(text=f"Error applying mask: {e}", fg="white")
 
     def add_to_working_image(self):
-        self._apply_mask_modification(ImageChops.add)
+        self._apply_mask_modification(cv2.add)
 
     def subtract_from_working_image(self):
-        self._apply_mask_modification(ImageChops.subtract)
+        self._apply_mask_modification(cv2.subtract)
 
     def clear_visible_area(self):
         """Subtracts a mask of the entire currently visible area. Useful for bulk cleaning."""
         # Temporarily create a mask of the visible area
         mask_old = self.model_output_mask.copy() if self.model_output_mask else None
-        self.model_output_mask = Image.new("L", self.orig_image_crop.size, 255)  # White rectangle
+        self.model_output_mask = Image.new("L", self.orig_image_crop_size, 255)  # White rectangle
         self.subtract_from_working_image()
         self.model_output_mask = mask_old  # Restore preview mask
 
@@ -2936,7 +3902,7 @@ class BackgroundRemoverGUI:
         for i in self.lines_id2: self.canvas2.delete(i)
         self.lines = []
         if hasattr(self, 'overlay_item'): self.canvas.delete(self.overlay_item)
-        self.model_output_mask = Image.new("L", self.orig_image_crop.size, 0)  # Clear preview mask
+        self.model_output_mask = Image.new("L", self.orig_image_crop_size, 0)  # Clear preview mask
 
     def trigger_inactive_feedback(self, event=None, x=None, y=None, size=8, target_canvas=None):
         """Shows visual feedback (Red X) and flashes the SAM button when an interactive action is invalid."""
@@ -3043,7 +4009,6 @@ class BackgroundRemoverGUI:
 
     def box_event(self, scaled_coords):
         """Handles running SAM with the bounding box input."""
-        self._initialise_sam_model()
         self.clear_coord_overlay()
 
         # Convert scaled coordinates (relative to view) to global image coordinates
@@ -3052,13 +4017,8 @@ class BackgroundRemoverGUI:
         global_x2 = self.view_x + scaled_coords[2]
         global_y2 = self.view_y + scaled_coords[3]
 
-        # SAM box input is [x1, y1, x2, y2]
-        self.coordinates = [[global_x1, global_y1], [global_x2, global_y2]]
-        self.labels = [2, 3]  # SAM label for a bounding box
-
-        self.raw_sam_logits = self.sam_calculate_mask(self.original_image, self.sam_encoder, self.sam_decoder, self.coordinates, self.labels)
-        self.raw_model_mask = None
-        self.on_unified_slider_change(self.unified_var.get())  # Update preview mask
+        # SAM box input is [x1, y1, x2, y2], labels 2/3 mark a bounding box
+        self.submit_sam_decode([[global_x1, global_y1], [global_x2, global_y2]], [2, 3])
 
         self.coordinates = []
         self.labels = []
@@ -3078,13 +4038,20 @@ class BackgroundRemoverGUI:
 
         self.show_loading("Running SAM")  # Show overlay
 
-        def heavy_task():
-            self._initialise_sam_model_headless()
-            if not hasattr(self, "encoder_output"):
-                self.calculate_sam_embedding_headless()  # Calculate heavy embedding once
-            return "Ready"
+        model_name = self.sam_combo.get()
+        image, image_path, model_key = self.original_image, self.original_image_path, self._sam_model_key(model_name)
+        embedding = self._sam_embedding_for(image, model_key)
+        epoch = self._models_epoch
 
-        def on_done(res):
+        def heavy_task():
+            encoder, _ = self._initialise_sam_model_headless(model_name)
+            if embedding is not None:
+                return embedding
+            return self.calculate_sam_embedding_headless(image, image_path, model_key, encoder)  # Heavy, once
+
+        def on_done(result):
+            if image is self.original_image and epoch == self._models_epoch:
+                self.encoder_output = (image, model_key, result)  # Clicks on this image reuse it
             self.status_label.config(text="SAM Ready. Click on the image to add points.", fg="white")
 
         def on_err(e):
@@ -3121,9 +4088,11 @@ class BackgroundRemoverGUI:
         self.show_loading(f"Running {model_name}")
         self.whole_image_button.configure(state="disabled")
 
+        image, crop_box = self.original_image, self.orig_image_crop_box  # The view at click time
+
         def heavy_lifting():
             session = self.thread_safe_load_model(model_name)
-            mask = self.generate_whole_image_model_mask(self.orig_image_crop, session, target_size)
+            mask = self.generate_whole_image_model_mask(image.crop(crop_box), session, target_size)
             return mask
 
         def on_complete(result_mask):
@@ -3162,32 +4131,35 @@ class BackgroundRemoverGUI:
     def update_mask_threshold(self, threshold):
         """Applies binary thresholding to a whole-image model's raw mask."""
         if self.raw_model_mask is None: return
-        # Create a new binary mask from the raw grayscale output
-        self.model_output_mask = self.raw_model_mask.point(lambda p: 255 if p > threshold else 0)
+        # The mask's pixels are copied out once per model run, not per slider tick
+        if self._raw_model_np is None or self._raw_model_np[0] is not self.raw_model_mask:
+            self._raw_model_np = (self.raw_model_mask, np.asarray(self.raw_model_mask))
+        raw = self._raw_model_np[1]
+
+        # Create a new binary mask from the raw grayscale output. A fresh buffer per tick: fromarray shares
+        # its memory, and the previous preview mask may still be referenced
+        binary = np.empty_like(raw)
+        np.greater(raw, threshold, out=binary.view(bool))
+        binary *= 255
+        self.model_output_mask = Image.fromarray(binary)
         self.generate_coloured_overlay()
 
     def update_sam_threshold(self, threshold):
         """Applies thresholding to SAM's raw logits output."""
         if self.raw_sam_logits is None: return
 
-        masks = self.raw_sam_logits
-        mask_binary = np.zeros((masks.shape[2], masks.shape[3], 3), dtype=np.uint8)
-        current_mask = masks[0, 0, :, :]
-
-        # Apply threshold to logits
-        mask_binary[current_mask > threshold] = [255, 255, 255]
-        full_mask = Image.fromarray(mask_binary).convert("L")
+        # Crop the full-image logits to the current visible viewport first, so each slider tick only
+        # thresholds the visible pixels. Straight into a grayscale buffer (no RGB array + convert)
+        x0, y0 = int(self.view_x), int(self.view_y)
+        w, h = self.orig_image_crop_size
+        visible = self.raw_sam_logits[0, 0, y0:y0 + h, x0:x0 + w]
 
-        # Crop the full mask to the current visible viewport size
-        crop_box = (int(self.view_x), int(self.view_y),
-                    int(self.view_x + self.orig_image_crop.width),
-                    int(self.view_y + self.orig_image_crop.height))
-
-        try:
-            self.model_output_mask = full_mask.crop(crop_box)
-        except Exception:
-            # Fallback resize if the crop fails due to dimension mismatch
-            self.model_output_mask = full_mask.resize(self.orig_image_crop.size)
+        # Apply threshold to logits; anything past the image edge stays 0, as with an oversized crop
+        mask_binary = np.zeros((h, w), dtype=np.uint8)
+        region = mask_binary[:visible.shape[0], :visible.shape[1]]
+        np.greater(visible, threshold, out=region.view(bool))
+        region *= 255
+        self.model_output_mask = Image.fromarray(mask_binary)
 
         self.generate_coloured_overlay()
 
@@ -3196,7 +4168,7 @@ class BackgroundRemoverGUI:
         input_image = image.convert("RGB").resize((target_size, target_size), Image.BICUBIC)
 
         # Determine normalization based on model type
-        model_path = os.path.basename(session._model_path)
+        model_path = os.path.basename(session.model_path)
         if "isnet" in model_path or "rmbg1_4" in model_path:
             std = (1.0, 1.0, 1.0)
             mean = (0.5, 0.5, 0.5)
@@ -3216,12 +4188,8 @@ class BackgroundRemoverGUI:
         tmpImg = tmpImg.transpose((2, 0, 1))  # HWC to CHW
         input_image = np.expand_dims(tmpImg, 0).astype(np.float32)  # Add batch dimension
 
-        input_name = session.get_inputs()[0].name
-        output_name = session.get_outputs()[0].name
-
-        # ONNX Inference
-        result = session.run([output_name], {input_name: input_image})
-        mask = result[0]
+        # ONNX Inference (through the session's persistent IO binding)
+        mask = session.run(input_image)
 
         # Post-processing: sigmoid/scaling and resizing
         if "BiRefNet" in model_path:
@@ -3229,7 +4197,7 @@ class BackgroundRemoverGUI:
             def sigmoid(mat):
                 return 1 / (1 + np.exp(-mat))
 
-            pred = sigmoid(result[0][:, 0, :, :])
+            pred = sigmoid(mask[:, 0, :, :])
             ma, mi = np.max(pred), np.min(pred)
             pred = (pred - mi) / (ma - mi)  # Normalize to 0-1
             mask = Image.fromarray((np.squeeze(pred) * 255).astype("uint8")).resize(image.size, Image.Resampling.LANCZOS)
@@ -3245,19 +4213,27 @@ class BackgroundRemoverGUI:
         if hasattr(self, 'overlay_item') and self.overlay_item:
             self.canvas.delete(self.overlay_item)
 
-        if self.model_output_mask is None or not hasattr(self, 'orig_image_crop'): return
+        if self.model_output_mask is None or not hasattr(self, 'orig_image_crop_box'): return
 
         try:
-            # Create a blue image from the original's shape
-            self.overlay = ImageOps.colorize(self.orig_image_crop.convert("L"), black=COLORS["accent"], white="white")
-            # Apply the current mask as the alpha channel
-            self.overlay.putalpha(self.model_output_mask)
+            # Canvas size of the overlay. Colorize and putalpha are per pixel, so scaling (NEAREST) the source and
+            # the mask first gives the same overlay as scaling the full-resolution result
+            image_preview_w = int(self.orig_image_crop_size[0] * self.zoom_factor)
+            image_preview_h = int(self.orig_image_crop_size[1] * self.zoom_factor)
+            size = (image_preview_w, image_preview_h)
+
+            # Create a blue image from the original's shape. Depends only on the view, so threshold slider ticks
+            # (which only change the mask) reuse it
+            base = self._overlay_base
+            if base is None or base[0] is not self.original_image or base[1] != self.orig_image_crop_box or base[2] != size:
+                visible = self.original_image.crop(self.orig_image_crop_box).resize(size, Image.NEAREST)
+                colored = ImageOps.colorize(visible.convert("L"), black=COLORS["accent"], white="white").convert("RGBA")
+                base = self._overlay_base = (self.original_image, self.orig_image_crop_box, size, colored)
 
-            # Scale the overlay to the canvas size
-            image_preview_w = int(self.orig_image_crop.width * self.zoom_factor)
-            image_preview_h = int(self.orig_image_crop.height * self.zoom_factor)
-            self.scaled_overlay = self.overlay.resize((image_preview_w, image_preview_h), Image.NEAREST)
-            self.tk_overlay = ImageTk.PhotoImage(self.scaled_overlay, master=self.root)
+            # Apply the current mask as the alpha channel
+            scaled_overlay = base[3].copy()
+            scaled_overlay.putalpha(self.model_output_mask.resize(size, Image.NEAREST))
+            self.tk_overlay = ImageTk.PhotoImage(scaled_overlay, master=self.root)
 
             # Draw on canvas
             self.overlay_item = self.canvas.create_image(self.pad_x, self.pad_y, anchor=tk.NW, image=self.tk_overlay)
@@ -3271,7 +4247,7 @@ class BackgroundRemoverGUI:
 
     def generate_paint_mode_mask(self):
         """Converts user drawn line coordinates into a binary mask image for the current viewport."""
-        img = Image.new('L', (self.orig_image_crop.width, self.orig_image_crop.height), color='black')  # Start with black (transparent)
+        img = Image.new('L', self.orig_image_crop_size, color='black')  # Start with black (transparent)
         draw = ImageDraw.Draw(img)
 
         # Iterate over all stored line segments
@@ -3301,6 +4277,7 @@ class BackgroundRemoverGUI:
             self.update_button_visual(self.btn_paint, self.paint_mode)
 
         if self.paint_mode.get():
+            self._build_brush_options()
             self.brush_options_frame.pack(fill="x", after=self.btn_paint)
             self.clear_coord_overlay()
 
@@ -3362,16 +4339,10 @@ class BackgroundRemoverGUI:
         """Resets the last position after mouse button release."""
         self.last_x, self.last_y = 0, 0
 
-    def _initialise_sam_model(self):
-        # Wrapper for thread-safe model init
-        self._initialise_sam_model_headless()
-
     def generate_sam_mask(self, event):
         """Handles a single point click in SAM mode (left=positive, right=negative)."""
         if not self.sam_active: return
 
-        self._initialise_sam_model_headless()
-
         # Calculate unscaled coordinates in the original image space
         x = self.view_x + (event.x - self.pad_x) / self.zoom_factor
         y = self.view_y + (event.y - self.pad_y) / self.zoom_factor
@@ -3381,31 +4352,56 @@ class BackgroundRemoverGUI:
         self.labels.append(label)
 
         self.draw_dot(event.x, event.y, event.num)
-        self.root.update()
 
-        # Run SAM inference
-        self.raw_sam_logits = self.sam_calculate_mask(self.original_image, self.sam_encoder, self.sam_decoder, self.coordinates, self.labels)
-        self.raw_model_mask = None
-        self.on_unified_slider_change(self.unified_var.get())  # Update preview mask
+        # Run SAM inference (off the UI thread)
+        self.submit_sam_decode(list(self.coordinates), list(self.labels))
 
-    def sam_calculate_mask(self, img, sam_encoder, sam_decoder, coordinates, labels, ):
-        """Performs SAM decoder inference using the cached image embedding."""
+    def submit_sam_decode(self, coordinates, labels):
+        """Queues a SAM decoder run on the inference worker. Only the newest submission's result is applied."""
+        self._sam_job_id += 1
+        job_id = self._sam_job_id
+        image, image_path, model_name = self.original_image, self.original_image_path, self.sam_combo.get()
+        model_key = self._sam_model_key(model_name)
+        embedding = self._sam_embedding_for(image, model_key)
+        epoch = self._models_epoch
+
+        def task():
+            # A model switch (session load + new embedding) happens here too, never on the Tk thread.
+            # Everything shared is captured above; the embedding travels back with the result.
+            encoder, decoder = self._initialise_sam_model_headless(model_name)
+            image_embedding = embedding
+            if image_embedding is None:
+                image_embedding = self.calculate_sam_embedding_headless(image, image_path, model_key, encoder)
+            return image_embedding, self.sam_calculate_mask(image, image_embedding, decoder, coordinates, labels)
+
+        def on_done(result):
+            image_embedding, logits = result
+            if image is self.original_image and epoch == self._models_epoch:
+                self.encoder_output = (image, model_key, image_embedding)
+            if job_id != self._sam_job_id or not self.sam_active: return  # Superseded by a newer click
+            self.raw_sam_logits = logits
+            self.raw_model_mask = None
+            self.on_unified_slider_change(self.unified_var.get())  # Update preview mask
+
+        def on_err(e):
+            self.status_label.config(text=f"SAM Error: {e}", fg="white")
+            print(f"SAM Error: {e}")
+
+        self.inference_worker.submit(task, on_done, on_err)
+
+    def sam_calculate_mask(self, img, encoder_output, sam_decoder, coordinates, labels):
+        """Performs SAM decoder inference using img's precomputed encoder output."""
         target_size = 1024
         input_size = (684, 1024)
-        img = img.convert("RGB")
-        cv_image = np.array(img)
-        original_size = cv_image.shape[:2]
+        original_size = (img.height, img.width)  # Only the size is needed; no pixel conversion per click
 
         # SAM's fixed scale transformation parameters
-        scale_x = input_size[1] / cv_image.shape[1]
-        scale_y = input_size[0] / cv_image.shape[0]
+        scale_x = input_size[1] / img.width
+        scale_y = input_size[0] / img.height
         scale = min(scale_x, scale_y)
         transform_matrix = np.array([[scale, 0, 0], [0, scale, 0], [0, 0, 1]])
 
-        # Force embedding calculation if missing
-        if not hasattr(self, "encoder_output"): self.calculate_sam_embedding_headless()
-
-        image_embedding = self.encoder_output[0]
+        image_embedding = encoder_output[0]
 
         # Prepare point inputs for ONNX
         input_points = np.array(coordinates)
@@ -3480,7 +4476,7 @@ class BackgroundRemoverGUI:
         if folder:
             self.config["output_folder"] = folder
             self.status_label.config(text=f"Output folder set to: {folder}")
-            self.save_config()
+            self.schedule_config_save()
             self.update_folder_marquee()  # Refresh marquee text
 
     def quick_save_automatic(self):
@@ -3594,10 +4590,35 @@ class BackgroundRemoverGUI:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _apply_preview_background(self, preview, resampling_filter):
+        """apply_background_color for a preview that is already cropped and scaled. Resampling is linear
+        (premultiplied), so scaling the cut-out and the blur separately and compositing at screen size matches
+        compositing at full resolution first, without the full-size RGBA composite on every render."""
+        if self.bg_mode == "blur":
+            if self.cached_blur_image is None:
+                self.request_smart_blur()
+                return preview  # No background until the worker delivers the first blur
+            blur = self.cached_blur_image
+            if blur.size != self.working_image.size:
+                blur = blur.resize(self.working_image.size)
+            bg = self._calculate_preview_image(blur, resampling_filter, "blur").convert("RGBA")
+            bg.alpha_composite(preview)
+            return bg
+
+        elif self.bg_mode == "color":
+            colored_image = Image.new("RGBA", preview.size, self.bg_custom_color)
+            colored_image.alpha_composite(preview)
+            return colored_image
+
+        return preview  # Transparent background (default)
+
     def apply_background_color(self, img):
-        """Composites the cut-out image onto the selected background (blur, color, or none)."""
+        """Composites the full-resolution cut-out onto the selected background (blur, color, or none) for export.
+        Computes the blur here if it doesn't match the current image, mask and radius yet."""
         if self.bg_mode == "blur":
-            if self.cached_blur_image is None: self.regenerate_smart_blur()  # Re-generate if cache missed
+            current = (self.original_image, self.working_mask, self.current_blur_radius)
+            if not self._blur_is_for(self._blur_inputs, current):
+                self.regenerate_smart_blur()
 
             bg = self.cached_blur_image.convert("RGBA")
             try:
@@ -3626,14 +4647,30 @@ class BackgroundRemoverGUI:
         if hasattr(self, 'marquee_after_id') and self.marquee_after_id:
             self.root.after_cancel(self.marquee_after_id)
 
+        # Drop slider work still waiting on its debounce, and any pending output render
+        for job in self._debounce_jobs.values():
+            self.root.after_cancel(job)
+        self._debounce_jobs.clear()
+        if self._preview_job is not None:
+            self.root.after_cancel(self._preview_job)
+            self._preview_job = None
+        if self._view_frame_job is not None:
+            self.root.after_cancel(self._view_frame_job)
+            self._view_frame_job = None
+
+        # Pending debounced write is superseded by the final save
+        if self._config_save_job is not None:
+            self.root.after_cancel(self._config_save_job)
+            self._config_save_job = None
         self.save_config()
+        self.thumb_pool.shutdown(wait=False, cancel_futures=True)  # Don't finish a pending import on exit
         self.root.destroy()
 
     def add_drop_shadow(self):
         """Applies a blurred, offset drop shadow behind the subject."""
         if not self.enable_shadow_var.get():
             self.cutout_working_image()  # Re-cutout without shadow
-            self.update_output_image_preview()
+            self._request_preview()
             return False
 
         self.cutout_working_image()  # Ensure working_image is up to date
@@ -3661,7 +4698,7 @@ class BackgroundRemoverGUI:
             alpha_resized = alpha.resize(new_size, Image.NEAREST)
 
             # Perform Gaussian Blur on the downsampled mask
-            blurred_alpha_resized = alpha_resized.filter(ImageFilter.GaussianBlur(radius=shadow_radius * downsample_factor))
+            blurred_alpha_resized = gaussian_blur(alpha_resized, shadow_radius * downsample_factor)
 
             # Upsample the blurred mask back to original size
             cached = blurred_alpha_resized.resize(original_size, Image.NEAREST)
@@ -3681,12 +4718,12 @@ class BackgroundRemoverGUI:
 
         # Composite shadow under the main cut-out
         self.working_image = Image.alpha_composite(shadow_with_offset, self.working_image)
-        self.update_output_image_preview()
+        self._request_preview()
         return True
 
     def on_alpha_channel_toggle(self):
         """Called when Alpha Channel button is clicked. Disables conflicting effects."""
-        self.update_output_image_preview()  # Update to show/hide mask
+        self._request_preview()  # Update to show/hide mask
 
         if self.show_mask_var.get():
             # If Alpha is ON, disable Shadow and Soften Edges
@@ -3705,6 +4742,68 @@ class BackgroundRemoverGUI:
 
             self.refresh_sidebar_scroll()
 
+    # Option panels are built the first time they are shown: most sessions never open some of them,
+    # and each SleekSlider is a canvas with its own items and bindings.
+
+    def _build_shadow_options(self):
+        if self.shadow_opacity_slider is not None: return
+
+        def make_shadow_slider(txt, vmin, vmax, init_val):
+            f = tk.Frame(self.shadow_options_frame, bg=COLORS["panel_bg"])
+            tk.Label(f, text=txt, width=6, bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Arial", 8)).pack(side="left")
+
+            def cb(val): self._debounce("shadow", SHADOW_DEBOUNCE_MS, self.add_drop_shadow)
+
+            s = SleekSlider(f, width=150, height=20, min_val=vmin, max_val=vmax, init_val=init_val, command=cb, bg_color=COLORS["panel_bg"], accent_color=COLORS["accent"])
+            s.pack(side="left", fill="x", expand=True, padx=5)
+            f.pack(fill="x", pady=2)
+            return s
+
+        self.shadow_opacity_slider = make_shadow_slider("Opac:", 0, 1, self.config.get("shadow_opacity", 0.5))
+        self.shadow_radius_slider = make_shadow_slider("Blur:", 1, 50, self.config.get("shadow_radius", 10))
+        self.shadow_x_slider = make_shadow_slider("X:", -100, 100, self.config.get("shadow_x", 50))
+        self.shadow_y_slider = make_shadow_slider("Y:", -100, 100, self.config.get("shadow_y", 50))
+
+    def _build_soften_options(self):
+        if self.soften_slider is not None: return
+        f_soften_inner = tk.Frame(self.soften_options_frame, bg=COLORS["panel_bg"])
+        f_soften_inner.pack(fill="x", padx=10, pady=5)
+        radius = self.blur_radius_var.get()
+        tk.Label(f_soften_inner, text="Blur:", bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Segoe UI", 8)).pack(side="left")
+        lbl_soften_val = tk.Label(f_soften_inner, text=str(radius), width=4, bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Segoe UI", 8, "bold"))
+        lbl_soften_val.pack(side="right")
+
+        def update_soften_label(val):
+            int_val = int(float(val))
+            self.blur_radius_var.set(int_val)
+            lbl_soften_val.config(text=str(int_val))
+            if hasattr(self, 'working_mask'):
+                self._debounce("soften", SOFTEN_DEBOUNCE_MS, self.add_drop_shadow)
+
+        self.soften_slider = SleekSlider(f_soften_inner, width=150, height=20, min_val=0, max_val=100, init_val=radius, command=update_soften_label, bg_color=COLORS["panel_bg"],
+                                         accent_color=COLORS["accent"])
+        self.soften_slider.pack(side="left", fill="x", expand=True, padx=5)
+
+    def _build_bg_blur_options(self):
+        if self.bg_blur_slider is not None: return
+        tk.Label(self.blur_slider_frame, text="Intensity:", bg=COLORS["panel_bg"], fg=COLORS["fg"], font=("Arial", 8)).pack(side="left")
+        self.bg_blur_slider = SleekSlider(self.blur_slider_frame, width=150, height=20, min_val=5, max_val=100, init_val=self.current_blur_radius, command=self.on_blur_slider_change, bg_color=COLORS["panel_bg"],
+                                          accent_color=COLORS["accent"])
+        self.bg_blur_slider.pack(side="left", fill="x", expand=True, padx=5)
+
+    def _build_brush_options(self):
+        if self.brush_slider is not None: return
+        f_brush = tk.Frame(self.brush_options_frame, bg=COLORS["panel_bg"])
+        tk.Label(f_brush, text="Size:", width=6, bg=COLORS["panel_bg"], fg=COLORS["fg"]).pack(side="left")
+
+        def update_brush_var(v):
+            self.brush_size_var.set(int(v))
+
+        self.brush_slider = SleekSlider(f_brush, width=150, height=20, min_val=1, max_val=100, init_val=self.brush_size_var.get(), command=update_brush_var, bg_color=COLORS["panel_bg"],
+                                        accent_color=COLORS["accent"])
+        self.brush_slider.pack(side="left", fill="x", expand=True, padx=5)
+        f_brush.pack(fill="x", padx=10, pady=5)
+
     def toggle_shadow_options(self):
         """Toggles the drop shadow feature and options display."""
 
@@ -3718,6 +4817,7 @@ class BackgroundRemoverGUI:
 
         # 2. Standard Logic
         if self.enable_shadow_var.get():
+            self._build_shadow_options()
             self.shadow_options_frame.pack(fill="x", padx=5, pady=5)
         else:
             self.shadow_options_frame.pack_forget()
@@ -3738,6 +4838,7 @@ class BackgroundRemoverGUI:
 
         # 2. Standard Logic
         if self.soften_mask_var.get():
+            self._build_soften_options()
             self.soften_options_frame.pack(fill="x", before=self.btn_shadow)
         else:
             self.soften_options_frame.pack_forget()
@@ -3748,21 +4849,22 @@ class BackgroundRemoverGUI:
     def initialise_new_image(self):
         """Resets all working state variables for a newly loaded image."""
         self.cached_blur_image = None
-        self.canvas2.delete("all")
+        self._inpaint_cache = None  # Don't keep the previous image alive
+        self._overlay_base = None
+        self.canvas2.delete("!preview")  # Strokes/box; the preview item is re-rendered below
         self.setup_image_display()
         self.update_input_image_preview()
         self.clear_coord_overlay()
 
-        self.working_image = Image.new(mode="RGBA", size=self.original_image.size)
-        self.working_mask = Image.new(mode="L", size=self.original_image.size, color=0)
+        self.working_image = blank_image("RGBA", self.original_image.size)
+        self.working_mask = blank_image("L", self.original_image.size)
 
-        self.undo_history_mask = [self.working_mask.copy()]
-        self.redo_history_mask = []
+        self.mask_history.reset(self.working_mask)
 
         self.sam_active = False
         self.raw_model_mask = None
         self.raw_sam_logits = None
-        if hasattr(self, "encoder_output"): delattr(self, "encoder_output")  # Reset SAM embedding cache
+        self.encoder_output = None  # Reset SAM embedding cache
 
     def show_help(self):
         """Opens the custom documentation window."""
@@ -3789,18 +4891,9 @@ class BackgroundRemoverGUI:
     def animate_magic_button(self):
         """Cycles through colors to create a rainbow gradient effect."""
         if self._magic_hovering:
-            # Interpolate between current and next color
-            color_start = self._magic_colors[self._magic_idx]
-            color_end = self._magic_colors[(self._magic_idx + 1) % len(self._magic_colors)]
-            t = self._magic_step / self._magic_steps_total
-            current_color = self._interpolate_color(color_start, color_end, t)
-
+            current_color = self._magic_lut[self._magic_frame]
             self.style.configure("Magic.TButton", background=current_color, foreground="#101010")
-
-            self._magic_step += 1
-            if self._magic_step > self._magic_steps_total:
-                self._magic_step = 0
-                self._magic_idx = (self._magic_idx + 1) % len(self._magic_colors)
+            self._magic_frame = (self._magic_frame + 1) % len(self._magic_lut)
 
             self._magic_cycle_id = self.root.after(20, self.animate_magic_button)
 
@@ -3817,74 +4910,129 @@ class BackgroundRemoverGUI:
         """Opens directory dialog and imports all valid images."""
         folder = filedialog.askdirectory(title="Import Folder")
         if folder:
-            valid_exts = {'.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tiff'}
-            # Filter for valid image files inside the folder
-            files = [
-                os.path.join(folder, f) for f in os.listdir(folder)
-                if os.path.splitext(f)[1].lower() in valid_exts
-            ]
-            self.process_import_paths(files)
+            self.process_import_paths(list_image_files(folder))
 
     def process_import_paths(self, path_list):
-        """Orchestrates image import, running thumbnail creation in a background thread."""
+        """Orchestrates image import. Thumbnails are built on the thumbnail pool as soon as the paths are known,
+        and the gallery fills in progressively while they finish."""
         if not path_list: return
 
-        # Show loading bar only for bulk import (4+ files)
-        if len(path_list) >= 4:
-            self.show_loading(f"Importing {len(path_list)} images...")
-
         existing_paths = set(f['path'] for f in self.gallery_files)
+        paths = [path for path in dict.fromkeys(path_list) if path not in existing_paths]
+        if not paths: return
 
-        # Define the heavy lifting task
-        def task():
-            return self._worker_import_thumbnails(path_list, existing_paths)
+        # Show loading bar only for bulk import (4+ files), and only until the first thumbnails arrive
+        if len(paths) >= 4:
+            self.show_loading(f"Importing {len(paths)} images...")
 
-        self.start_threaded_task(task, self._finalize_import, error_callback=self._on_import_error)
+        futures = [self.thumb_pool.submit(self._build_gallery_item, path) for path in paths]
+        self.root.after(THUMB_POLL_MS, self._poll_import, futures, 0)
 
-    def _worker_import_thumbnails(self, path_list, existing_paths):
-        """THREADED: Creates PIL thumbnails. Must AVOID all Tkinter/ImageTk calls."""
+    def _build_gallery_item(self, path):
+        """THREADED: Gallery entry with a PIL thumbnail, or None if the file can't be read. No Tkinter here."""
         THUMB_SIZE = (70, 70)
         BG_COLOR = (30, 30, 30, 255)
+        try:
+            if not os.path.exists(path):
+                return None
+            return {
+                'path': path,
+                'name': os.path.basename(path),
+                'pil_thumb': self._create_thumbnail(path, THUMB_SIZE, BG_COLOR)
+            }
+        except Exception as e:
+            print(f"[ERROR] Import failed for {path}: {e}")
+            return None
+
+    def _poll_import(self, futures, added):
+        """MAIN THREAD: Moves finished thumbnails into the gallery (in drop order) until the import is done.
+        The loading overlay is dropped with the first batch so the gallery can be seen filling in; the status
+        bar shows the progress from then on."""
+        batch = []
+        while futures and futures[0].done():
+            item = futures.pop(0).result()
+            if item is not None:
+                batch.append(item)
+        if batch:
+            if not added:
+                self.hide_loading()
+            self._add_gallery_items(batch)
+            added += len(batch)
+
+        if futures:
+            if added:
+                self.status_label.config(text=f"Importing... {added} images added, {len(futures)} to go.")
+            self.root.after(THUMB_POLL_MS, self._poll_import, futures, added)
+        elif added:
+            self.status_label.config(text=f"Added {added} images to gallery.")
+        else:
+            self.hide_loading()  # Nothing could be imported: no batch ever hid it
 
-        processed_items = []
-
-        for path in path_list:
-            if not os.path.exists(path) or path in existing_paths: continue
-
-            try:
-                img = Image.open(path)
-                img = ImageOps.exif_transpose(img)
-
-                # Create letterbox/padding canvas
-                thumb_base = Image.new('RGBA', THUMB_SIZE, BG_COLOR)
-
-                # Resize image for thumbnail (Lanczos for quality)
-                target_size = (THUMB_SIZE[0] - 2, THUMB_SIZE[1] - 2)
-                img.thumbnail(target_size, Image.Resampling.LANCZOS)
-
-                # Center on the thumbnail canvas
-                offset_x = (THUMB_SIZE[0] - img.width) // 2
-                offset_y = (THUMB_SIZE[1] - img.height) // 2
-                thumb_base.paste(img, (offset_x, offset_y))
-
-                # Store PIL object
-                processed_items.append({
-                    'path': path,
-                    'name': os.path.basename(path),
-                    'pil_thumb': thumb_base
-                })
-            except Exception as e:
-                print(f"[ERROR] Import failed for {path}: {e}")
-
-        return processed_items
-
-    def _finalize_import(self, results):
-        """MAIN THREAD: Converts PIL images to ImageTk and updates the gallery UI."""
-        if not results:
-            self.hide_loading()
-            return
-
-        for item in results:
+    @staticmethod
+    def _decode_thumbnail(path, target_size):
+        """THREADED: Decodes an RGBA array no larger than target_size with OpenCV, or None if unsupported.
+        Opaque images use libjpeg/libpng reduced decoding (1/2, 1/4, 1/8) before the INTER_AREA resize."""
+        with Image.open(path) as probe:  # Header only
+            width, height = probe.size
+            keep_alpha = probe.mode in ('RGBA', 'LA', 'PA') or 'transparency' in probe.info
+
+        data = np.fromfile(path, dtype=np.uint8)  # np.fromfile + imdecode handles non-ASCII paths on Windows
+        if keep_alpha:
+            arr = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+        else:
+            reduction = max(width, height) // max(target_size)
+            if reduction >= 8: flag = cv2.IMREAD_REDUCED_COLOR_8
+            elif reduction >= 4: flag = cv2.IMREAD_REDUCED_COLOR_4
+            elif reduction >= 2: flag = cv2.IMREAD_REDUCED_COLOR_2
+            else: flag = cv2.IMREAD_COLOR  # Reduced and full colour decodes both apply EXIF orientation
+            arr = cv2.imdecode(data, flag)
+        if arr is None:
+            return None
+
+        if arr.dtype == np.uint16:
+            arr = (arr >> 8).astype(np.uint8)
+        elif arr.dtype != np.uint8:
+            return None
+        if arr.ndim == 2:
+            arr = cv2.cvtColor(arr, cv2.COLOR_GRAY2RGBA)
+        elif arr.shape[2] == 4:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGRA2RGBA)
+        else:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGR2RGBA)
+
+        h, w = arr.shape[:2]
+        scale = min(target_size[0] / w, target_size[1] / h)
+        if scale < 1:
+            new_size = (max(1, round(w * scale)), max(1, round(h * scale)))
+            arr = cv2.resize(arr, new_size, interpolation=cv2.INTER_AREA)
+        return arr
+
+    def _create_thumbnail(self, path, thumb_size, bg_color):
+        """THREADED: Letterboxed RGBA gallery thumbnail for an image file."""
+        # Create letterbox/padding canvas
+        thumb_base = Image.new('RGBA', thumb_size, bg_color)
+        target_size = (thumb_size[0] - 2, thumb_size[1] - 2)
+
+        arr = self._decode_thumbnail(path, target_size)
+        if arr is not None:
+            img = Image.fromarray(arr)
+        else:
+            # Formats OpenCV can't decode: fall back to PIL (Lanczos for quality).
+            # draft() lets libjpeg decode at 1/2..1/8 scale (no-op for other formats); 2x headroom keeps Lanczos sharp.
+            img = Image.open(path)
+            img.draft(None, (target_size[0] * 2, target_size[1] * 2))
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail(target_size, Image.Resampling.LANCZOS)
+
+        # Center on the thumbnail canvas
+        offset_x = (thumb_size[0] - img.width) // 2
+        offset_y = (thumb_size[1] - img.height) // 2
+        thumb_base.paste(img, (offset_x, offset_y))
+        return thumb_base
+
+    def _add_gallery_items(self, items):
+        """MAIN THREAD: Converts PIL thumbnails to ImageTk and updates the gallery UI."""
+        for item in items:
             # Convert PIL image to ImageTk (Must be done on Main Thread)
             tk_thumb = ImageTk.PhotoImage(item['pil_thumb'])
 
@@ -3895,14 +5043,6 @@ class BackgroundRemoverGUI:
             })
 
         self.redraw_gallery()
-        self.status_label.config(text=f"Added {len(results)} images to gallery.")
-        self.hide_loading()
-
-    def _on_import_error(self, error):
-        """Handles errors from the import thread."""
-        self.hide_loading()
-        messagebox.showerror("Import Error", str(error))
-        print(f"Thread Error during import: {error}")
 
     def redraw_gallery(self):
         """Re-renders the horizontal gallery strip on the canvas."""